@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 
 import argparse
-from db_utils import ensure_event_log_table, get_connection
+from db_utils import (
+    copy_database_to_memory,
+    ensure_dirty_country_tracking,
+    ensure_event_log_table,
+    get_connection,
+    get_dirty_countries,
+)
 from economy_tick import FOOD_RESOURCE_NAMES, ensure_country_resource_rows
 from import_data import refresh_all_country_economies, refresh_country_economy, validate_schema
 
@@ -518,16 +524,24 @@ def refresh_country_command(cursor, args):
     refresh_country_and_log(cursor, args.country_code, "refresh_country", notes="Manual refresh")
 
 
-def refresh_all_command(cursor, _args):
+def refresh_all_command(cursor, args):
+    if args.dirty_only:
+        country_codes = get_dirty_countries(cursor)
+        notes = "Manual refresh_all (dirty countries only)"
+    else:
+        country_codes = [code for code, in cursor.execute("SELECT code FROM countries ORDER BY code").fetchall()]
+        notes = "Manual refresh_all"
     before_rows = {
         row["country_code"]: row
         for row in (
             fetch_row_dict(cursor, "SELECT * FROM country_economy WHERE country_code = ?", (country_code,))
-            for country_code in [code for code, in cursor.execute("SELECT code FROM countries ORDER BY code").fetchall()]
+            for country_code in country_codes
         )
         if row
     }
-    refresh_all_country_economies(cursor, seed_resource_stockpiles=False, verbose=False)
+    refresh_all_country_economies(cursor, seed_resource_stockpiles=False, verbose=False, dirty_only=args.dirty_only)
+    if args.dirty_only:
+        print(f"Refreshed {len(before_rows)} dirty countries.")
     for country_code, before in before_rows.items():
         after = fetch_row_dict(cursor, "SELECT * FROM country_economy WHERE country_code = ?", (country_code,))
         if not after:
@@ -546,11 +560,34 @@ def refresh_all_command(cursor, _args):
                     key,
                     old_value,
                     new_value,
-                    "Manual refresh_all",
+                    notes,
                 )
                 changes += 1
         if changes == 0:
-            log_summary(cursor, "refresh_all", "country_economy", country_code, "Manual refresh_all produced no row changes")
+            log_summary(cursor, "refresh_all", "country_economy", country_code, f"{notes} produced no row changes")
+
+
+def refreshed_economy_rows(dirty_only):
+    """country_economy after a refresh-all on an in-memory copy of the world."""
+    conn = copy_database_to_memory()
+    try:
+        cursor = conn.cursor()
+        refresh_all_country_economies(cursor, seed_resource_stockpiles=False, verbose=False, dirty_only=dirty_only)
+        cursor.execute("SELECT * FROM country_economy ORDER BY country_code")
+        return cursor.fetchall()
+    finally:
+        conn.close()
+
+
+def check_dirty_refresh_command(cursor, args):
+    dirty_rows = refreshed_economy_rows(dirty_only=True)
+    full_rows = refreshed_economy_rows(dirty_only=False)
+    mismatched = [full[0] for dirty, full in zip(dirty_rows, full_rows) if dirty != full]
+    if mismatched:
+        raise ValueError(
+            f"Dirty-only refresh differs from a full refresh for {len(mismatched)} countries: {', '.join(mismatched)}"
+        )
+    print(f"Dirty-only refresh matches a full refresh for all {len(full_rows)} countries.")
 
 
 def build_parser():
@@ -624,7 +661,17 @@ def build_parser():
     refresh_country_parser = subparsers.add_parser("refresh-country", help="Refresh derived economy data for one country.")
     refresh_country_parser.add_argument("country_code")
 
-    subparsers.add_parser("refresh-all", help="Refresh derived economy data for all countries.")
+    refresh_all_parser = subparsers.add_parser("refresh-all", help="Refresh derived economy data for all countries.")
+    refresh_all_parser.add_argument(
+        "--dirty-only",
+        action="store_true",
+        help="Only refresh countries changed since their last refresh (see dirty_countries).",
+    )
+
+    subparsers.add_parser(
+        "check-dirty-refresh",
+        help="Check on in-memory copies that refresh-all --dirty-only gives the same result as refresh-all.",
+    )
 
     return parser
 
@@ -639,6 +686,7 @@ def main():
 
     try:
         ensure_event_log_table(cursor)
+        ensure_dirty_country_tracking(cursor)
         validate_schema(cursor)
         ensure_country_resource_rows(cursor)
 
@@ -674,6 +722,8 @@ def main():
             refresh_country_command(cursor, args)
         elif args.command == "refresh-all":
             refresh_all_command(cursor, args)
+        elif args.command == "check-dirty-refresh":
+            check_dirty_refresh_command(cursor, args)
         else:
             raise ValueError(f"Unsupported command '{args.command}'")
 
@@ -4,8 +4,10 @@ import io
 import subprocess
 import sys
 
-from db_utils import get_connection
-from economy_tick import economy_tick
+from db_utils import DB_FILE, get_connection
+from import_data import resolve_data_dir
+from scenario_cache import restore_template, save_template
+from world_tick import world_fast_forward
 
 
 def run_command(cmd):
@@ -29,7 +31,12 @@ def wipe_database():
     conn.close()
 
 
-def reset_world(scenario_subfolder=None):
+def reset_world(scenario_subfolder=None, use_cache=True):
+    data_dir = resolve_data_dir(scenario_subfolder)
+    if use_cache and restore_template(data_dir, DB_FILE):
+        print(f"Resetting world state from the cached template of {data_dir}...")
+        return
+
     print("Resetting world state from CSV data...")
     wipe_database()
     run_command(["python3", "setup_db.py"])
@@ -37,6 +44,7 @@ def reset_world(scenario_subfolder=None):
     if scenario_subfolder:
         import_cmd.append(scenario_subfolder)
     run_command(import_cmd)
+    print(f"Cached world template in {save_template(data_dir, DB_FILE)}")
 
 
 def load_snapshot():
@@ -165,27 +173,27 @@ def print_summary(stats, ticks):
     print(f"- Countries with avg unrest increase > 1.5/tick: {', '.join(unrest_spike) if unrest_spike else 'none'}")
 
 
-def run_report(ticks, fresh, verbose_ticks, scenario_subfolder):
+def run_report(ticks, fresh, verbose_ticks, scenario_subfolder, use_cache=True):
     if fresh:
-        reset_world(scenario_subfolder)
+        reset_world(scenario_subfolder, use_cache)
 
     before = load_snapshot()
     if not before:
         raise RuntimeError("No countries found in database.")
 
+    print(f"Running {ticks} ticks in memory...")
+    if verbose_ticks:
+        history = world_fast_forward(ticks, verbose=True, history=True)
+    else:
+        with contextlib.redirect_stdout(io.StringIO()):
+            history = world_fast_forward(ticks, history=True)
+
     stats = {}
-    for tick_index in range(1, ticks + 1):
-        print(f"Running tick {tick_index}/{ticks}...")
-        if verbose_ticks:
-            economy_tick()
-        else:
-            with contextlib.redirect_stdout(io.StringIO()):
-                economy_tick()
-        after = load_snapshot()
+    for after in history:
         apply_tick_deltas(stats, before, after)
         before = after
 
-    print_summary(stats, ticks)
+    print_summary(stats, len(history))
 
 
 def parse_args():
@@ -201,6 +209,12 @@ def parse_args():
         default=True,
         help="Reset DB from CSV files before running (default: --fresh)",
     )
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Reset from a cached template of the scenario when its CSVs and config are unchanged (default: --cache)",
+    )
     parser.add_argument(
         "--verbose-ticks",
         action="store_true",
@@ -216,7 +230,7 @@ def main():
         sys.exit(1)
 
     try:
-        run_report(args.ticks, args.fresh, args.verbose_ticks, args.scenario)
+        run_report(args.ticks, args.fresh, args.verbose_ticks, args.scenario, args.cache)
     except Exception as exc:
         print(f"❌ Balance report failed: {exc}")
         sys.exit(1)
@@ -0,0 +1,153 @@
+import argparse
+import contextlib
+import io
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+import db_utils
+from db_utils import PLAYER_MOVES_INDEXES, ensure_player_moves_indexes
+
+
+def generate_moves(cursor, count, turn, processed, rng):
+    """Random build/recruit moves for existing countries, provinces and types."""
+    cursor.execute("SELECT id, owner_country_code FROM provinces WHERE owner_country_code IS NOT NULL")
+    provinces = cursor.fetchall()
+    cursor.execute("SELECT id FROM building_types")
+    building_ids = [row[0] for row in cursor.fetchall()]
+    cursor.execute("SELECT id FROM unit_types")
+    unit_ids = [row[0] for row in cursor.fetchall()]
+
+    rows = []
+    for _ in range(count):
+        province_id, country = rng.choice(provinces)
+        if rng.random() < 0.5:
+            rows.append((turn, country, "build", province_id, rng.choice(building_ids), None, 1, processed))
+        else:
+            rows.append((turn, country, "recruit", None, None, rng.choice(unit_ids), 1, processed))
+    cursor.executemany("""
+        INSERT INTO player_moves (
+            turn, country_code, move_type, target_province_id,
+            target_building_type_id, target_unit_type_id, amount, processed
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+
+
+def build_world(source, path, history, turn_moves, seed):
+    """Copy source and add `history` processed moves plus one pending turn."""
+    shutil.copyfile(source, path)
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM player_moves")
+    rng = random.Random(seed)
+    turns = max(1, history // max(1, turn_moves))
+    for turn in range(1, turns + 1):
+        generate_moves(cursor, history // turns, turn, 1, rng)
+    generate_moves(cursor, turn_moves, turns + 1, 0, rng)
+    conn.commit()
+    conn.close()
+    return turns + 1
+
+
+def time_queries(path, turn, repeat):
+    """Best-of-`repeat` time of the pending-queue and turn-count queries."""
+    conn = sqlite3.connect(path)
+    timings = []
+    for sql, params in (
+        ("SELECT id FROM player_moves WHERE processed = 0 ORDER BY turn, id", ()),
+        ("SELECT COUNT(*) FROM player_moves WHERE turn = ?", (turn,)),
+    ):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            conn.execute(sql, params).fetchall()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings.append(best)
+    conn.close()
+    return timings
+
+
+def drop_indexes(path):
+    conn = sqlite3.connect(path)
+    for name in PLAYER_MOVES_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+    conn.commit()
+    conn.close()
+
+
+def create_indexes(path):
+    conn = sqlite3.connect(path)
+    ensure_player_moves_indexes(conn.cursor())
+    conn.commit()
+    conn.close()
+
+
+def time_process_moves(path):
+    """Run process_moves on path with its output discarded."""
+    import process_moves
+
+    db_utils.DB_FILE = path
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        process_moves.process_moves()
+    return time.perf_counter() - start
+
+
+def run_benchmark(history_sizes, turn_moves, repeat, seed):
+    print(f"One turn of {turn_moves} moves on top of N processed moves from earlier turns\n")
+    print(f"{'history':>10} | {'queue scan':>21} | {'turn count':>21} | {'process_moves':>13}")
+    print(f"{'':>10} | {'no index':>10} {'indexed':>10} | {'no index':>10} {'indexed':>10} | {'indexed':>13}")
+    source = db_utils.DB_FILE
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "world.db")
+        for history in history_sizes:
+            turn = build_world(source, path, history, turn_moves, seed)
+            drop_indexes(path)
+            scan_plain, count_plain = time_queries(path, turn, repeat)
+            create_indexes(path)
+            scan_indexed, count_indexed = time_queries(path, turn, repeat)
+            elapsed = time_process_moves(path)
+            print(
+                f"{history:>10,} | {scan_plain * 1000:>8.2f}ms {scan_indexed * 1000:>8.2f}ms | "
+                f"{count_plain * 1000:>8.2f}ms {count_indexed * 1000:>8.2f}ms | {elapsed:>11.2f}s"
+            )
+    db_utils.DB_FILE = source
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Measure how processing one turn scales with the size of player_moves."
+    )
+    parser.add_argument(
+        "--history",
+        default="0,10000,100000,500000",
+        help="Comma separated counts of processed moves from earlier turns (default: 0,10000,100000,500000)",
+    )
+    parser.add_argument("--turn-moves", type=int, default=2000, help="Pending moves in the turn (default: 2000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Query repetitions, best time is shown (default: 5)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for generated moves (default: 1)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    try:
+        history_sizes = [int(value) for value in args.history.split(",") if value.strip()]
+    except ValueError:
+        print(f"❌ Invalid --history value: {args.history}")
+        sys.exit(1)
+    if not os.path.exists(db_utils.DB_FILE):
+        print(f"❌ {db_utils.DB_FILE} not found. Run setup_db.py and import_data.py first.")
+        sys.exit(1)
+
+    run_benchmark(history_sizes, args.turn_moves, args.repeat, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,5 +22,217 @@ def get_connection():
     return conn
 
 
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+)
+
+
+def apply_bulk_load_pragmas(conn):
+    """Tune a connection for large CSV loads.
+
+    The settings last until the connection is closed. synchronous = OFF skips
+    the fsyncs, so only use it for imports that can be rerun from their CSVs:
+    an empty world, never a campaign that has already been played.
+    """
+    for pragma in BULK_LOAD_PRAGMAS:
+        conn.execute(pragma)
+
+
+def is_empty_world(cursor):
+    """True when no countries have been imported yet (or the tables do not exist)."""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'countries'")
+    if cursor.fetchone() is None:
+        return True
+    cursor.execute("SELECT 1 FROM countries LIMIT 1")
+    return cursor.fetchone() is None
+
+
+def copy_database_to_memory(db_file=None):
+    """Copy the world database into an in-memory connection with the SQLite backup API.
+
+    The source is opened read-only, so nothing on disk is created or changed.
+    """
+    source = sqlite3.connect(f"file:{db_file or DB_FILE}?mode=ro", uri=True)
+    conn = sqlite3.connect(":memory:")
+    try:
+        source.backup(conn)
+    finally:
+        source.close()
+    conn.execute("PRAGMA foreign_keys = ON;")
+    return conn
+
+
 def ensure_event_log_table(cursor):
     cursor.execute(EVENT_LOG_TABLE_SQL)
+
+
+IMPORT_SOURCES_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS import_sources (
+    file_name TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    imported_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+
+def ensure_import_sources_table(cursor):
+    cursor.execute(IMPORT_SOURCES_TABLE_SQL)
+
+
+def get_import_hashes(cursor):
+    cursor.execute("SELECT file_name, content_hash FROM import_sources")
+    return dict(cursor.fetchall())
+
+
+def record_import_hash(cursor, file_name, content_hash):
+    cursor.execute("""
+        INSERT INTO import_sources (file_name, content_hash)
+        VALUES (?, ?)
+        ON CONFLICT(file_name) DO UPDATE SET
+            content_hash = excluded.content_hash,
+            imported_at = CURRENT_TIMESTAMP
+    """, (file_name, content_hash))
+
+
+# Access paths on player_moves: the unprocessed queue scanned by process_moves
+# in (turn, id) order, per-turn lookups from import_moves and per-country history.
+PLAYER_MOVES_INDEXES = {
+    "idx_player_moves_pending": "ON player_moves (turn, id) WHERE processed = 0",
+    "idx_player_moves_turn": "ON player_moves (turn)",
+    "idx_player_moves_country_turn": "ON player_moves (country_code, turn)",
+}
+
+
+def ensure_player_moves_indexes(cursor):
+    """Create the player_moves indexes; also migrates worlds built before they existed."""
+    for name, definition in PLAYER_MOVES_INDEXES.items():
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} {definition}")
+
+
+def integer_affinity(value):
+    """Return value as an INTEGER column would store it."""
+    if isinstance(value, float) and value.is_integer() and -2**63 <= value < 2**63:
+        return int(value)
+    return value
+
+
+def real_affinity(value):
+    """Return value as a REAL column would store it."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+DIRTY_COUNTRIES_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS dirty_countries (
+    country_code TEXT PRIMARY KEY,
+    reason TEXT NOT NULL,
+    marked_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+# Tables whose rows belong to one country: (table, country expression for NEW/OLD rows).
+COUNTRY_SCOPED_TRIGGERS = {
+    "provinces": "{row}.owner_country_code",
+    "province_buildings": "(SELECT owner_country_code FROM provinces WHERE id = {row}.province_id)",
+    "country_modifiers": "{row}.country_code",
+    "country_units": "{row}.country_code",
+}
+
+# Columns of per-country tables that feed refresh_country_economy.
+COUNTRY_COLUMN_TRIGGERS = {
+    "countries": ("code", "stability, unrest, corruption, at_war, war_exhaustion, culture, religion"),
+    "country_economy": ("country_code", "tax_rate"),
+    "country_resources": ("country_code", "stockpile"),
+}
+
+# Reference tables that change the derived stats of every country. Resources
+# count too: production and food snapshots look resources up by name.
+GLOBAL_TRIGGER_TABLES = ["modifiers", "building_effects", "building_types", "unit_types", "cultures", "resources"]
+
+
+# Trigger bodies skip countries that are already marked instead of relying on
+# OR IGNORE: an outer UPSERT (INSERT ... ON CONFLICT DO UPDATE) overrides the
+# conflict clause of statements run by its triggers.
+def mark_dirty_sql(country_expr, reason):
+    return (
+        f"INSERT INTO dirty_countries (country_code, reason) "
+        f"SELECT {country_expr}, '{reason}' WHERE {country_expr} IS NOT NULL "
+        f"AND NOT EXISTS (SELECT 1 FROM dirty_countries WHERE country_code = {country_expr});"
+    )
+
+
+def dirty_country_trigger_sql():
+    """Return (trigger name, CREATE TRIGGER statement) pairs."""
+    triggers = []
+    for table, country_expr in COUNTRY_SCOPED_TRIGGERS.items():
+        for event, rows in (("INSERT", ["NEW"]), ("UPDATE", ["OLD", "NEW"]), ("DELETE", ["OLD"])):
+            name = f"mark_dirty_{table}_{event.lower()}"
+            body = " ".join(mark_dirty_sql(country_expr.format(row=row), table) for row in rows)
+            triggers.append((name, f"CREATE TRIGGER {name} AFTER {event} ON {table} BEGIN {body} END;"))
+    for table, (code_column, columns) in COUNTRY_COLUMN_TRIGGERS.items():
+        name = f"mark_dirty_{table}_insert"
+        triggers.append((
+            name,
+            f"CREATE TRIGGER {name} AFTER INSERT ON {table} "
+            f"BEGIN {mark_dirty_sql(f'NEW.{code_column}', table)} END;",
+        ))
+        name = f"mark_dirty_{table}_update"
+        triggers.append((
+            name,
+            f"CREATE TRIGGER {name} AFTER UPDATE OF {columns} ON {table} "
+            f"BEGIN {mark_dirty_sql(f'NEW.{code_column}', table)} END;",
+        ))
+    for table in GLOBAL_TRIGGER_TABLES:
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            name = f"mark_dirty_{table}_{event.lower()}"
+            triggers.append((
+                name,
+                f"CREATE TRIGGER {name} AFTER {event} ON {table} BEGIN "
+                f"INSERT INTO dirty_countries (country_code, reason) SELECT code, '{table}' FROM countries "
+                f"WHERE code NOT IN (SELECT country_code FROM dirty_countries); "
+                f"END;",
+            ))
+    return triggers
+
+
+def ensure_dirty_country_tracking(cursor):
+    """Create the dirty_countries table and its triggers.
+
+    When tracking is installed on an existing world every country starts
+    dirty, because nothing is known about changes made before.
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'dirty_countries'")
+    installed = cursor.fetchone() is not None
+    cursor.execute(DIRTY_COUNTRIES_TABLE_SQL)
+    # Triggers are recreated every time so worlds built by older versions
+    # pick up the current definitions.
+    for name, statement in dirty_country_trigger_sql():
+        cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        cursor.execute(statement)
+    if not installed:
+        cursor.execute("""
+            INSERT OR IGNORE INTO dirty_countries (country_code, reason)
+            SELECT code, 'tracking_installed' FROM countries
+        """)
+
+
+def mark_countries_dirty(cursor, country_codes, reason):
+    cursor.executemany(
+        "INSERT OR IGNORE INTO dirty_countries (country_code, reason) VALUES (?, ?)",
+        [(country_code, reason) for country_code in country_codes if country_code],
+    )
+
+
+def get_dirty_countries(cursor):
+    cursor.execute("SELECT country_code FROM dirty_countries ORDER BY country_code")
+    return [row[0] for row in cursor.fetchall()]
+
+
+def clear_dirty_countries(cursor, country_codes):
+    cursor.executemany(
+        "DELETE FROM dirty_countries WHERE country_code = ?",
+        [(country_code,) for country_code in country_codes],
+    )
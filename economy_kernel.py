@@ -0,0 +1,247 @@
+"""
+Array-backed economy kernel.
+
+Evaluates the per-country tick formulas (political modifiers, population
+growth, tax income, upkeep, economic growth and bounds clamping) for the
+whole world at once with NumPy. Every operation mirrors the scalar code in
+economy_tick.py step by step, so results are identical to the Python path.
+
+NumPy is optional: HAS_NUMPY is False when it is not installed.
+"""
+
+from settings import get_settings
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+
+FLOAT_COLUMNS = [
+    "stability",
+    "unrest",
+    "corruption",
+    "war_exhaustion",
+    "tax_rate",
+    "base_tax",
+    "food_shortage_ratio",
+    "tax_eff_mult",
+    "admin_mod_mult",
+    "upkeep_mult",
+    "navy_upkeep_mult",
+    "building_income_mult",
+    "growth_modifier_bonus",
+    "stability_growth",
+    "unrest_reduction",
+]
+
+INT_COLUMNS = [
+    "at_war",
+    "treasury",
+    "population",
+    "province_count",
+    "land_upkeep",
+    "navy_upkeep",
+    "building_income_raw",
+    "building_upkeep",
+]
+
+
+def require_numpy():
+    if not HAS_NUMPY:
+        raise RuntimeError("NumPy is not installed; the array kernel is unavailable")
+
+
+def load_kernel_parameters():
+    """Collect every setting the kernel needs into a flat dict."""
+    settings = get_settings()
+    politics = settings.politics
+    population = settings.population
+    return {
+        "tax_eff_min": settings.bounds.tax_efficiency_min,
+        "unrest_admin_multiplier": politics.unrest_admin_multiplier,
+        "unrest_tax_penalty": politics.unrest_tax_penalty,
+        "unrest_stability_drain": politics.unrest_stability_drain,
+        "unrest_high_threshold": politics.unrest_high_threshold,
+        "unrest_population_loss_factor": politics.unrest_population_loss_factor,
+        "corruption_war_increase": politics.corruption_war_increase,
+        "war_military_upkeep_multiplier": politics.war_military_upkeep_multiplier,
+        "war_admin_cost_multiplier": politics.war_admin_cost_multiplier,
+        "war_exhaustion_per_turn": politics.war_exhaustion_per_turn,
+        "base_growth_rate": population.base_growth_rate,
+        "stability_growth_factor": population.stability_growth_factor,
+        "unrest_growth_factor": population.unrest_growth_factor,
+        "corruption_growth_factor": population.corruption_growth_factor,
+        "food_shortage_tax_penalty_max": settings.food.food_shortage_tax_penalty_max,
+        "food_shortage_unrest_increase_max": settings.food.food_shortage_unrest_increase_max,
+        "admin_cost_per_province": settings.economy.admin_cost_per_province,
+        "base_economic_growth": politics.base_economic_growth,
+        "economic_growth_stability_factor": politics.economic_growth_stability_factor,
+        "economic_growth_unrest_factor": politics.economic_growth_unrest_factor,
+        "economic_growth_corruption_factor": politics.economic_growth_corruption_factor,
+        "growth_war_factor": politics.growth_war_factor,
+        "growth_building_factor": politics.growth_building_factor,
+    }
+
+
+def build_columns(rows):
+    """Turn a list of per-country dicts into a dict of NumPy columns."""
+    require_numpy()
+    columns = {}
+    for name in FLOAT_COLUMNS:
+        columns[name] = np.array([row[name] for row in rows], dtype=np.float64)
+    for name in INT_COLUMNS:
+        values = [row[name] for row in rows]
+        # Integer columns fall back to floats if the database handed back any REAL value.
+        dtype = np.int64 if all(isinstance(value, int) for value in values) else np.float64
+        columns[name] = np.array(values, dtype=dtype)
+    return columns
+
+
+def py_max(a, b):
+    """Element-wise max(a, b) with Python's tie-breaking (keeps a unless b > a)."""
+    return np.where(b > a, b, a)
+
+
+def py_min(a, b):
+    """Element-wise min(a, b) with Python's tie-breaking (keeps a unless b < a)."""
+    return np.where(b < a, b, a)
+
+
+def to_int(values):
+    """Truncate toward zero like int()."""
+    return np.trunc(values).astype(np.int64)
+
+
+def calculate_economy_kernel(columns, params, bounds):
+    """Evaluate one economy tick for every country column at once."""
+    require_numpy()
+    stability = columns["stability"]
+    unrest = columns["unrest"]
+    corruption = columns["corruption"]
+    war_exhaustion = columns["war_exhaustion"]
+    at_war = columns["at_war"] != 0
+    exhausted = at_war | (war_exhaustion > 0)
+
+    # calculate_political_modifiers
+    tax_efficiency_mod = 1.0 + (stability - 50) * 0.002
+    unrest_change = (50 - stability) * 0.1
+    admin_cost_mod = 1.0 + unrest * params["unrest_admin_multiplier"]
+    tax_efficiency_mod = tax_efficiency_mod - unrest * params["unrest_tax_penalty"]
+    tax_efficiency_mod = py_max(params["tax_eff_min"], tax_efficiency_mod)
+    stability_change = 0.0 - unrest * params["unrest_stability_drain"]
+
+    threshold = params["unrest_high_threshold"]
+    pop_loss = np.where(
+        unrest > threshold,
+        to_int((unrest - threshold) * params["unrest_population_loss_factor"]),
+        0,
+    )
+    population_change = 0 - pop_loss
+
+    corruption_change = -corruption * 0.01
+    corruption_change = np.where(at_war, corruption_change + params["corruption_war_increase"], corruption_change)
+
+    military_upkeep_mod = np.where(
+        at_war,
+        (1.0 * params["war_military_upkeep_multiplier"]) * (1 + war_exhaustion * 0.003),
+        1.0,
+    )
+    admin_cost_mod = np.where(at_war, admin_cost_mod + params["war_admin_cost_multiplier"], admin_cost_mod)
+    war_exhaustion_change = np.where(at_war, 0.0 + params["war_exhaustion_per_turn"], 0.0)
+    tax_efficiency_mod = np.where(exhausted, tax_efficiency_mod - war_exhaustion * 0.001, tax_efficiency_mod)
+    unrest_change = np.where(exhausted, unrest_change + war_exhaustion * 0.1, unrest_change)
+    stability_change = np.where(exhausted, stability_change - war_exhaustion * 0.05, stability_change)
+    tax_efficiency_mod = py_max(params["tax_eff_min"], tax_efficiency_mod)
+
+    # calculate_population_growth
+    pop_growth_rate = (
+        params["base_growth_rate"]
+        + (stability - 50) * params["stability_growth_factor"]
+        + -unrest * params["unrest_growth_factor"]
+        + -corruption * params["corruption_growth_factor"]
+    )
+    pop_growth_rate = py_max(0.0, pop_growth_rate)
+    population_change = population_change + to_int(columns["population"] * pop_growth_rate)
+
+    # food shortage
+    food_shortage_ratio = columns["food_shortage_ratio"]
+    food_tax_multiplier = py_max(0.0, 1.0 - (food_shortage_ratio * params["food_shortage_tax_penalty_max"]))
+    food_unrest_increase = food_shortage_ratio * params["food_shortage_unrest_increase_max"]
+    unrest_change = unrest_change + food_unrest_increase
+
+    # income and expenses
+    tax_eff = columns["tax_eff_mult"] * tax_efficiency_mod
+    admin_mod = columns["admin_mod_mult"] * admin_cost_mod
+    upkeep_mod = columns["upkeep_mult"] * military_upkeep_mod
+    navy_upkeep_mod = columns["navy_upkeep_mult"] * military_upkeep_mod
+
+    tax_income = columns["base_tax"] * columns["tax_rate"] * tax_eff
+    tax_income_after_corruption = tax_income * (1 - corruption * 0.5)
+    tax_income_after_corruption = tax_income_after_corruption * food_tax_multiplier
+
+    administration_cost = columns["province_count"] * params["admin_cost_per_province"] * admin_mod
+    land_military_upkeep = columns["land_upkeep"] * upkeep_mod
+    navy_military_upkeep = columns["navy_upkeep"] * navy_upkeep_mod
+    military_upkeep = land_military_upkeep + navy_military_upkeep
+
+    building_income_raw = columns["building_income_raw"]
+    building_income = building_income_raw * columns["building_income_mult"]
+
+    # economic growth
+    total_growth_rate = (
+        params["base_economic_growth"]
+        + (stability - 50) * params["economic_growth_stability_factor"]
+        + -unrest * params["economic_growth_unrest_factor"]
+        + -corruption * params["economic_growth_corruption_factor"]
+        + np.where(at_war, params["growth_war_factor"], 0.0)
+        + building_income_raw * params["growth_building_factor"]
+        + columns["growth_modifier_bonus"]
+    )
+    stability_change = stability_change + columns["stability_growth"]
+    unrest_change = unrest_change - columns["unrest_reduction"]
+    total_growth_rate = py_max(0.0, total_growth_rate)
+
+    productive_income_base = py_max(0.0, tax_income_after_corruption + building_income)
+    growth_amount = to_int(productive_income_base * total_growth_rate)
+
+    total_income = to_int(tax_income_after_corruption + building_income + growth_amount)
+    total_expenses = to_int(administration_cost + military_upkeep + columns["building_upkeep"])
+    new_treasury = columns["treasury"] + total_income - total_expenses
+
+    # bounds clamping
+    stability_min, stability_max = bounds["stability_bounds"]
+    unrest_min, unrest_max = bounds["unrest_bounds"]
+    corr_min, corr_max = bounds["corruption_bounds"]
+    war_min, war_max = bounds["war_exhaustion_bounds"]
+
+    return {
+        "tax_efficiency_mod": tax_efficiency_mod,
+        "admin_cost_mod": admin_cost_mod,
+        "military_upkeep_mod": military_upkeep_mod,
+        "unrest_change": unrest_change,
+        "stability_change": stability_change,
+        "corruption_change": corruption_change,
+        "war_exhaustion_change": war_exhaustion_change,
+        "population_change": population_change,
+        "food_tax_multiplier": food_tax_multiplier,
+        "food_unrest_increase": food_unrest_increase,
+        "tax_eff": tax_eff,
+        "tax_income": tax_income,
+        "tax_income_after_corruption": tax_income_after_corruption,
+        "administration_cost": administration_cost,
+        "land_military_upkeep": land_military_upkeep,
+        "navy_military_upkeep": navy_military_upkeep,
+        "military_upkeep": military_upkeep,
+        "building_income": building_income,
+        "total_growth_rate": total_growth_rate,
+        "growth_amount": growth_amount,
+        "total_income": total_income,
+        "total_expenses": total_expenses,
+        "new_treasury": new_treasury,
+        "new_stability": py_max(stability_min, py_min(stability_max, stability + stability_change)),
+        "new_unrest": py_max(unrest_min, py_min(unrest_max, unrest + unrest_change)),
+        "new_corruption": py_max(corr_min, py_min(corr_max, corruption + corruption_change)),
+        "new_war_exhaustion": py_max(war_min, py_min(war_max, war_exhaustion + war_exhaustion_change)),
+    }
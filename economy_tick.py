@@ -1,23 +1,26 @@
 from db_utils import get_connection
-import configparser
+import argparse
 import math
+from itertools import groupby
+from operator import itemgetter
+from modifier_index import ModifierIndex, country_filter, where_clause
+from settings import get_settings
 
-config = configparser.ConfigParser()
-config.read("config.ini")
+settings = get_settings()
 
-BASE_TAX_PER_POP = float(config["economy"]["base_tax_per_pop"])
-ADMIN_COST_PER_PROVINCE = float(config["economy"]["admin_cost_per_province"])
+BASE_TAX_PER_POP = settings.economy.base_tax_per_pop
+ADMIN_COST_PER_PROVINCE = settings.economy.admin_cost_per_province
 
-POPULATION_PER_RESOURCE_UNIT = int(config["resources"].get("population_per_resource_unit", 10000))
-RESOURCE_CAP_PER_PROVINCE = int(config["resources"]["resource_cap_per_province"])
+POPULATION_PER_RESOURCE_UNIT = settings.resources.population_per_resource_unit
+RESOURCE_CAP_PER_PROVINCE = settings.resources.resource_cap_per_province
 
-FOOD_PER_1000_POP = float(config["food"]["food_per_1000_pop"])
-FOOD_RESOURCE_NAMES = [name.strip() for name in config["food"]["food_resource_names"].split(",") if name.strip()]
-FOOD_SHORTAGE_TAX_PENALTY_MAX = float(config["food"]["food_shortage_tax_penalty_max"])
-FOOD_SHORTAGE_UNREST_INCREASE_MAX = float(config["food"]["food_shortage_unrest_increase_max"])
+FOOD_PER_1000_POP = settings.food.food_per_1000_pop
+FOOD_RESOURCE_NAMES = list(settings.food.food_resource_names)
+FOOD_SHORTAGE_TAX_PENALTY_MAX = settings.food.food_shortage_tax_penalty_max
+FOOD_SHORTAGE_UNREST_INCREASE_MAX = settings.food.food_shortage_unrest_increase_max
 
-POP_PER_UNIT = int(config["military"]["pop_per_unit"])
-BASE_UNIT_RATIO = float(config["military"]["base_unit_ratio"])
+POP_PER_UNIT = settings.military.pop_per_unit
+BASE_UNIT_RATIO = settings.military.base_unit_ratio
 
 
 
@@ -77,12 +80,14 @@ def calculate_political_modifiers(cursor, country_code):
     
     if not row:
         return None
-    
+
     stability, unrest, corruption, at_war, war_exhaustion = row
-    
-    
-    config = configparser.ConfigParser()
-    config.read("config.ini")
+    return calculate_political_modifiers_from_values(stability, unrest, corruption, at_war, war_exhaustion)
+
+
+def calculate_political_modifiers_from_values(stability, unrest, corruption, at_war, war_exhaustion):
+    """Calculate political modifiers from already loaded political values."""
+    politics = settings.politics
     
     
     tax_efficiency_mod = 1.0
@@ -95,33 +100,33 @@ def calculate_political_modifiers(cursor, country_code):
     population_change = 0
     
     
-    tax_eff_min = float(config["bounds"]["tax_efficiency_min"])
+    tax_eff_min = settings.bounds.tax_efficiency_min
     
     
     tax_efficiency_mod += (stability - 50) * 0.002
     unrest_change += (50 - stability) * 0.1
     
     
-    admin_cost_mod += unrest * float(config["politics"]["unrest_admin_multiplier"])
-    tax_efficiency_mod -= unrest * float(config["politics"]["unrest_tax_penalty"])
+    admin_cost_mod += unrest * politics.unrest_admin_multiplier
+    tax_efficiency_mod -= unrest * politics.unrest_tax_penalty
     tax_efficiency_mod = max(tax_eff_min, tax_efficiency_mod)  
-    stability_change -= unrest * float(config["politics"]["unrest_stability_drain"])
+    stability_change -= unrest * politics.unrest_stability_drain
     
-    unrest_high_threshold = float(config["politics"]["unrest_high_threshold"])
+    unrest_high_threshold = politics.unrest_high_threshold
     if unrest > unrest_high_threshold:
-        pop_loss = int((unrest - unrest_high_threshold) * float(config["politics"]["unrest_population_loss_factor"]))
+        pop_loss = int((unrest - unrest_high_threshold) * politics.unrest_population_loss_factor)
         population_change -= pop_loss
     
     
     corruption_change = -corruption * 0.01  
     if at_war:
-        corruption_change += float(config["politics"]["corruption_war_increase"])
+        corruption_change += politics.corruption_war_increase
     
     
     if at_war:
-        military_upkeep_mod *= float(config["politics"]["war_military_upkeep_multiplier"])
-        admin_cost_mod += float(config["politics"]["war_admin_cost_multiplier"])
-        war_exhaustion_change += float(config["politics"]["war_exhaustion_per_turn"])
+        military_upkeep_mod *= politics.war_military_upkeep_multiplier
+        admin_cost_mod += politics.war_admin_cost_multiplier
+        war_exhaustion_change += politics.war_exhaustion_per_turn
         tax_efficiency_mod -= war_exhaustion * 0.001
         unrest_change += war_exhaustion * 0.1
         stability_change -= war_exhaustion * 0.05
@@ -152,13 +157,12 @@ def calculate_political_modifiers(cursor, country_code):
 
 def calculate_population_growth(population, stability, unrest, corruption):
     """Calculate natural population growth based on stability, unrest, corruption."""
-    config = configparser.ConfigParser()
-    config.read("config.ini")
+    population_settings = settings.population
     
-    base_growth_rate = float(config["population"]["base_growth_rate"])
-    stability_factor = float(config["population"]["stability_growth_factor"])
-    unrest_factor = float(config["population"]["unrest_growth_factor"])
-    corruption_factor = float(config["population"]["corruption_growth_factor"])
+    base_growth_rate = population_settings.base_growth_rate
+    stability_factor = population_settings.stability_growth_factor
+    unrest_factor = population_settings.unrest_growth_factor
+    corruption_factor = population_settings.corruption_growth_factor
 
     stability_bonus = (stability - 50) * stability_factor
     unrest_penalty = -unrest * unrest_factor
@@ -170,34 +174,61 @@ def calculate_population_growth(population, stability, unrest, corruption):
     growth_amount = int(population * total_growth_rate)
     return growth_amount, total_growth_rate
 
-def update_province_populations(cursor, country_code, net_pop_change):
-    """Update population in all provinces of a country by distributing net change proportionally."""
-    if net_pop_change == 0:
-        return
-    
-    cursor.execute("SELECT id, population FROM provinces WHERE owner_country_code = ?", (country_code,))
-    provinces = cursor.fetchall()
-    if not provinces:
-        return
-    
-    total_current_pop = sum(p[1] for p in provinces)
+def distribute_population_change(populations, net_pop_change):
+    """Return new province populations after spreading net_pop_change proportionally.
+
+    The last province takes the rounding remainder.
+    """
+    if net_pop_change == 0 or not populations:
+        return list(populations)
+
+    total_current_pop = sum(populations)
     if total_current_pop == 0:
-        return
-    
-    
+        return list(populations)
+
+    new_populations = []
     remaining = net_pop_change
-    for i, (province_id, pop) in enumerate(provinces):
-        if i == len(provinces) - 1:
-            
+    for i, pop in enumerate(populations):
+        if i == len(populations) - 1:
             pop_change = remaining
         else:
             share = pop / total_current_pop
             pop_change = int(net_pop_change * share)
-        new_pop = max(0, pop + pop_change)
-        cursor.execute("UPDATE provinces SET population = ? WHERE id = ?", (new_pop, province_id))
+        new_populations.append(max(0, pop + pop_change))
         remaining -= pop_change
+    return new_populations
+
+
+def redistribute_province_populations(provinces, net_pop_change):
+    """Spread net_pop_change over [(province_id, population), ...].
+
+    Returns the new total population and the (population, province_id) rows
+    that changed, ready for executemany.
+    """
+    new_populations = distribute_population_change([pop for _, pop in provinces], net_pop_change)
+    updates = [
+        (new_pop, province_id)
+        for (province_id, pop), new_pop in zip(provinces, new_populations)
+        if new_pop != pop
+    ]
+    return sum(new_populations), updates
+
+
+def write_province_populations(cursor, updates):
+    cursor.executemany("UPDATE provinces SET population = ? WHERE id = ?", updates)
+
+
+def update_province_populations(cursor, country_code, net_pop_change):
+    """Update population in all provinces of a country by distributing net change proportionally."""
+    cursor.execute("SELECT id, population FROM provinces WHERE owner_country_code = ? ORDER BY id", (country_code,))
+    new_total, updates = redistribute_province_populations(cursor.fetchall(), net_pop_change)
+    write_province_populations(cursor, updates)
+    return new_total
+
+def get_country_modifier(cursor, country, key, modifier_index=None):
+    if modifier_index is not None:
+        return modifier_index.country_modifier(country, key)
 
-def get_country_modifier(cursor, country, key):
     cursor.execute("SELECT default_value FROM modifiers WHERE modifier_key = ?", (key,))
     base = cursor.fetchone()
     base_value = base[0] if base else 1.0
@@ -211,7 +242,10 @@ def get_country_modifier(cursor, country, key):
 
     return base_value * (1 + country_value)
 
-def get_building_country_modifier(cursor, country, key):
+def get_building_country_modifier(cursor, country, key, modifier_index=None):
+    if modifier_index is not None:
+        return modifier_index.building_country_modifier(country, key)
+
     cursor.execute("""
         SELECT COALESCE(SUM(be.value * pb.amount), 0)
         FROM province_buildings pb
@@ -225,7 +259,10 @@ def get_building_country_modifier(cursor, country, key):
     return 1 + (cursor.fetchone()[0] or 0.0)
 
 
-def get_building_effect_total(cursor, country, key):
+def get_building_effect_total(cursor, country, key, modifier_index=None):
+    if modifier_index is not None:
+        return modifier_index.building_total(country, key)
+
     cursor.execute("""
         SELECT COALESCE(SUM(be.value * pb.amount), 0)
         FROM province_buildings pb
@@ -239,7 +276,10 @@ def get_building_effect_total(cursor, country, key):
     return cursor.fetchone()[0] or 0.0
 
 
-def get_additive_modifier(cursor, country, key):
+def get_additive_modifier(cursor, country, key, modifier_index=None):
+    if modifier_index is not None:
+        return modifier_index.additive_modifier(country, key)
+
     cursor.execute("SELECT default_value FROM modifiers WHERE modifier_key = ?", (key,))
     base = cursor.fetchone()
     base_value = base[0] if base else 0.0
@@ -315,26 +355,28 @@ def get_coastal_province_count(cursor, country):
     """, (country,))
     return cursor.fetchone()[0] or 0
 
-def get_land_unit_cap(cursor, country):
-    population = get_population(cursor, country)
-    unit_limit_mod = get_country_modifier(cursor, country, "military_unit_limit_mult")
-    unit_limit_mod *= get_building_country_modifier(cursor, country, "military_unit_limit_mult")
+def get_land_unit_cap(cursor, country, modifier_index=None, population=None):
+    if population is None:
+        population = get_population(cursor, country)
+    unit_limit_mod = get_country_modifier(cursor, country, "military_unit_limit_mult", modifier_index)
+    unit_limit_mod *= get_building_country_modifier(cursor, country, "military_unit_limit_mult", modifier_index)
     base_cap = int((population * BASE_UNIT_RATIO * unit_limit_mod) / POP_PER_UNIT + 5)
-    bonus_cap = int(get_additive_modifier(cursor, country, "land_unit_cap_bonus"))
+    bonus_cap = int(get_additive_modifier(cursor, country, "land_unit_cap_bonus", modifier_index))
     return base_cap + bonus_cap
 
 
-def get_navy_unit_cap(cursor, country):
+def get_navy_unit_cap(cursor, country, modifier_index=None, coastal_count=None):
     """Calculate navy unit cap based on coastal provinces."""
-    coastal_count = get_coastal_province_count(cursor, country)
-    multiplier = int(config.get("military", "naval_cap_per_coastal_province", fallback=10))
-    bonus_cap = int(get_additive_modifier(cursor, country, "navy_unit_cap_bonus"))
+    if coastal_count is None:
+        coastal_count = get_coastal_province_count(cursor, country)
+    multiplier = settings.military.naval_cap_per_coastal_province
+    bonus_cap = int(get_additive_modifier(cursor, country, "navy_unit_cap_bonus", modifier_index))
     return (coastal_count * multiplier) + bonus_cap
 
-def validate_navy_cap(cursor, country):
+def validate_navy_cap(cursor, country, modifier_index=None):
     """Check if navy units exceed cap and return overage info."""
     current_navy = get_total_navy_units(cursor, country)
-    navy_cap = get_navy_unit_cap(cursor, country)
+    navy_cap = get_navy_unit_cap(cursor, country, modifier_index)
     overage = max(0, current_navy - navy_cap)
     
     return {
@@ -346,10 +388,10 @@ def validate_navy_cap(cursor, country):
     }
 
 
-def get_resource_cap(cursor, country):
+def get_resource_cap(cursor, country, modifier_index=None):
     provinces = get_province_count(cursor, country)
     base_cap = provinces * RESOURCE_CAP_PER_PROVINCE
-    bonus_cap = int(get_additive_modifier(cursor, country, "resource_cap_bonus"))
+    bonus_cap = int(get_additive_modifier(cursor, country, "resource_cap_bonus", modifier_index))
     return base_cap + bonus_cap
 
 def get_building_economy(cursor, country):
@@ -382,88 +424,145 @@ def get_province_output_modifier(province_culture, province_culture_group, provi
     return 0.25
 
 
+class OutputModifierLookup:
+    """Cached get_province_output_modifier results keyed by culture and religion.
+
+    Culture groups come from one read of the cultures table, and each distinct
+    (province culture, province religion, owner culture, owner religion)
+    combination is evaluated once per run.
+    """
+
+    def __init__(self, culture_groups):
+        self.culture_groups = culture_groups
+        self.cache = {}
+
+    @classmethod
+    def load(cls, cursor):
+        cursor.execute("SELECT culture, culture_group FROM cultures")
+        return cls({culture: culture_group for culture, culture_group in cursor.fetchall()})
+
+    def culture_group(self, culture):
+        # Same fallback as COALESCE(culture_group, culture).
+        culture_group = self.culture_groups.get(culture)
+        return culture if culture_group is None else culture_group
+
+    def modifier(self, province_culture, province_religion, owner_culture, owner_religion):
+        key = (province_culture, province_religion, owner_culture, owner_religion)
+        modifier = self.cache.get(key)
+        if modifier is None:
+            modifier = get_province_output_modifier(
+                province_culture,
+                self.culture_group(province_culture),
+                province_religion,
+                owner_culture,
+                self.culture_group(owner_culture),
+                owner_religion,
+            )
+            self.cache[key] = modifier
+        return modifier
+
+
+OWNED_PROVINCE_COLUMNS = """
+    p.id,
+    p.population,
+    p.resource_id,
+    p.culture,
+    p.religion,
+    c.culture,
+    c.religion
+"""
+
+OWNED_PROVINCE_JOINS = """
+    FROM provinces p
+    JOIN countries c ON p.owner_country_code = c.code
+"""
+
+
 def get_country_owned_provinces(cursor, country):
-    cursor.execute("""
-        SELECT
-            p.id,
-            p.population,
-            p.resource_id,
-            p.culture,
-            COALESCE(pc.culture_group, p.culture),
-            p.religion,
-            c.culture,
-            COALESCE(cc.culture_group, c.culture),
-            c.religion
-        FROM provinces p
-        JOIN countries c ON p.owner_country_code = c.code
-        LEFT JOIN cultures pc ON p.culture = pc.culture
-        LEFT JOIN cultures cc ON c.culture = cc.culture
-        WHERE p.owner_country_code = ?
-    """, (country,))
+    cursor.execute(
+        f"SELECT {OWNED_PROVINCE_COLUMNS} {OWNED_PROVINCE_JOINS} WHERE p.owner_country_code = ? ORDER BY p.id",
+        (country,),
+    )
     return cursor.fetchall()
 
 
-def get_country_tax_base(cursor, country):
-    total_tax_base = 0.0
-    for (
-        _province_id,
-        population,
-        _resource_id,
-        province_culture,
-        province_culture_group,
-        province_religion,
-        owner_culture,
-        owner_culture_group,
-        owner_religion,
-    ) in get_country_owned_provinces(cursor, country):
-        modifier = get_province_output_modifier(
-            province_culture,
-            province_culture_group,
-            province_religion,
-            owner_culture,
-            owner_culture_group,
-            owner_religion,
-        )
-        total_tax_base += population * BASE_TAX_PER_POP * modifier
-    return total_tax_base
+def get_province_resource_output(population, modifier):
+    """Resource units a province produces from its population."""
+    if population < POPULATION_PER_RESOURCE_UNIT:
+        return 1
+    base_units = population / POPULATION_PER_RESOURCE_UNIT
+    return max(1, math.ceil(base_units * modifier))
 
 
-def get_resource_production(cursor, country):
-    """Calculate population-scaled resource production for a country."""
-    production = {}
+def summarize_owned_provinces(rows, output_modifiers):
+    """Single pass over owned-province rows (see OWNED_PROVINCE_COLUMNS).
 
+    Returns population, province count, tax base, population-scaled resource
+    production and the (province_id, population) pairs, in row order.
+    """
+    population = 0
+    tax_base = 0.0
+    production = {}
+    provinces = []
     for (
-        _province_id,
-        population,
+        province_id,
+        province_population,
         resource_id,
         province_culture,
-        province_culture_group,
         province_religion,
         owner_culture,
-        owner_culture_group,
         owner_religion,
-    ) in get_country_owned_provinces(cursor, country):
-        if resource_id is None:
-            continue
+    ) in rows:
+        modifier = output_modifiers.modifier(province_culture, province_religion, owner_culture, owner_religion)
+        population += province_population
+        tax_base += province_population * BASE_TAX_PER_POP * modifier
+        provinces.append((province_id, province_population))
+        if resource_id is not None:
+            production[resource_id] = (
+                production.get(resource_id, 0) + get_province_resource_output(province_population, modifier)
+            )
 
-        modifier = get_province_output_modifier(
-            province_culture,
-            province_culture_group,
-            province_religion,
-            owner_culture,
-            owner_culture_group,
-            owner_religion,
-        )
+    return {
+        "population": population,
+        "province_count": len(provinces),
+        "tax_base": tax_base,
+        "production": production,
+        "provinces": provinces,
+    }
+
+
+def get_country_province_summary(cursor, country, output_modifiers=None):
+    if output_modifiers is None:
+        output_modifiers = OutputModifierLookup.load(cursor)
+    return summarize_owned_provinces(get_country_owned_provinces(cursor, country), output_modifiers)
+
+
+def load_province_summaries(cursor, country_codes=None, output_modifiers=None):
+    """Summarize the provinces of every country (or only country_codes) with one ordered query."""
+    if output_modifiers is None:
+        output_modifiers = OutputModifierLookup.load(cursor)
+    if country_codes is not None:
+        country_codes = list(country_codes)
+    conditions, params = country_filter("p.owner_country_code", country_codes)
+    cursor.execute(f"""
+        SELECT p.owner_country_code, {OWNED_PROVINCE_COLUMNS}
+        {OWNED_PROVINCE_JOINS}
+        {where_clause(conditions)}
+        ORDER BY p.owner_country_code, p.id
+    """, params)
+    summaries = {}
+    for country, rows in groupby(cursor, key=itemgetter(0)):
+        summaries[country] = summarize_owned_provinces((row[1:] for row in rows), output_modifiers)
+    return summaries
 
-        if population < POPULATION_PER_RESOURCE_UNIT:
-            produced_amount = 1
-        else:
-            base_units = population / POPULATION_PER_RESOURCE_UNIT
-            produced_amount = max(1, math.ceil(base_units * modifier))
 
-        production[resource_id] = production.get(resource_id, 0) + produced_amount
+def get_country_tax_base(cursor, country):
+    return get_country_province_summary(cursor, country)["tax_base"]
 
-    return production
+
+def get_resource_production(cursor, country):
+    """Calculate population-scaled resource production for a country."""
+    return get_country_province_summary(cursor, country)["production"]
 
 def ensure_country_resource_rows(cursor):
     """Ensure country_resources has one row per country/resource pair."""
@@ -588,6 +687,9 @@ def economy_tick():
     countries = [c[0] for c in cursor.fetchall()]
     resource_names = {rid: name for rid, name in cursor.execute("SELECT id, name FROM resources").fetchall()}
     food_resource_ids = get_resource_ids_by_name(cursor, FOOD_RESOURCE_NAMES)
+    modifier_index = ModifierIndex.load(cursor)
+    province_summaries = load_province_summaries(cursor)
+    population_updates = []
     
     print("\n=== ECONOMY TICK START ===")
     
@@ -605,8 +707,9 @@ def economy_tick():
         
         treasury, tax_rate = row
           
-        population = get_population(cursor, country)
-        provinces = get_province_count(cursor, country)
+        province_summary = province_summaries.get(country) or summarize_owned_provinces([], OutputModifierLookup({}))
+        population = province_summary["population"]
+        provinces = province_summary["province_count"]
         
         political_mods = calculate_political_modifiers(cursor, country)
         if not political_mods:
@@ -618,20 +721,20 @@ def economy_tick():
             political_mods['corruption']
         )
         political_mods['population_change'] += pop_growth
-        production = get_resource_production(cursor, country)
+        production = dict(province_summary["production"])
         
         additive_resource_effects = {
-            "livestock": get_building_effect_total(cursor, country, "prod_livestock"),
-            "grain": get_building_effect_total(cursor, country, "prod_grain"),
-            "slaves": get_building_effect_total(cursor, country, "prod_slaves"),
-            "base_metals": get_building_effect_total(cursor, country, "prod_base_metals"),
-            "iron": get_building_effect_total(cursor, country, "prod_iron"),
-            "stone": get_building_effect_total(cursor, country, "prod_stone"),
-            "wood": get_building_effect_total(cursor, country, "prod_wood"),
-            "cloth": get_building_effect_total(cursor, country, "prod_cloth"),
-            "wine": get_building_effect_total(cursor, country, "prod_wine"),
-            "honey": get_building_effect_total(cursor, country, "prod_honey"),
-            "olives": get_building_effect_total(cursor, country, "prod_olives"),
+            "livestock": get_building_effect_total(cursor, country, "prod_livestock", modifier_index),
+            "grain": get_building_effect_total(cursor, country, "prod_grain", modifier_index),
+            "slaves": get_building_effect_total(cursor, country, "prod_slaves", modifier_index),
+            "base_metals": get_building_effect_total(cursor, country, "prod_base_metals", modifier_index),
+            "iron": get_building_effect_total(cursor, country, "prod_iron", modifier_index),
+            "stone": get_building_effect_total(cursor, country, "prod_stone", modifier_index),
+            "wood": get_building_effect_total(cursor, country, "prod_wood", modifier_index),
+            "cloth": get_building_effect_total(cursor, country, "prod_cloth", modifier_index),
+            "wine": get_building_effect_total(cursor, country, "prod_wine", modifier_index),
+            "honey": get_building_effect_total(cursor, country, "prod_honey", modifier_index),
+            "olives": get_building_effect_total(cursor, country, "prod_olives", modifier_index),
         }
         additive_resource_ids = {
             name: resource_ids[0]
@@ -647,7 +750,7 @@ def economy_tick():
             if resource_id and bonus_amount > 0:
                 production[resource_id] = production.get(resource_id, 0) + int(bonus_amount)
         
-        resource_cap = get_resource_cap(cursor, country)
+        resource_cap = get_resource_cap(cursor, country, modifier_index)
         actually_added = apply_resource_production(cursor, country, production, resource_cap)
         food_result = consume_food_resources(cursor, country, population, food_resource_ids)
         food_shortage_ratio = food_result["shortage_ratio"]
@@ -656,54 +759,54 @@ def economy_tick():
         political_mods['unrest_change'] += food_unrest_increase
         
         
-        tax_eff = get_country_modifier(cursor, country, "tax_efficiency")
-        tax_eff *= get_building_country_modifier(cursor, country, "tax_efficiency")
+        tax_eff = get_country_modifier(cursor, country, "tax_efficiency", modifier_index)
+        tax_eff *= get_building_country_modifier(cursor, country, "tax_efficiency", modifier_index)
         tax_eff *= political_mods['tax_efficiency_mod']
         
-        admin_mod = get_country_modifier(cursor, country, "admin_cost_modifier")
-        admin_mod *= get_building_country_modifier(cursor, country, "admin_cost_modifier")
+        admin_mod = get_country_modifier(cursor, country, "admin_cost_modifier", modifier_index)
+        admin_mod *= get_building_country_modifier(cursor, country, "admin_cost_modifier", modifier_index)
         
-        admin_eff = get_country_modifier(cursor, country, "admin_efficiency")
-        admin_eff *= get_building_country_modifier(cursor, country, "admin_efficiency")
+        admin_eff = get_country_modifier(cursor, country, "admin_efficiency", modifier_index)
+        admin_eff *= get_building_country_modifier(cursor, country, "admin_efficiency", modifier_index)
         admin_mod /= max(0.0001, admin_eff)
         admin_mod *= political_mods['admin_cost_mod']
         
-        upkeep_mod = get_country_modifier(cursor, country, "military_upkeep_modifier")
+        upkeep_mod = get_country_modifier(cursor, country, "military_upkeep_modifier", modifier_index)
         upkeep_mod *= political_mods['military_upkeep_mod']
         
         
-        base_tax = get_country_tax_base(cursor, country)
+        base_tax = province_summary["tax_base"]
         tax_income = base_tax * tax_rate * tax_eff
         
         
         tax_income_after_corruption = tax_income * (1 - political_mods['corruption'] * 0.5)
         tax_income_after_corruption *= food_tax_multiplier
         
-        administration_cost = provinces * float(config["economy"]["admin_cost_per_province"]) * admin_mod
+        administration_cost = provinces * ADMIN_COST_PER_PROVINCE * admin_mod
         
         land_upkeep = get_land_military_upkeep(cursor, country)
         navy_upkeep_raw = get_navy_upkeep(cursor, country)
         land_military_upkeep = land_upkeep * upkeep_mod
-        navy_upkeep_mod = get_country_modifier(cursor, country, "navy_upkeep_modifier")
+        navy_upkeep_mod = get_country_modifier(cursor, country, "navy_upkeep_modifier", modifier_index)
         navy_upkeep_mod *= political_mods['military_upkeep_mod']
         navy_military_upkeep = navy_upkeep_raw * navy_upkeep_mod
         military_upkeep = land_military_upkeep + navy_military_upkeep
         
         building_income_raw, building_upkeep = get_building_economy(cursor, country)
-        building_income_mult = get_country_modifier(cursor, country, "production_efficiency")
-        building_income_mult *= get_building_country_modifier(cursor, country, "production_efficiency")
+        building_income_mult = get_country_modifier(cursor, country, "production_efficiency", modifier_index)
+        building_income_mult *= get_building_country_modifier(cursor, country, "production_efficiency", modifier_index)
         building_income = building_income_raw * building_income_mult
         
         
-        base_growth = float(config["politics"]["base_economic_growth"])
-        growth_stability = (political_mods['stability'] - 50) * float(config["politics"]["economic_growth_stability_factor"])
-        growth_unrest = -political_mods['unrest'] * float(config["politics"]["economic_growth_unrest_factor"])
-        growth_corruption = -political_mods['corruption'] * float(config["politics"]["economic_growth_corruption_factor"])
-        growth_war = float(config["politics"]["growth_war_factor"]) if political_mods['at_war'] else 0
-        growth_buildings = building_income_raw * float(config["politics"]["growth_building_factor"])
-        growth_modifier_bonus = get_additive_modifier(cursor, country, "economic_growth")
-        political_mods['stability_change'] += get_additive_modifier(cursor, country, "stability_growth")
-        political_mods['unrest_change'] -= get_additive_modifier(cursor, country, "unrest_reduction")
+        base_growth = settings.politics.base_economic_growth
+        growth_stability = (political_mods['stability'] - 50) * settings.politics.economic_growth_stability_factor
+        growth_unrest = -political_mods['unrest'] * settings.politics.economic_growth_unrest_factor
+        growth_corruption = -political_mods['corruption'] * settings.politics.economic_growth_corruption_factor
+        growth_war = settings.politics.growth_war_factor if political_mods['at_war'] else 0
+        growth_buildings = building_income_raw * settings.politics.growth_building_factor
+        growth_modifier_bonus = get_additive_modifier(cursor, country, "economic_growth", modifier_index)
+        political_mods['stability_change'] += get_additive_modifier(cursor, country, "stability_growth", modifier_index)
+        political_mods['unrest_change'] -= get_additive_modifier(cursor, country, "unrest_reduction", modifier_index)
         
         total_growth_rate = (
             base_growth + growth_stability + growth_unrest + growth_corruption +
@@ -726,10 +829,10 @@ def economy_tick():
         old_war_exhaustion = political_mods['war_exhaustion']
         
         
-        stability_min, stability_max = map(float, config["bounds"].get("stability_bounds", "0,100").split(','))
-        unrest_min, unrest_max = map(float, config["bounds"].get("unrest_bounds", "0,100").split(','))
-        corr_min, corr_max = map(float, config["bounds"]["corruption_bounds"].split(','))
-        war_min, war_max = map(float, config["bounds"]["war_exhaustion_bounds"].split(','))
+        stability_min, stability_max = settings.bounds.stability_bounds
+        unrest_min, unrest_max = settings.bounds.unrest_bounds
+        corr_min, corr_max = settings.bounds.corruption_bounds
+        war_min, war_max = settings.bounds.war_exhaustion_bounds
         
         new_stability = max(stability_min, min(stability_max, old_stability + political_mods['stability_change']))
         new_unrest = max(unrest_min, min(unrest_max, old_unrest + political_mods['unrest_change']))
@@ -737,11 +840,13 @@ def economy_tick():
         new_war_exhaustion = max(war_min, min(war_max, old_war_exhaustion + political_mods['war_exhaustion_change']))
         
         
-        update_province_populations(cursor, country, political_mods['population_change'])
-        
-        
-        cursor.execute("SELECT COALESCE(SUM(population), 0) FROM provinces WHERE owner_country_code = ?", (country,))
-        new_total_population = cursor.fetchone()[0] or 0
+        # Provinces are only read for their own country, so all population
+        # writes are collected and issued together after the loop.
+        new_total_population, updates = redistribute_province_populations(
+            province_summary["provinces"],
+            political_mods['population_change'],
+        )
+        population_updates.extend(updates)
         cursor.execute("""
             UPDATE country_economy SET
                 treasury = ?,
@@ -789,8 +894,8 @@ def economy_tick():
         
         
         total_land_units = get_total_land_units(cursor, country)
-        land_unit_limit = get_land_unit_cap(cursor, country)
-        navy_info = validate_navy_cap(cursor, country)
+        land_unit_limit = get_land_unit_cap(cursor, country, modifier_index, population=new_total_population)
+        navy_info = validate_navy_cap(cursor, country, modifier_index)
         
         print(
             f"\n=== {country} DEBUG INFO ==="
@@ -827,11 +932,77 @@ def economy_tick():
         print(f"  Growth Amount: {growth_amount:,}")
         print("--------------------------------------------------")
     
+    write_province_populations(cursor, population_updates)
     conn.commit()
     conn.close()
     print("\n✅ ECONOMY TICK COMPLETE\n")
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Advance the world economy by one tick.")
+    parser.add_argument(
+        "--engine",
+        choices=["legacy", "bulk"],
+        help="legacy runs the per-country query loop, bulk loads the world once and writes with executemany (default: legacy)",
+    )
+    parser.add_argument(
+        "--kernel",
+        choices=["python", "numpy"],
+        default="python",
+        help="Arithmetic kernel for the bulk engine; numpy evaluates all countries with array operations (default: python)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes computing countries in parallel for the bulk engine (default: 1)",
+    )
+    parser.add_argument(
+        "--ticks",
+        type=int,
+        default=1,
+        help="Advance N ticks in memory with the bulk engine and save only the final state (default: 1)",
+    )
+    parser.add_argument(
+        "--history",
+        help="With --ticks, write per-tick treasury, population, unrest and stability to this CSV file",
+    )
+    args = parser.parse_args()
+    if args.ticks < 1:
+        parser.error("--ticks must be at least 1")
+    if args.ticks > 1 or args.history:
+        if args.engine == "legacy":
+            parser.error("--ticks and --history require --engine bulk")
+        args.engine = "bulk"
+    args.engine = args.engine or "legacy"
+    if args.kernel == "numpy" and args.engine != "bulk":
+        parser.error("--kernel numpy requires --engine bulk")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and args.engine != "bulk":
+        parser.error("--workers requires --engine bulk")
+    return args
+
+
+def main():
+    args = parse_args()
+    if args.ticks > 1 or args.history:
+        from world_tick import world_fast_forward, write_history_csv
+        snapshots = world_fast_forward(
+            args.ticks,
+            kernel=args.kernel,
+            workers=args.workers,
+            history=bool(args.history),
+        )
+        if args.history:
+            write_history_csv(args.history, snapshots)
+            print(f"📈 Tick history written to {args.history}")
+    elif args.engine == "bulk":
+        from world_tick import world_economy_tick
+        world_economy_tick(kernel=args.kernel, workers=args.workers)
+    else:
+        economy_tick()
+
 
 if __name__ == "__main__":
-    economy_tick()
+    main()
@@ -11,6 +11,7 @@ import os
 import math
 from datetime import datetime
 from db_utils import get_connection
+from modifier_index import ModifierIndex
 from economy_tick import (
     FOOD_PER_1000_POP,
     FOOD_RESOURCE_NAMES,
@@ -174,9 +175,10 @@ def get_country_info(conn, country_code):
             for building_name, amount in cursor.fetchall()
         ]
     
-    country_data['land_unit_cap'] = get_land_unit_cap(cursor, country_code)
-    country_data['navy_unit_cap'] = get_navy_unit_cap(cursor, country_code)
-    country_data['resource_cap'] = get_resource_cap(cursor, country_code)
+    modifier_index = ModifierIndex.load(cursor, [country_code])
+    country_data['land_unit_cap'] = get_land_unit_cap(cursor, country_code, modifier_index)
+    country_data['navy_unit_cap'] = get_navy_unit_cap(cursor, country_code, modifier_index)
+    country_data['resource_cap'] = get_resource_cap(cursor, country_code, modifier_index)
     country_data['food'] = get_food_summary(country_data)
 
     return country_data
@@ -1,9 +1,24 @@
+import argparse
 import csv
-import configparser
+import hashlib
 import math
 import os
 import sys
-from db_utils import get_connection
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from db_utils import (
+    GLOBAL_TRIGGER_TABLES,
+    apply_bulk_load_pragmas,
+    clear_dirty_countries,
+    ensure_dirty_country_tracking,
+    ensure_import_sources_table,
+    get_connection,
+    get_dirty_countries,
+    get_import_hashes,
+    is_empty_world,
+    record_import_hash,
+)
+from modifier_index import ModifierIndex
 from economy_tick import (
     FOOD_PER_1000_POP,
     FOOD_RESOURCE_NAMES,
@@ -13,12 +28,13 @@ from economy_tick import (
     get_country_modifier,
     get_building_country_modifier,
     get_building_effect_total,
-    get_country_tax_base,
-    get_population,
-    get_province_count,
+    get_country_province_summary,
     get_military_upkeep,
     get_building_economy,
     get_resource_production,
+    load_province_summaries,
+    OutputModifierLookup,
+    summarize_owned_provinces,
     ensure_country_resource_rows,
     get_land_military_upkeep,
     get_navy_upkeep,
@@ -30,13 +46,13 @@ from economy_tick import (
     get_land_unit_cap,
     get_navy_unit_cap,
 )
+from settings import CONFIG_FILE, get_settings
 
 
-config = configparser.ConfigParser()
-config.read("config.ini")
+settings = get_settings()
 
-BASE_TAX_PER_POP = float(config["economy"]["base_tax_per_pop"])
-ADMIN_COST_PER_PROVINCE = float(config["economy"]["admin_cost_per_province"])
+BASE_TAX_PER_POP = settings.economy.base_tax_per_pop
+ADMIN_COST_PER_PROVINCE = settings.economy.admin_cost_per_province
 DATA_ROOT = "data"
 
 
@@ -58,344 +74,532 @@ def data_file(data_dir, filename):
     return path
 
 
-def import_cultures(cursor, data_dir):
-    with open(data_file(data_dir, "cultures.csv"), newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            cursor.execute("""
-                INSERT INTO cultures (culture, culture_group)
-                VALUES (?, ?)
-                ON CONFLICT(culture) DO UPDATE SET
-                    culture_group = excluded.culture_group
-            """, (
-                row["culture"],
-                row["culture_group"],
-            ))
-
-
-def import_countries(cursor, data_dir):
-    with open(data_file(data_dir, "countries.csv"), newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            cursor.execute("""
-                INSERT INTO countries (code, name, capital, culture,
-                    religion, government, stability,
-                    unrest, corruption, at_war, war_exhaustion)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(code) DO UPDATE SET
-                    name = excluded.name,
-                    capital = excluded.capital,
-                    culture = excluded.culture,
-                    religion = excluded.religion,
-                    government = excluded.government,
-                    stability = excluded.stability,
-                    unrest = excluded.unrest,
-                    corruption = excluded.corruption,
-                    at_war = excluded.at_war,
-                    war_exhaustion = excluded.war_exhaustion
-            """, (
-                row["code"],
-                row["name"],
-                row.get("capital", "Unknown"),
-                row.get("culture", "Unknown"),
-                row.get("religion", "Unknown"),
-                row.get("government", "Unknown"),
-                int(row.get("stability", 50)),
-                int(row.get("unrest", 0)),
-                float(row.get("corruption", 0.0)),
-                int(row.get("at_war", 0)),
-                int(row.get("war_exhaustion", 0))
-            ))
-
-
-def import_provinces(cursor, data_dir):
-    with open(data_file(data_dir, "provinces.csv"), newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
+class ImportRowError(ValueError):
+    """A CSV row that could not be parsed, with the file and line it came from."""
 
-            resource_name = row.get("resource")
-            resource_id = None
-            if resource_name:
-                cursor.execute("SELECT id FROM resources WHERE name = ?", (resource_name,))
-                res = cursor.fetchone()
-                if res:
-                    resource_id = res[0]
+    def __init__(self, file_name, line, message):
+        super().__init__(file_name, line, message)
+        self.file_name = file_name
+        self.line = line
+        self.message = message
 
-            cursor.execute("""
-                INSERT INTO provinces (
-                    name, population, owner_country_code,
-                    rank, religion, culture, terrain, is_naval, resource_id
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(name) DO UPDATE SET
-                    population = excluded.population,
-                    owner_country_code = excluded.owner_country_code,
-                    rank = excluded.rank,
-                    religion = excluded.religion,
-                    culture = excluded.culture,
-                    terrain = excluded.terrain,
-                    is_naval = excluded.is_naval,
-                    resource_id = excluded.resource_id
-            """, (
-                row["name"],
-                int(row["population"]),
-                row.get("owner_country_code"),
-                row.get("rank", "settlement"),
-                row.get("religion", "Unknown"),
-                row.get("culture", "Unknown"),
-                row.get("terrain", "plains"),
-                float(row.get("is_naval", 0)),
-                resource_id
-            ))
-
-
-def import_building_types(cursor, data_dir):
-    with open(data_file(data_dir, "building_types.csv"), newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            cursor.execute("""
-                INSERT INTO building_types 
-                (name, building_type, base_cost, base_tax_income, base_production, base_upkeep, description)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(name) DO UPDATE SET
-                    building_type = excluded.building_type,
-                    base_cost = excluded.base_cost,
-                    base_tax_income = excluded.base_tax_income,
-                    base_production = excluded.base_production,
-                    base_upkeep = excluded.base_upkeep,
-                    description = excluded.description
-            """, (
-                row["name"],
-                row.get("building_type", ""),
-                int(row.get("base_cost", 0) or 0),
-                int(row.get("base_tax_income", 0) or 0),
-                int(row.get("base_production", 0) or 0),
-                int(row.get("base_upkeep", 0) or 0),
-                row.get("description", "")
-            ))
-
-
-def import_province_buildings(cursor, data_dir):
-    with open(data_file(data_dir, "province_buildings.csv"), newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            province = row["province_name"]
-            building = row["building_name"]
-            amount = int(row.get("amount", 1) or 1)
-            cursor.execute("SELECT id FROM provinces WHERE name = ?", (province,))
-            province_id = cursor.fetchone()
-            cursor.execute("SELECT id FROM building_types WHERE name = ?", (building,))
-            building_id = cursor.fetchone()
-            if not province_id:
-                print(f"⚠ Province not found: {province}")
-                continue
-            if not building_id:
-                print(f"⚠ Building type not found: {building}")
-                continue
-            cursor.execute("""
-                INSERT OR REPLACE INTO province_buildings (province_id, building_type_id, amount)
-                VALUES (?, ?, ?)
-            """, (province_id[0], building_id[0], amount))
+    def __str__(self):
+        return f"{self.file_name} line {self.line}: {self.message}"
 
 
-def import_country_economy(cursor, data_dir):
-    with open(data_file(data_dir, "country_economy.csv"), newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            cursor.execute("""
-                INSERT INTO country_economy (
-                    country_code, treasury, tax_rate
-                )
-                VALUES (?, ?, ?)
-                ON CONFLICT(country_code) DO UPDATE SET
-                    treasury = excluded.treasury,
-                    tax_rate = excluded.tax_rate
-                """, (
-                    row["country_code"],
-                    int(row.get("treasury", 0) or 0),
-                    float(row.get("tax_rate", 0) or 0)
-                ))
-
-
-def import_unit_types(cursor, data_dir):
-    with open(data_file(data_dir, "unit_types.csv"), newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            cursor.execute("""
-                INSERT INTO unit_types (
-                    name, unit_category, recruitment_cost, upkeep_cost, attack, defense
-                )
-                VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT(name) DO UPDATE SET
-                    unit_category = excluded.unit_category,
-                    recruitment_cost = excluded.recruitment_cost,
-                    upkeep_cost = excluded.upkeep_cost,
-                    attack = excluded.attack,
-                    defense = excluded.defense
-            """, (
-                row["name"],
-                row.get("unit_category"),
-                int(row.get("recruitment_cost", 0) or 0),
-                int(row.get("upkeep_cost", 0) or 0),
-                int(row.get("attack", 0) or 0),
-                int(row.get("defense", 0) or 0)
-            ))
-
-
-def import_country_units(cursor, data_dir):
-    with open(data_file(data_dir, "country_units.csv"), newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            country = row["country_code"]
-            unit = row["unit_type"].strip()
-            amount = int(row.get("amount", 0) or 0)
-
-            cursor.execute("SELECT id FROM unit_types WHERE name = ?", (unit,))
-            unit_id = cursor.fetchone()
-            if not unit_id:
-                print(f"⚠ Unit type not found: {unit}")
-                continue
+class ScenarioValidationError(RuntimeError):
+    def __init__(self, errors):
+        super().__init__(f"{len(errors)} invalid rows in the scenario CSV files")
+        self.errors = errors
 
-            cursor.execute("""
-                INSERT OR REPLACE INTO country_units (country_code, unit_type_id, amount)
-                VALUES (?, ?, ?)
-            """, (country, unit_id[0], amount))
 
+def describe_row_error(error):
+    if isinstance(error, KeyError):
+        return f"missing column {error.args[0]!r}"
+    return str(error)
 
-def import_modifiers(cursor, data_dir):
-    with open(data_file(data_dir, "modifiers.csv"), newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            cursor.execute("""
-                INSERT INTO modifiers (
-                    modifier_key, description, default_value
-                )
-                VALUES (?, ?, ?)
-                ON CONFLICT(modifier_key) DO UPDATE SET
-                    description = excluded.description,
-                    default_value = excluded.default_value
-            """, (
-                row["modifier_key"],
-                row.get("description", ""),
-                float(row.get("default_value", 1.0) or 1.0)
-            ))
-
-
-def import_building_effects(cursor, data_dir):
-    with open(data_file(data_dir, "building_effects.csv"), newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            building_name = row.get("building_name", "").strip()
 
-            cursor.execute("SELECT id FROM building_types WHERE name = ?", (building_name,))
-            result = cursor.fetchone()
-            if not result:
-                print(f"⚠ Building type not found: '{building_name}' — skipping effect row.")
-                continue
-            building_type_id = result[0]
+NO_DEFAULT = object()
 
-            scope = row.get("scope", "")
-            modifier_key = row.get("modifier_key", "")
-            value = float(row.get("value", 0.0) or 0.0)
 
-            cursor.execute("""
-                INSERT INTO building_effects (
-                    building_type_id, scope, modifier_key, value
-                )
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(building_type_id, scope, modifier_key) DO UPDATE SET
-                    value = excluded.value
-            """, (building_type_id, scope, modifier_key, value))
+def required_field(row, column, default=NO_DEFAULT):
+    """
+    The value of a column the converter cannot do without. A column missing
+    from the header falls back to default (KeyError without one); a row too
+    short to reach the column is reported as a missing field.
+    """
+    if column not in row:
+        if default is NO_DEFAULT:
+            raise KeyError(column)
+        return default
+    value = row[column]
+    if value is None:
+        raise ValueError(f"missing field {column!r}")
+    return value
 
 
-def import_country_modifiers(cursor, data_dir):
-    with open(data_file(data_dir, "country_modifiers.csv"), newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            cursor.execute("""
-                INSERT INTO country_modifiers (
-                    country_code, modifier_key, value
-                )
-                VALUES (?, ?, ?)
-                ON CONFLICT(country_code, modifier_key) DO UPDATE SET
-                    value = excluded.value
-                """, (
-                    row["country_code"],
-                    row.get("modifier_key", ""),
-                    float(row.get("value", 0.0) or 0.0)
-                ))
-
-
-def import_resources(cursor, data_dir):
-    with open(data_file(data_dir, "resources.csv"), newline="", encoding="utf-8") as f:
+def parse_csv(path, convert):
+    """
+    Convert every row of a CSV file with convert(row) -> tuple.
+    Returns (rows, errors); a row that fails becomes an ImportRowError instead
+    of stopping the file.
+    """
+    file_name = os.path.basename(path)
+    rows = []
+    errors = []
+    with open(path, newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
-            cursor.execute("""
-                INSERT INTO resources (name, description)
-                VALUES (?, ?)
-                ON CONFLICT(name) DO UPDATE SET
-                    description = excluded.description
-            """, (
-                row["name"],
-                row.get("description", "")
-            ))
-
-
-def import_building_resource_costs(cursor, data_dir):
-    with open(data_file(data_dir, "building_resource_cost.csv"), newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            building_name = row.get("building_name", "").strip()
-            resource_name = row.get("resource_name", "").strip()
-            amount_per_unit = int(row.get("amount_per_unit", 0) or 0)
-
-            cursor.execute("SELECT id FROM building_types WHERE name = ?", (building_name,))
-            building = cursor.fetchone()
-            if not building:
-                print(f"⚠ Building type not found in resource costs: {building_name}")
+            # Short rows are allowed: the missing trailing columns are None,
+            # and the converter reports the ones it cannot do without.
+            extra = row.pop(None, None)
+            if extra:
+                message = f"expected {len(reader.fieldnames)} fields, got {len(reader.fieldnames) + len(extra)}"
+                errors.append(ImportRowError(file_name, reader.line_num, message))
                 continue
+            try:
+                rows.append(convert(row))
+            except KeyError as e:
+                # A column missing from the header fails every row; report it once.
+                errors.append(ImportRowError(file_name, 1, describe_row_error(e)))
+                break
+            except (TypeError, ValueError) as e:
+                errors.append(ImportRowError(file_name, reader.line_num, describe_row_error(e)))
+    return rows, errors
+
+
+def get_name_ids(cursor, table):
+    """name -> id for one of the tables keyed by a unique name."""
+    cursor.execute(f"SELECT name, id FROM {table}")
+    return dict(cursor.fetchall())
+
+
+# Columns written by each import, starting with the table's natural key: (columns, key size).
+IMPORT_COLUMNS = {
+    "resources": (("name", "description"), 1),
+    "cultures": (("culture", "culture_group"), 1),
+    "countries": (
+        (
+            "code", "name", "capital", "culture", "religion", "government",
+            "stability", "unrest", "corruption", "at_war", "war_exhaustion",
+        ),
+        1,
+    ),
+    "provinces": (
+        (
+            "name", "population", "owner_country_code", "rank", "religion",
+            "culture", "terrain", "is_naval", "resource_id",
+        ),
+        1,
+    ),
+    "building_types": (
+        ("name", "building_type", "base_cost", "base_tax_income", "base_production", "base_upkeep", "description"),
+        1,
+    ),
+    "building_resource_costs": (("building_type_id", "resource_id", "amount_per_unit"), 2),
+    "province_buildings": (("province_id", "building_type_id", "amount"), 2),
+    "country_economy": (("country_code", "treasury", "tax_rate"), 1),
+    "unit_types": (("name", "unit_category", "recruitment_cost", "upkeep_cost", "attack", "defense"), 1),
+    "unit_resource_costs": (("unit_type_id", "resource_id", "amount_per_unit"), 2),
+    "country_units": (("country_code", "unit_type_id", "amount"), 2),
+    "modifiers": (("modifier_key", "description", "default_value"), 1),
+    "building_effects": (("building_type_id", "scope", "modifier_key", "value"), 3),
+    "country_modifiers": (("country_code", "modifier_key", "value"), 2),
+}
+
+
+def changed_rows(cursor, table, rows):
+    """
+    Drop rows that would leave the table as it is, so re-imports only write
+    (and mark dirty countries for) what actually changed. Rows are checked in
+    order, so repeated keys in a file still end with the last one.
+    """
+    columns, key_size = IMPORT_COLUMNS[table]
+    cursor.execute(f"SELECT {', '.join(columns)} FROM {table}")
+    current = {row[:key_size]: row for row in cursor}
+    changed = []
+    for row in rows:
+        key = row[:key_size]
+        if current.get(key) != row:
+            changed.append(row)
+            current[key] = row
+    return changed
+
+
+def affected_countries(cursor, table, rows):
+    """
+    Countries whose economy snapshot reads the given rows of table, looked up
+    before they are written so provinces changing hands count both owners.
+    """
+    if not rows:
+        return set()
+    if table in GLOBAL_TRIGGER_TABLES:
+        cursor.execute("SELECT code FROM countries")
+        return {row[0] for row in cursor.fetchall()}
+    if table in ("countries", "country_economy", "country_units", "country_modifiers"):
+        return {row[0] for row in rows}
+    if table == "provinces":
+        cursor.execute("SELECT name, owner_country_code FROM provinces")
+        owners = dict(cursor.fetchall())
+        countries = {row[2] for row in rows} | {owners.get(row[0]) for row in rows}
+    elif table == "province_buildings":
+        cursor.execute("SELECT id, owner_country_code FROM provinces")
+        owners = dict(cursor.fetchall())
+        countries = {owners.get(row[0]) for row in rows}
+    else:
+        # The resource cost tables do not feed the snapshot.
+        return set()
+    countries.discard(None)
+    return countries
 
-            cursor.execute("SELECT id FROM resources WHERE name = ?", (resource_name,))
-            resource = cursor.fetchone()
-            if not resource:
-                print(f"⚠ Resource not found in building resource costs: {resource_name}")
-                continue
 
-            cursor.execute("""
-                INSERT INTO building_resource_costs (building_type_id, resource_id, amount_per_unit)
-                VALUES (?, ?, ?)
-                ON CONFLICT(building_type_id, resource_id) DO UPDATE SET
-                    amount_per_unit = excluded.amount_per_unit
-            """, (building[0], resource[0], amount_per_unit))
+def write_changed_rows(cursor, table, sql, rows):
+    """Write the rows that change table; returns the countries they affect."""
+    rows = changed_rows(cursor, table, rows)
+    countries = affected_countries(cursor, table, rows)
+    cursor.executemany(sql, rows)
+    return countries
 
 
+# Row converters: one CSV row (dict) -> the typed tuple its import expects.
+# Names of other entities are kept as names; the writer resolves them to ids.
 
-def import_unit_resource_costs(cursor, data_dir):
-    with open(data_file(data_dir, "unit_resource_costs.csv"), newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            unit_name = row.get("unit_name", "").strip()
-            resource_name = row.get("resource_name", "").strip()
-            amount_per_unit = int(row.get("amount_per_unit", 0) or 0)
-
-            cursor.execute("SELECT id FROM unit_types WHERE name = ?", (unit_name,))
-            unit = cursor.fetchone()
-            if not unit:
-                print(f"⚠ Unit type not found in resource costs: {unit_name}")
-                continue
+def convert_culture(row):
+    return (
+        row["culture"],
+        row["culture_group"],
+    )
 
-            cursor.execute("SELECT id FROM resources WHERE name = ?", (resource_name,))
-            resource = cursor.fetchone()
-            if not resource:
-                print(f"⚠ Resource not found in unit resource costs: {resource_name}")
-                continue
 
-            cursor.execute("""
-                INSERT INTO unit_resource_costs (unit_type_id, resource_id, amount_per_unit)
-                VALUES (?, ?, ?)
-                ON CONFLICT(unit_type_id, resource_id) DO UPDATE SET
-                    amount_per_unit = excluded.amount_per_unit
-            """, (unit[0], resource[0], amount_per_unit))
+def convert_country(row):
+    return (
+        row["code"],
+        row["name"],
+        row.get("capital", "Unknown"),
+        row.get("culture", "Unknown"),
+        row.get("religion", "Unknown"),
+        row.get("government", "Unknown"),
+        int(required_field(row, "stability", 50)),
+        int(required_field(row, "unrest", 0)),
+        float(required_field(row, "corruption", 0.0)),
+        int(required_field(row, "at_war", 0)),
+        int(required_field(row, "war_exhaustion", 0))
+    )
+
+
+def convert_province(row):
+    return (
+        row["name"],
+        int(required_field(row, "population")),
+        row.get("owner_country_code"),
+        row.get("rank", "settlement"),
+        row.get("religion", "Unknown"),
+        row.get("culture", "Unknown"),
+        row.get("terrain", "plains"),
+        float(required_field(row, "is_naval", 0)),
+        row.get("resource")
+    )
+
+
+def convert_building_type(row):
+    return (
+        row["name"],
+        row.get("building_type", ""),
+        int(row.get("base_cost", 0) or 0),
+        int(row.get("base_tax_income", 0) or 0),
+        int(row.get("base_production", 0) or 0),
+        int(row.get("base_upkeep", 0) or 0),
+        row.get("description", "")
+    )
+
+
+def convert_province_building(row):
+    return (
+        row["province_name"],
+        row["building_name"],
+        int(row.get("amount", 1) or 1)
+    )
+
+
+def convert_country_economy(row):
+    return (
+        row["country_code"],
+        int(row.get("treasury", 0) or 0),
+        float(row.get("tax_rate", 0) or 0)
+    )
+
+
+def convert_unit_type(row):
+    return (
+        row["name"],
+        row.get("unit_category"),
+        int(row.get("recruitment_cost", 0) or 0),
+        int(row.get("upkeep_cost", 0) or 0),
+        int(row.get("attack", 0) or 0),
+        int(row.get("defense", 0) or 0)
+    )
+
+
+def convert_country_unit(row):
+    return (
+        row["country_code"],
+        required_field(row, "unit_type").strip(),
+        int(row.get("amount", 0) or 0)
+    )
+
+
+def convert_modifier(row):
+    return (
+        row["modifier_key"],
+        row.get("description", ""),
+        float(row.get("default_value", 1.0) or 1.0)
+    )
+
+
+def convert_building_effect(row):
+    return (
+        required_field(row, "building_name", "").strip(),
+        row.get("scope", ""),
+        row.get("modifier_key", ""),
+        float(row.get("value", 0.0) or 0.0)
+    )
+
+
+def convert_country_modifier(row):
+    return (
+        row["country_code"],
+        row.get("modifier_key", ""),
+        float(row.get("value", 0.0) or 0.0)
+    )
+
+
+def convert_resource(row):
+    return (
+        row["name"],
+        row.get("description", "")
+    )
+
+
+def convert_building_resource_cost(row):
+    return (
+        required_field(row, "building_name", "").strip(),
+        required_field(row, "resource_name", "").strip(),
+        int(row.get("amount_per_unit", 0) or 0)
+    )
+
+
+def convert_unit_resource_cost(row):
+    return (
+        required_field(row, "unit_name", "").strip(),
+        required_field(row, "resource_name", "").strip(),
+        int(row.get("amount_per_unit", 0) or 0)
+    )
+
+
+# Writers: insert the converted rows of one file, resolving names to ids, and
+# return the countries whose economy snapshot the written rows affect.
+
+def import_cultures(cursor, rows):
+    return write_changed_rows(cursor, "cultures", """
+        INSERT INTO cultures (culture, culture_group)
+        VALUES (?, ?)
+        ON CONFLICT(culture) DO UPDATE SET
+            culture_group = excluded.culture_group
+    """, rows)
+
+
+def import_countries(cursor, rows):
+    return write_changed_rows(cursor, "countries", """
+        INSERT INTO countries (code, name, capital, culture,
+            religion, government, stability,
+            unrest, corruption, at_war, war_exhaustion)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(code) DO UPDATE SET
+            name = excluded.name,
+            capital = excluded.capital,
+            culture = excluded.culture,
+            religion = excluded.religion,
+            government = excluded.government,
+            stability = excluded.stability,
+            unrest = excluded.unrest,
+            corruption = excluded.corruption,
+            at_war = excluded.at_war,
+            war_exhaustion = excluded.war_exhaustion
+    """, rows)
+
+
+def import_provinces(cursor, rows):
+    resource_ids = get_name_ids(cursor, "resources")
+    rows = [
+        (*row[:-1], resource_ids.get(row[-1]) if row[-1] else None)
+        for row in rows
+    ]
+
+    return write_changed_rows(cursor, "provinces", """
+        INSERT INTO provinces (
+            name, population, owner_country_code,
+            rank, religion, culture, terrain, is_naval, resource_id
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(name) DO UPDATE SET
+            population = excluded.population,
+            owner_country_code = excluded.owner_country_code,
+            rank = excluded.rank,
+            religion = excluded.religion,
+            culture = excluded.culture,
+            terrain = excluded.terrain,
+            is_naval = excluded.is_naval,
+            resource_id = excluded.resource_id
+    """, rows)
+
+
+def import_building_types(cursor, rows):
+    return write_changed_rows(cursor, "building_types", """
+        INSERT INTO building_types 
+        (name, building_type, base_cost, base_tax_income, base_production, base_upkeep, description)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(name) DO UPDATE SET
+            building_type = excluded.building_type,
+            base_cost = excluded.base_cost,
+            base_tax_income = excluded.base_tax_income,
+            base_production = excluded.base_production,
+            base_upkeep = excluded.base_upkeep,
+            description = excluded.description
+    """, rows)
+
+
+def import_province_buildings(cursor, rows):
+    province_ids = get_name_ids(cursor, "provinces")
+    building_ids = get_name_ids(cursor, "building_types")
+    resolved = []
+    for province, building, amount in rows:
+        if province not in province_ids:
+            print(f"⚠ Province not found: {province}")
+            continue
+        if building not in building_ids:
+            print(f"⚠ Building type not found: {building}")
+            continue
+        resolved.append((province_ids[province], building_ids[building], amount))
+
+    return write_changed_rows(cursor, "province_buildings", """
+        INSERT OR REPLACE INTO province_buildings (province_id, building_type_id, amount)
+        VALUES (?, ?, ?)
+    """, resolved)
+
+
+def import_country_economy(cursor, rows):
+    return write_changed_rows(cursor, "country_economy", """
+        INSERT INTO country_economy (
+            country_code, treasury, tax_rate
+        )
+        VALUES (?, ?, ?)
+        ON CONFLICT(country_code) DO UPDATE SET
+            treasury = excluded.treasury,
+            tax_rate = excluded.tax_rate
+        """, rows)
+
+
+def import_unit_types(cursor, rows):
+    return write_changed_rows(cursor, "unit_types", """
+        INSERT INTO unit_types (
+            name, unit_category, recruitment_cost, upkeep_cost, attack, defense
+        )
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(name) DO UPDATE SET
+            unit_category = excluded.unit_category,
+            recruitment_cost = excluded.recruitment_cost,
+            upkeep_cost = excluded.upkeep_cost,
+            attack = excluded.attack,
+            defense = excluded.defense
+    """, rows)
+
+
+def import_country_units(cursor, rows):
+    unit_ids = get_name_ids(cursor, "unit_types")
+    resolved = []
+    for country, unit, amount in rows:
+        if unit not in unit_ids:
+            print(f"⚠ Unit type not found: {unit}")
+            continue
+        resolved.append((country, unit_ids[unit], amount))
+
+    return write_changed_rows(cursor, "country_units", """
+        INSERT OR REPLACE INTO country_units (country_code, unit_type_id, amount)
+        VALUES (?, ?, ?)
+    """, resolved)
+
+
+def import_modifiers(cursor, rows):
+    return write_changed_rows(cursor, "modifiers", """
+        INSERT INTO modifiers (
+            modifier_key, description, default_value
+        )
+        VALUES (?, ?, ?)
+        ON CONFLICT(modifier_key) DO UPDATE SET
+            description = excluded.description,
+            default_value = excluded.default_value
+    """, rows)
+
+
+def import_building_effects(cursor, rows):
+    building_ids = get_name_ids(cursor, "building_types")
+    resolved = []
+    for building_name, scope, modifier_key, value in rows:
+        if building_name not in building_ids:
+            print(f"⚠ Building type not found: '{building_name}' — skipping effect row.")
+            continue
+        resolved.append((building_ids[building_name], scope, modifier_key, value))
+
+    return write_changed_rows(cursor, "building_effects", """
+        INSERT INTO building_effects (
+            building_type_id, scope, modifier_key, value
+        )
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(building_type_id, scope, modifier_key) DO UPDATE SET
+            value = excluded.value
+    """, resolved)
+
+
+def import_country_modifiers(cursor, rows):
+    return write_changed_rows(cursor, "country_modifiers", """
+        INSERT INTO country_modifiers (
+            country_code, modifier_key, value
+        )
+        VALUES (?, ?, ?)
+        ON CONFLICT(country_code, modifier_key) DO UPDATE SET
+            value = excluded.value
+        """, rows)
+
+
+def import_resources(cursor, rows):
+    return write_changed_rows(cursor, "resources", """
+        INSERT INTO resources (name, description)
+        VALUES (?, ?)
+        ON CONFLICT(name) DO UPDATE SET
+            description = excluded.description
+    """, rows)
+
+
+def import_building_resource_costs(cursor, rows):
+    building_ids = get_name_ids(cursor, "building_types")
+    resource_ids = get_name_ids(cursor, "resources")
+    resolved = []
+    for building_name, resource_name, amount_per_unit in rows:
+        if building_name not in building_ids:
+            print(f"⚠ Building type not found in resource costs: {building_name}")
+            continue
+        if resource_name not in resource_ids:
+            print(f"⚠ Resource not found in building resource costs: {resource_name}")
+            continue
+        resolved.append((building_ids[building_name], resource_ids[resource_name], amount_per_unit))
+
+    return write_changed_rows(cursor, "building_resource_costs", """
+        INSERT INTO building_resource_costs (building_type_id, resource_id, amount_per_unit)
+        VALUES (?, ?, ?)
+        ON CONFLICT(building_type_id, resource_id) DO UPDATE SET
+            amount_per_unit = excluded.amount_per_unit
+    """, resolved)
+
+
+def import_unit_resource_costs(cursor, rows):
+    unit_ids = get_name_ids(cursor, "unit_types")
+    resource_ids = get_name_ids(cursor, "resources")
+    resolved = []
+    for unit_name, resource_name, amount_per_unit in rows:
+        if unit_name not in unit_ids:
+            print(f"⚠ Unit type not found in resource costs: {unit_name}")
+            continue
+        if resource_name not in resource_ids:
+            print(f"⚠ Resource not found in unit resource costs: {resource_name}")
+            continue
+        resolved.append((unit_ids[unit_name], resource_ids[resource_name], amount_per_unit))
+
+    return write_changed_rows(cursor, "unit_resource_costs", """
+        INSERT INTO unit_resource_costs (unit_type_id, resource_id, amount_per_unit)
+        VALUES (?, ?, ?)
+        ON CONFLICT(unit_type_id, resource_id) DO UPDATE SET
+            amount_per_unit = excluded.amount_per_unit
+    """, resolved)
 
 
 def validate_schema(cursor):
@@ -416,20 +620,22 @@ def validate_schema(cursor):
         raise RuntimeError(f"Missing required tables: {missing}")
 
 
-def get_country_resource_production_snapshot(cursor, country):
-    production = get_resource_production(cursor, country)
+def get_country_resource_production_snapshot(cursor, country, modifier_index=None, production=None):
+    if production is None:
+        production = get_resource_production(cursor, country)
+    production = dict(production)
     additive_resource_effects = {
-        "livestock": get_building_effect_total(cursor, country, "prod_livestock"),
-        "grain": get_building_effect_total(cursor, country, "prod_grain"),
-        "slaves": get_building_effect_total(cursor, country, "prod_slaves"),
-        "base_metals": get_building_effect_total(cursor, country, "prod_base_metals"),
-        "iron": get_building_effect_total(cursor, country, "prod_iron"),
-        "stone": get_building_effect_total(cursor, country, "prod_stone"),
-        "wood": get_building_effect_total(cursor, country, "prod_wood"),
-        "cloth": get_building_effect_total(cursor, country, "prod_cloth"),
-        "wine": get_building_effect_total(cursor, country, "prod_wine"),
-        "honey": get_building_effect_total(cursor, country, "prod_honey"),
-        "olives": get_building_effect_total(cursor, country, "prod_olives"),
+        "livestock": get_building_effect_total(cursor, country, "prod_livestock", modifier_index),
+        "grain": get_building_effect_total(cursor, country, "prod_grain", modifier_index),
+        "slaves": get_building_effect_total(cursor, country, "prod_slaves", modifier_index),
+        "base_metals": get_building_effect_total(cursor, country, "prod_base_metals", modifier_index),
+        "iron": get_building_effect_total(cursor, country, "prod_iron", modifier_index),
+        "stone": get_building_effect_total(cursor, country, "prod_stone", modifier_index),
+        "wood": get_building_effect_total(cursor, country, "prod_wood", modifier_index),
+        "cloth": get_building_effect_total(cursor, country, "prod_cloth", modifier_index),
+        "wine": get_building_effect_total(cursor, country, "prod_wine", modifier_index),
+        "honey": get_building_effect_total(cursor, country, "prod_honey", modifier_index),
+        "olives": get_building_effect_total(cursor, country, "prod_olives", modifier_index),
     }
     additive_resource_ids = {
         name: resource_ids[0]
@@ -474,7 +680,14 @@ def get_food_tax_multiplier_preview(cursor, country, population):
     return max(0.0, 1.0 - (shortage_ratio * FOOD_SHORTAGE_TAX_PENALTY_MAX))
 
 
-def refresh_country_economy(cursor, country, seed_resource_stockpiles=False, verbose=False):
+def refresh_country_economy(
+    cursor,
+    country,
+    seed_resource_stockpiles=False,
+    verbose=False,
+    modifier_index=None,
+    province_summary=None,
+):
     cursor.execute("SELECT treasury, tax_rate FROM country_economy WHERE country_code = ?", (country,))
     row = cursor.fetchone()
     if not row:
@@ -482,31 +695,37 @@ def refresh_country_economy(cursor, country, seed_resource_stockpiles=False, ver
             print(f"⚠ No economy row for {country}")
         return None
 
+    if modifier_index is None:
+        modifier_index = ModifierIndex.load(cursor, [country])
+
+    if province_summary is None:
+        province_summary = get_country_province_summary(cursor, country)
+
     treasury, tax_rate = row
-    population = get_population(cursor, country)
-    provinces = get_province_count(cursor, country)
+    population = province_summary["population"]
+    provinces = province_summary["province_count"]
     political_mods = calculate_political_modifiers(cursor, country)
     if not political_mods:
         return None
 
-    tax_eff = get_country_modifier(cursor, country, "tax_efficiency")
-    tax_eff *= get_building_country_modifier(cursor, country, "tax_efficiency")
+    tax_eff = get_country_modifier(cursor, country, "tax_efficiency", modifier_index)
+    tax_eff *= get_building_country_modifier(cursor, country, "tax_efficiency", modifier_index)
     tax_eff *= political_mods["tax_efficiency_mod"]
 
-    admin_mod = get_country_modifier(cursor, country, "admin_cost_modifier")
-    admin_mod *= get_building_country_modifier(cursor, country, "admin_cost_modifier")
-    admin_eff = get_country_modifier(cursor, country, "admin_efficiency")
-    admin_eff *= get_building_country_modifier(cursor, country, "admin_efficiency")
+    admin_mod = get_country_modifier(cursor, country, "admin_cost_modifier", modifier_index)
+    admin_mod *= get_building_country_modifier(cursor, country, "admin_cost_modifier", modifier_index)
+    admin_eff = get_country_modifier(cursor, country, "admin_efficiency", modifier_index)
+    admin_eff *= get_building_country_modifier(cursor, country, "admin_efficiency", modifier_index)
     admin_mod /= max(0.0001, admin_eff)
     admin_mod *= political_mods["admin_cost_mod"]
 
-    upkeep_mod = get_country_modifier(cursor, country, "military_upkeep_modifier")
+    upkeep_mod = get_country_modifier(cursor, country, "military_upkeep_modifier", modifier_index)
     upkeep_mod *= political_mods["military_upkeep_mod"]
 
-    building_income_mult = get_country_modifier(cursor, country, "production_efficiency")
-    building_income_mult *= get_building_country_modifier(cursor, country, "production_efficiency")
+    building_income_mult = get_country_modifier(cursor, country, "production_efficiency", modifier_index)
+    building_income_mult *= get_building_country_modifier(cursor, country, "production_efficiency", modifier_index)
 
-    base_tax = get_country_tax_base(cursor, country)
+    base_tax = province_summary["tax_base"]
     tax_income = base_tax * tax_rate * tax_eff
     tax_income *= (1 - political_mods["corruption"] * 0.5)
     tax_income *= get_food_tax_multiplier_preview(cursor, country, population)
@@ -516,16 +735,16 @@ def refresh_country_economy(cursor, country, seed_resource_stockpiles=False, ver
     building_income_raw, building_upkeep = get_building_economy(cursor, country)
     building_income = building_income_raw * building_income_mult
 
-    base_growth = float(config["politics"]["base_economic_growth"])
+    base_growth = settings.politics.base_economic_growth
     growth_stability = (
         (political_mods["stability"] - 50)
-        * float(config["politics"]["economic_growth_stability_factor"])
+        * settings.politics.economic_growth_stability_factor
     )
-    growth_unrest = -political_mods["unrest"] * float(config["politics"]["economic_growth_unrest_factor"])
-    growth_corruption = -political_mods["corruption"] * float(config["politics"]["economic_growth_corruption_factor"])
-    growth_war = float(config["politics"]["growth_war_factor"]) if political_mods["at_war"] else 0
-    growth_buildings = building_income_raw * float(config["politics"]["growth_building_factor"])
-    growth_modifier_bonus = get_additive_modifier(cursor, country, "economic_growth")
+    growth_unrest = -political_mods["unrest"] * settings.politics.economic_growth_unrest_factor
+    growth_corruption = -political_mods["corruption"] * settings.politics.economic_growth_corruption_factor
+    growth_war = settings.politics.growth_war_factor if political_mods["at_war"] else 0
+    growth_buildings = building_income_raw * settings.politics.growth_building_factor
+    growth_modifier_bonus = get_additive_modifier(cursor, country, "economic_growth", modifier_index)
     total_growth_rate = max(
         0.0,
         base_growth + growth_stability + growth_unrest + growth_corruption
@@ -536,7 +755,14 @@ def refresh_country_economy(cursor, country, seed_resource_stockpiles=False, ver
 
     total_income = int(tax_income + building_income + growth_amount)
     total_expenses = int(administration_cost + military_upkeep + building_upkeep)
-    production = get_country_resource_production_snapshot(cursor, country)
+    production = get_country_resource_production_snapshot(
+        cursor, country, modifier_index, production=province_summary["production"]
+    )
+
+    # The snapshot is now up to date with its inputs. Seeding below rewrites
+    # the stockpiles the food preview just read, so the stockpile trigger
+    # marks the country again and the next dirty-only refresh picks it up.
+    clear_dirty_countries(cursor, [country])
 
     if seed_resource_stockpiles:
         cursor.execute("UPDATE country_resources SET stockpile = 0 WHERE country_code = ?", (country,))
@@ -572,7 +798,7 @@ def refresh_country_economy(cursor, country, seed_resource_stockpiles=False, ver
         country
     ))
 
-    resource_cap = get_resource_cap(cursor, country)
+    resource_cap = get_resource_cap(cursor, country, modifier_index)
     stockpile_total = cursor.execute(
         "SELECT COALESCE(SUM(stockpile), 0) FROM country_resources WHERE country_code = ?",
         (country,)
@@ -595,15 +821,15 @@ def refresh_country_economy(cursor, country, seed_resource_stockpiles=False, ver
         "resource_cap": resource_cap,
         "stockpile_total": stockpile_total,
         "production": production,
-        "land_unit_cap": get_land_unit_cap(cursor, country),
-        "navy_unit_cap": get_navy_unit_cap(cursor, country),
+        "land_unit_cap": get_land_unit_cap(cursor, country, modifier_index),
+        "navy_unit_cap": get_navy_unit_cap(cursor, country, modifier_index),
         "total_land_units": get_total_land_units(cursor, country),
         "total_navy_units": get_total_navy_units(cursor, country),
         "coastal_provinces": get_coastal_province_count(cursor, country),
         "land_military_upkeep": int(get_land_military_upkeep(cursor, country) * upkeep_mod),
         "navy_military_upkeep": int(
             get_navy_upkeep(cursor, country)
-            * get_country_modifier(cursor, country, "navy_upkeep_modifier")
+            * get_country_modifier(cursor, country, "navy_upkeep_modifier", modifier_index)
             * political_mods["military_upkeep_mod"]
         ),
     }
@@ -642,54 +868,236 @@ def refresh_country_economy(cursor, country, seed_resource_stockpiles=False, ver
     return result
 
 
-def refresh_all_country_economies(cursor, seed_resource_stockpiles=False, verbose=False):
+def refresh_all_country_economies(
+    cursor, seed_resource_stockpiles=False, verbose=False, dirty_only=False, country_codes=None
+):
+    """
+    Refresh every country, with dirty_only just the ones marked in
+    dirty_countries, or with country_codes just those countries.
+    """
     validate_schema(cursor)
     ensure_country_resource_rows(cursor)
-    cursor.execute("SELECT code FROM countries ORDER BY code")
-    countries = [row[0] for row in cursor.fetchall()]
+    ensure_dirty_country_tracking(cursor)
+    if dirty_only or country_codes is not None:
+        cursor.execute("SELECT code FROM countries ORDER BY code")
+        existing = {row[0] for row in cursor.fetchall()}
+        if dirty_only:
+            selected = get_dirty_countries(cursor)
+            clear_dirty_countries(cursor, [country for country in selected if country not in existing])
+        else:
+            selected = sorted(country_codes)
+        countries = [country for country in selected if country in existing]
+        if not countries:
+            return []
+        modifier_index = ModifierIndex.load(cursor, countries)
+        province_summaries = load_province_summaries(cursor, countries)
+    else:
+        cursor.execute("SELECT code FROM countries ORDER BY code")
+        countries = [row[0] for row in cursor.fetchall()]
+        modifier_index = ModifierIndex.load(cursor)
+        province_summaries = load_province_summaries(cursor)
+    empty_summary = summarize_owned_provinces([], OutputModifierLookup({}))
     return [
         result
         for result in (
-            refresh_country_economy(cursor, country, seed_resource_stockpiles=seed_resource_stockpiles, verbose=verbose)
+            refresh_country_economy(
+                cursor,
+                country,
+                seed_resource_stockpiles=seed_resource_stockpiles,
+                verbose=verbose,
+                modifier_index=modifier_index,
+                province_summary=province_summaries.get(country, empty_summary),
+            )
             for country in countries
         )
         if result is not None
     ]
 
 
-def import_economy_snapshot(cursor):
+def import_economy_snapshot(cursor, country_codes=None):
+    """Recompute the snapshot and reseed stockpiles of every country, or only country_codes."""
     print("\n=== IMPORT ECONOMY START ===")
-    refresh_all_country_economies(cursor, seed_resource_stockpiles=True, verbose=True)
+    refresh_all_country_economies(cursor, seed_resource_stockpiles=True, verbose=True, country_codes=country_codes)
     print("✅ IMPORT ECONOMY COMPLETE")
 
 
+# Source files in insert order:
+# (file, row converter, writer, files whose names the writer resolves).
+IMPORT_STEPS = [
+    ("resources.csv", convert_resource, import_resources, ()),
+    ("cultures.csv", convert_culture, import_cultures, ()),
+    ("countries.csv", convert_country, import_countries, ()),
+    ("provinces.csv", convert_province, import_provinces, ("resources.csv",)),
+    ("building_types.csv", convert_building_type, import_building_types, ()),
+    (
+        "building_resource_cost.csv",
+        convert_building_resource_cost,
+        import_building_resource_costs,
+        ("building_types.csv", "resources.csv"),
+    ),
+    (
+        "province_buildings.csv",
+        convert_province_building,
+        import_province_buildings,
+        ("provinces.csv", "building_types.csv"),
+    ),
+    ("country_economy.csv", convert_country_economy, import_country_economy, ()),
+    ("unit_types.csv", convert_unit_type, import_unit_types, ()),
+    (
+        "unit_resource_costs.csv",
+        convert_unit_resource_cost,
+        import_unit_resource_costs,
+        ("unit_types.csv", "resources.csv"),
+    ),
+    ("country_units.csv", convert_country_unit, import_country_units, ("unit_types.csv",)),
+    ("modifiers.csv", convert_modifier, import_modifiers, ()),
+    ("building_effects.csv", convert_building_effect, import_building_effects, ("building_types.csv",)),
+    ("country_modifiers.csv", convert_country_modifier, import_country_modifiers, ()),
+]
+ROW_CONVERTERS = {file_name: convert for file_name, convert, _, _ in IMPORT_STEPS}
+
+
+def file_content_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+# import_sources key of the world_state_hash recorded after each import.
+WORLD_STATE_KEY = "world_state"
+# Every table an import, a move or a tick writes.
+WORLD_STATE_TABLES = [*IMPORT_COLUMNS, "country_resources"]
+
+
+def world_state_hash(cursor):
+    """Hash of the contents of WORLD_STATE_TABLES, to tell whether the world changed since the last import."""
+    digest = hashlib.sha256()
+    for table in WORLD_STATE_TABLES:
+        digest.update(table.encode("utf-8"))
+        cursor.execute(f"SELECT * FROM {table} ORDER BY rowid")
+        for row in cursor:
+            digest.update(repr(row).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def parse_source(data_dir, file_name):
+    return parse_csv(data_file(data_dir, file_name), ROW_CONVERTERS[file_name])
+
+
+def parse_sources(data_dir, file_names, workers=1):
+    """
+    Parse and type-check the given scenario files, in a worker pool when
+    workers > 1. Returns {file: rows} and every row error, in file order.
+    """
+    if workers > 1 and len(file_names) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(file_names))) as executor:
+            results = list(executor.map(partial(parse_source, data_dir), file_names))
+    else:
+        results = [parse_source(data_dir, file_name) for file_name in file_names]
+
+    parsed = {}
+    errors = []
+    for file_name, (rows, file_errors) in zip(file_names, results):
+        parsed[file_name] = rows
+        errors.extend(file_errors)
+    return parsed, errors
+
+
+def import_scenario(cursor, data_dir, full=False, workers=1):
+    """
+    Import the scenario CSVs and refresh the economy snapshot.
+
+    Files whose content hash matches the last import, and whose name lookups
+    did not change, are skipped. The rest are parsed and validated first
+    (see parse_sources), so every bad row is reported before anything is
+    written, then inserted in dependency order. Only the countries the
+    written rows affect are refreshed, unless full is set or config.ini changed.
+
+    The hashes only describe the database while it is still as the last
+    import left it. If moves, ticks or edits changed it since (see
+    world_state_hash), every file is compared with the database and every
+    country is refreshed, as a full import does.
+    """
+    ensure_import_sources_table(cursor)
+    ensure_dirty_country_tracking(cursor)
+    previous_hashes = {} if full else get_import_hashes(cursor)
+    state_hash = world_state_hash(cursor) if previous_hashes else None
+    if previous_hashes and previous_hashes.get(WORLD_STATE_KEY) != state_hash:
+        print("⚠ The world changed since the last import (moves, ticks or edits); comparing every file.")
+        previous_hashes = {}
+
+    content_hashes = {}
+    for file_name, _, _, depends_on in IMPORT_STEPS:
+        content_hash = file_content_hash(data_file(data_dir, file_name))
+        if previous_hashes.get(file_name) != content_hash or content_hashes.keys() & set(depends_on):
+            content_hashes[file_name] = content_hash
+
+    parsed, errors = parse_sources(data_dir, list(content_hashes), workers)
+    if errors:
+        for error in errors:
+            print(f"❌ {error}")
+        raise ScenarioValidationError(errors)
+
+    affected = set()
+    for file_name, _, import_rows, _ in IMPORT_STEPS:
+        if file_name in parsed:
+            affected |= import_rows(cursor, parsed[file_name])
+            record_import_hash(cursor, file_name, content_hashes[file_name])
+
+    config_hash = file_content_hash(CONFIG_FILE)
+    config_changed = previous_hashes.get(CONFIG_FILE) != config_hash
+    record_import_hash(cursor, CONFIG_FILE, config_hash)
+
+    skipped = len(IMPORT_STEPS) - len(parsed)
+    print(f"📄 Imported {len(parsed)} changed source files, skipped {skipped} unchanged.")
+    refreshed = None if full or config_changed else affected
+    import_economy_snapshot(cursor, refreshed)
+    if parsed or refreshed is None:
+        # Otherwise nothing was written since state_hash was taken.
+        state_hash = world_state_hash(cursor)
+    record_import_hash(cursor, WORLD_STATE_KEY, state_hash)
+    return list(parsed)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Import scenario CSV data and the initial economy snapshot.")
+    parser.add_argument("scenario", nargs="?", help="Optional data subfolder, for example 'Diadochi 322 AC'")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to parse and validate the CSV files (default: 1)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Reimport every file and refresh every country even if nothing changed since the last import",
+    )
+    return parser.parse_args()
+
+
 def main():
-    scenario_name = sys.argv[1] if len(sys.argv) > 1 else None
-    data_dir = resolve_data_dir(scenario_name)
+    args = parse_args()
+    data_dir = resolve_data_dir(args.scenario)
     conn = get_connection()
     conn.execute("PRAGMA foreign_keys = ON;")
     cursor = conn.cursor()
+    # Only a world that is being built from scratch can be rebuilt from the
+    # CSVs if the unsynced writes are lost; incremental and --full imports
+    # into a live campaign keep the default durability.
+    if is_empty_world(cursor):
+        apply_bulk_load_pragmas(conn)
 
     try:
-        import_resources(cursor, data_dir)
-        import_cultures(cursor, data_dir)
-        import_countries(cursor, data_dir)
-        import_provinces(cursor, data_dir)
-        import_building_types(cursor, data_dir)
-        import_building_resource_costs(cursor, data_dir)
-        import_province_buildings(cursor, data_dir)
-        import_country_economy(cursor, data_dir)
-        import_unit_types(cursor, data_dir)
-        import_unit_resource_costs(cursor, data_dir)
-        import_country_units(cursor, data_dir)
-        import_modifiers(cursor, data_dir)
-        import_building_effects(cursor, data_dir)
-        import_country_modifiers(cursor, data_dir)
-        import_economy_snapshot(cursor)
+        import_scenario(cursor, data_dir, full=args.full, workers=max(1, args.workers))
 
         conn.commit()
         print(f"🌍 World data and economy snapshot imported successfully from {data_dir}.")
 
+    except ScenarioValidationError as e:
+        conn.rollback()
+        print(f"❌ Import aborted: {e}. Nothing was written.")
+        sys.exit(1)
+
     except Exception as e:
         conn.rollback()
         print("❌ Import failed. All changes have been rolled back.")
@@ -1,7 +1,10 @@
-from db_utils import get_connection
+from db_utils import ensure_player_moves_indexes, get_connection
 import csv
 import os
+import re
 import sys
+import time
+from itertools import islice
 
 MOVES_FOLDER = "moves"
 
@@ -34,22 +37,129 @@ def get_moves_file(moves_dir, turn_number):
     return filename
 
 
+def parse_turns(value):
+    """'N' -> (N, N), 'N-M' -> (N, M), 'N-' -> (N, None), 'all' -> (None, None)."""
+    if value.lower() == "all":
+        return None, None
+    first, separator, last = value.partition("-")
+    first_turn = int(first)
+    if not separator:
+        return first_turn, first_turn
+    last_turn = int(last) if last else None
+    if last_turn is not None and last_turn < first_turn:
+        raise ValueError(value)
+    return first_turn, last_turn
+
+
 def parse_args(argv):
     if len(argv) < 2:
-        print("Usage: py import_moves.py TURN_NUMBER [MOVES_SUBFOLDER]")
+        print("Usage: py import_moves.py TURN_NUMBER|FIRST-LAST|FIRST-|all [MOVES_SUBFOLDER]")
         print('Example: py import_moves.py 1 "Diadochi 322 AC Partita 1"')
+        print('Example: py import_moves.py all "Diadochi 322 AC Partita 1"')
         sys.exit(1)
 
     try:
-        turn_number = int(argv[1])
+        first_turn, last_turn = parse_turns(argv[1])
     except ValueError:
-        print(f"❌ Invalid turn number: '{argv[1]}' — must be an integer.")
+        print(f"❌ Invalid turn number: '{argv[1]}' — must be an integer, a range like 3-10 or 3-, or 'all'.")
         sys.exit(1)
 
     moves_subfolder = argv[2] if len(argv) > 2 else None
-    return turn_number, moves_subfolder
-
-
+    return first_turn, last_turn, moves_subfolder
+
+
+REQUIRED_MOVE_COLUMNS = {
+    "country_code",
+    "move_type",
+    "province_id",
+    "building_type_id",
+    "unit_type_id",
+    "amount",
+    "notes"
+}
+IMPORT_CHUNK_SIZE = 5000
+MOVES_FILE_PATTERN = re.compile(r"^player_moves_turn_(\d+)\.csv$")
+
+INSERT_MOVE_SQL = """
+    INSERT INTO player_moves (
+        turn,
+        country_code,
+        move_type,
+        target_province_id,
+        target_building_type_id,
+        target_unit_type_id,
+        target_country_code,
+        target_resource_id,
+        trade_resource_id,
+        price_per_unit,
+        amount,
+        notes,
+        processed
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+"""
+
+
+def read_move_rows(reader, turn_number):
+    for row in reader:
+        yield (
+            turn_number,
+            clean(row.get("country_code")),
+            clean(row.get("move_type")),
+            clean(row.get("province_id")),
+            clean(row.get("building_type_id")),
+            clean(row.get("unit_type_id")),
+            clean(row.get("target_country_code")),
+            clean(row.get("target_resource_id")),
+            clean(row.get("trade_resource_id")),
+            int(row.get("price_per_unit", 0) or 0),
+            int(row.get("amount", 1) or 1),
+            clean(row.get("notes"))
+        )
+
+
+def insert_moves_file(cursor, turn_number, filename, chunk_size=IMPORT_CHUNK_SIZE):
+    """
+    Stream one turn file into player_moves, chunk_size rows per executemany.
+    Returns the number of moves, or None when required columns are missing.
+    """
+    with open(filename, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        missing = REQUIRED_MOVE_COLUMNS - set(reader.fieldnames or [])
+        if missing:
+            print(f"❌ Missing CSV columns: {missing}")
+            return None
+
+        rows = read_move_rows(reader, turn_number)
+        move_count = 0
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            cursor.executemany(INSERT_MOVE_SQL, chunk)
+            move_count += len(chunk)
+    return move_count
+
+
+def find_moves_files(moves_dir, first_turn=None, last_turn=None):
+    """(turn, path) for every player_moves_turn_<n>.csv in moves_dir within the range, by turn."""
+    files = []
+    for name in os.listdir(moves_dir):
+        match = MOVES_FILE_PATTERN.match(name)
+        if not match:
+            continue
+        turn = int(match.group(1))
+        if first_turn is not None and turn < first_turn:
+            continue
+        if last_turn is not None and turn > last_turn:
+            continue
+        files.append((turn, os.path.join(moves_dir, name)))
+    return sorted(files)
+
+
+def get_imported_turns(cursor):
+    cursor.execute("SELECT DISTINCT turn FROM player_moves")
+    return {row[0] for row in cursor.fetchall()}
 
 
 def import_player_moves(turn_number, moves_subfolder=None):
@@ -61,70 +171,18 @@ def import_player_moves(turn_number, moves_subfolder=None):
     cursor = conn.cursor()
 
     try:
-        
+        ensure_player_moves_indexes(cursor)
+
         cursor.execute("SELECT COUNT(*) FROM player_moves WHERE turn = ?", (turn_number,))
         if cursor.fetchone()[0] > 0:
             print(f"⚠ Turn {turn_number} already imported. Aborting.")
             conn.close()
             return
 
-        
-        with open(filename, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            
-            required_fields = {
-                "country_code",
-                "move_type",
-                "province_id",
-                "building_type_id",
-                "unit_type_id",
-                "amount",
-                "notes"
-            }
-
-            missing = required_fields - set(reader.fieldnames)
-            if missing:
-                print(f"❌ Missing CSV columns: {missing}")
-                conn.close()
-                return
-
-            move_count = 0
-
-            for row in reader:
-                cursor.execute("""
-                    INSERT INTO player_moves (
-                        turn,
-                        country_code,
-                        move_type,
-                        target_province_id,
-                        target_building_type_id,
-                        target_unit_type_id,
-                        target_country_code,
-                        target_resource_id,
-                        trade_resource_id,
-                        price_per_unit,
-                        amount,
-                        notes,
-                        processed
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
-                """, (
-                    turn_number,
-                    clean(row.get("country_code")),
-                    clean(row.get("move_type")),
-                    clean(row.get("province_id")),
-                    clean(row.get("building_type_id")),
-                    clean(row.get("unit_type_id")),
-                    clean(row.get("target_country_code")),
-                    clean(row.get("target_resource_id")),
-                    clean(row.get("trade_resource_id")),
-                    int(row.get("price_per_unit", 0) or 0),
-                    int(row.get("amount", 1) or 1),
-                    clean(row.get("notes"))
-                ))
-
-                move_count += 1
+        move_count = insert_moves_file(cursor, turn_number, filename)
+        if move_count is None:
+            conn.close()
+            return
 
         conn.commit()
         print(f"✅ Imported {move_count} moves for turn {turn_number} from {filename}")
@@ -138,8 +196,72 @@ def import_player_moves(turn_number, moves_subfolder=None):
         conn.close()
 
 
+def import_player_moves_bulk(moves_subfolder=None, first_turn=None, last_turn=None):
+    """
+    Import every turn file in the moves folder (optionally only first_turn..last_turn).
+    Turns that already have moves are skipped. Each file is committed on its
+    own, and the import stops at the first failing file, so a rerun resumes there.
+    """
+    moves_dir = resolve_moves_dir(moves_subfolder)
+    files = find_moves_files(moves_dir, first_turn, last_turn)
+    if not files:
+        print(f"⚠ No player_moves_turn_<n>.csv files found in {moves_dir}")
+        return
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        ensure_player_moves_indexes(cursor)
+        conn.commit()
+        imported_turns = get_imported_turns(cursor)
+
+        total_moves = 0
+        total_files = 0
+        started = time.perf_counter()
+        for turn_number, filename in files:
+            if turn_number in imported_turns:
+                print(f"⏭ Turn {turn_number} already imported, skipped.")
+                continue
+
+            file_started = time.perf_counter()
+            try:
+                move_count = insert_moves_file(cursor, turn_number, filename)
+                if move_count is None:
+                    conn.rollback()
+                    print(f"❌ Stopped at turn {turn_number}. Fix {filename} and rerun to continue.")
+                    return
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                print(f"❌ Import of turn {turn_number} failed. Transaction rolled back.")
+                print("ERROR:", e)
+                print(f"❌ Stopped at turn {turn_number}. Fix {filename} and rerun to continue.")
+                return
+
+            elapsed = time.perf_counter() - file_started
+            total_moves += move_count
+            total_files += 1
+            print(
+                f"✅ Turn {turn_number}: {move_count} moves from {filename} "
+                f"({elapsed:.2f}s, {move_count / max(elapsed, 1e-9):,.0f} moves/s)"
+            )
+
+        elapsed = time.perf_counter() - started
+        print(
+            f"\n✅ Imported {total_moves} moves from {total_files} files in {elapsed:.2f}s "
+            f"({total_moves / max(elapsed, 1e-9):,.0f} moves/s), "
+            f"skipped {len(files) - total_files} already imported turns."
+        )
+
+    finally:
+        conn.close()
+
+
 
 
 if __name__ == "__main__":
-    turn_number, moves_subfolder = parse_args(sys.argv)
-    import_player_moves(turn_number, moves_subfolder)
+    first_turn, last_turn, moves_subfolder = parse_args(sys.argv)
+    if first_turn is not None and first_turn == last_turn:
+        import_player_moves(first_turn, moves_subfolder)
+    else:
+        import_player_moves_bulk(moves_subfolder, first_turn, last_turn)
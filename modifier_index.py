@@ -0,0 +1,88 @@
+"""
+Precomputed modifier lookups.
+
+ModifierIndex loads modifiers, country_modifiers and the building effect
+totals of every country (building_effects x province_buildings x provinces)
+with three queries and then answers the same questions as
+get_country_modifier, get_building_country_modifier,
+get_building_effect_total and get_additive_modifier in economy_tick.py
+without touching the database.
+"""
+
+
+# Above this many countries a filtered load is no cheaper than loading everything.
+MAX_FILTERED_COUNTRIES = 500
+
+
+def country_filter(column, country_codes):
+    """Return ([condition], params) restricting column to country_codes, or ([], ()) for every country."""
+    if country_codes is None or len(country_codes) > MAX_FILTERED_COUNTRIES:
+        return [], ()
+    placeholders = ",".join("?" for _ in country_codes)
+    return [f"{column} IN ({placeholders})"], tuple(country_codes)
+
+
+def where_clause(conditions):
+    return f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+
+class ModifierIndex:
+    """O(1) lookups for modifier defaults, country modifiers and building effect totals."""
+
+    def __init__(self, defaults, country_values, building_totals):
+        self.defaults = defaults
+        self.country_values = country_values
+        self.building_totals = building_totals
+
+    @classmethod
+    def load(cls, cursor, country_codes=None):
+        """Build the index for every country, or only for country_codes when given."""
+        if country_codes is not None:
+            country_codes = list(country_codes)
+
+        cursor.execute("SELECT modifier_key, default_value FROM modifiers")
+        defaults = {key: default_value for key, default_value in cursor.fetchall()}
+
+        conditions, params = country_filter("country_code", country_codes)
+        cursor.execute(
+            f"SELECT country_code, modifier_key, value FROM country_modifiers {where_clause(conditions)}", params
+        )
+        country_values = {(country, key): value for country, key, value in cursor.fetchall()}
+
+        # Rows are summed in the same order the per-country SUM() scans them,
+        # so the totals match get_building_effect_total bit for bit.
+        conditions, params = country_filter("p.owner_country_code", country_codes)
+        conditions.insert(0, "be.scope IN ('country', 'province')")
+        cursor.execute(f"""
+            SELECT p.owner_country_code, be.modifier_key, be.value * pb.amount
+            FROM province_buildings pb
+            JOIN building_effects be ON pb.building_type_id = be.building_type_id
+            JOIN provinces p ON pb.province_id = p.id
+            {where_clause(conditions)}
+            ORDER BY pb.rowid, be.scope
+        """, params)
+        building_totals = {}
+        for country, key, value in cursor.fetchall():
+            if value is None:
+                continue
+            building_totals[(country, key)] = building_totals.get((country, key), 0) + value
+
+        return cls(defaults, country_values, building_totals)
+
+    def base_value(self, key, fallback):
+        return self.defaults[key] if key in self.defaults else fallback
+
+    def country_value(self, country, key):
+        return self.country_values.get((country, key), 0.0)
+
+    def building_total(self, country, key):
+        return self.building_totals.get((country, key), 0) or 0.0
+
+    def country_modifier(self, country, key):
+        return self.base_value(key, 1.0) * (1 + self.country_value(country, key))
+
+    def building_country_modifier(self, country, key):
+        return 1 + self.building_total(country, key)
+
+    def additive_modifier(self, country, key):
+        return self.base_value(key, 0.0) + self.country_value(country, key) + self.building_total(country, key)
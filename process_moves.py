@@ -1,14 +1,34 @@
-from db_utils import get_connection
-import configparser
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from db_utils import (
+    copy_database_to_memory,
+    ensure_dirty_country_tracking,
+    ensure_player_moves_indexes,
+    get_connection,
+    integer_affinity,
+    real_affinity,
+)
 from economy_tick import get_land_unit_cap, get_navy_unit_cap
+from modifier_index import ModifierIndex
+from settings import get_settings
 
 
 
-config = configparser.ConfigParser()
-config.read("config.ini")
+settings = get_settings()
 
-MOVE_LOGGING = config.getboolean("moves", "logging", fallback=True)
-BATCH_VALIDATE = config.getboolean("moves", "batch_validation", fallback=True)
+MOVE_LOGGING = settings.moves.logging
+BATCH_VALIDATE = settings.moves.batch_validation
+BATCH_EXECUTE = settings.moves.batch_execution
+PREVALIDATE = settings.moves.prevalidation
+VALIDATION_WORKERS = settings.moves.validation_workers
+PARALLEL_MIN_MOVES = settings.moves.parallel_min_moves
+MOVE_CHUNK_SIZE = settings.moves.chunk_size
+
+POLITICAL_MOVE_TYPES = ["declare_war", "make_peace", "anti_corruption",
+                        "stabilize", "reduce_unrest", "propaganda_campaign", "war_effort"]
+TRADE_MOVE_TYPES = ["trade_resource_for_money", "trade_resource_for_resource"]
 
 
 
@@ -17,6 +37,48 @@ def log(msg):
         print(msg)
 
 
+class Move:
+    """One player_moves row plus the results validation attaches to it."""
+
+    __slots__ = (
+        "id",
+        "turn",
+        "country_code",
+        "move_type",
+        "target_province_id",
+        "target_building_type_id",
+        "target_unit_type_id",
+        "target_country_code",
+        "target_resource_id",
+        "trade_resource_id",
+        "price_per_unit",
+        "amount",
+        "cost",
+        "resource_costs",
+        "trade",
+    )
+
+    def __init__(self, id, turn, country_code, move_type, target_province_id, target_building_type_id,
+                 target_unit_type_id, target_country_code, target_resource_id, trade_resource_id,
+                 price_per_unit, amount):
+        self.id = id
+        self.turn = turn
+        self.country_code = country_code
+        self.move_type = move_type
+        self.target_province_id = target_province_id
+        self.target_building_type_id = target_building_type_id
+        self.target_unit_type_id = target_unit_type_id
+        self.target_country_code = target_country_code
+        self.target_resource_id = target_resource_id
+        self.trade_resource_id = trade_resource_id
+        self.price_per_unit = price_per_unit or 0
+        self.amount = amount or 1
+        # Set by validation for approved moves.
+        self.cost = 0
+        self.resource_costs = None
+        self.trade = None
+
+
 def get_country_treasuries(cursor):
     cursor.execute("SELECT country_code, treasury FROM country_economy")
     return {c: t for c, t in cursor.fetchall()}
@@ -56,87 +118,164 @@ def get_country_politics(cursor, country_code):
     }
 
 
-def province_owned_by(cursor, province_id, country):
-    cursor.execute("""
-        SELECT 1 FROM provinces
-        WHERE id = ? AND owner_country_code = ?
-    """, (province_id, country))
-    return cursor.fetchone() is not None
-
-
-def building_exists(cursor, building_type_id):
-    cursor.execute("SELECT 1 FROM building_types WHERE id = ?", (building_type_id,))
-    return cursor.fetchone() is not None
-
-
-def unit_exists(cursor, unit_type_id):
-    cursor.execute("SELECT 1 FROM unit_types WHERE id = ?", (unit_type_id,))
-    return cursor.fetchone() is not None
+def get_resource_name(cursor, resource_id):
+    cursor.execute("SELECT name FROM resources WHERE id = ?", (resource_id,))
+    row = cursor.fetchone()
+    return row[0] if row else f"resource_{resource_id}"
 
-def country_exists(cursor, country_code):
-    cursor.execute("SELECT 1 FROM countries WHERE code = ?", (country_code,))
-    return cursor.fetchone() is not None
 
+class MoveValidationContext:
+    """Reference data needed to validate a batch of moves, loaded once per batch."""
+
+    def __init__(self, countries, resource_names, province_owners, building_costs,
+                 unit_types, building_resource_costs, unit_resource_costs):
+        self.countries = countries
+        self.resource_names = resource_names
+        self.province_owners = province_owners
+        self.building_costs = building_costs
+        self.unit_types = unit_types
+        self.building_resource_costs = building_resource_costs
+        self.unit_resource_costs = unit_resource_costs
+
+    @classmethod
+    def load(cls, cursor):
+        cursor.execute("SELECT code FROM countries")
+        countries = {row[0] for row in cursor.fetchall()}
+        cursor.execute("SELECT id, name FROM resources")
+        resource_names = dict(cursor.fetchall())
+        cursor.execute("SELECT id, owner_country_code FROM provinces")
+        province_owners = dict(cursor.fetchall())
+        cursor.execute("SELECT id, base_cost FROM building_types")
+        building_costs = dict(cursor.fetchall())
+        cursor.execute("SELECT id, recruitment_cost, unit_category FROM unit_types")
+        unit_types = {unit_type_id: (cost, category) for unit_type_id, cost, category in cursor.fetchall()}
+        return cls(
+            countries,
+            resource_names,
+            province_owners,
+            building_costs,
+            unit_types,
+            load_resource_costs(cursor, "building_resource_costs", "building_type_id"),
+            load_resource_costs(cursor, "unit_resource_costs", "unit_type_id"),
+        )
 
-def resource_exists(cursor, resource_id):
-    cursor.execute("SELECT 1 FROM resources WHERE id = ?", (resource_id,))
-    return cursor.fetchone() is not None
+    def province_owned_by(self, province_id, country):
+        return self.province_owners.get(province_id) == country
 
+    def resource_exists(self, resource_id):
+        return resource_id in self.resource_names
 
-def get_resource_name(cursor, resource_id):
-    cursor.execute("SELECT name FROM resources WHERE id = ?", (resource_id,))
-    row = cursor.fetchone()
-    return row[0] if row else f"resource_{resource_id}"
+    def get_resource_name(self, resource_id):
+        return self.resource_names.get(resource_id, f"resource_{resource_id}")
 
+    def get_building_resource_costs(self, building_type_id, amount):
+        return {
+            resource_id: per_unit * amount
+            for resource_id, per_unit in self.building_resource_costs.get(building_type_id, ())
+        }
 
-def get_building_resource_costs(cursor, building_type_id, amount):
-    cursor.execute("""
-        SELECT resource_id, amount_per_unit
-        FROM building_resource_costs
-        WHERE building_type_id = ?
-    """, (building_type_id,))
-    return {resource_id: per_unit * amount for resource_id, per_unit in cursor.fetchall()}
+    def get_unit_resource_costs(self, unit_type_id, amount):
+        return {
+            resource_id: per_unit * amount
+            for resource_id, per_unit in self.unit_resource_costs.get(unit_type_id, ())
+        }
 
 
-def get_unit_resource_costs(cursor, unit_type_id, amount):
-    cursor.execute("""
-        SELECT resource_id, amount_per_unit
-        FROM unit_resource_costs
-        WHERE unit_type_id = ?
-    """, (unit_type_id,))
-    return {resource_id: per_unit * amount for resource_id, per_unit in cursor.fetchall()}
+def load_resource_costs(cursor, table, key_column):
+    """Group a *_resource_costs table by its type id, in primary key order."""
+    cursor.execute(f"""
+        SELECT {key_column}, resource_id, amount_per_unit
+        FROM {table}
+        ORDER BY {key_column}, resource_id
+    """)
+    costs = {}
+    for type_id, resource_id, per_unit in cursor.fetchall():
+        costs.setdefault(type_id, []).append((resource_id, per_unit))
+    return costs
 
 
-def get_unit_category(cursor, unit_type_id):
-    cursor.execute("SELECT unit_category FROM unit_types WHERE id = ?", (unit_type_id,))
-    row = cursor.fetchone()
-    return row[0] if row else None
+def get_move_state(cursor):
+    """Snapshot every per-country value validate_moves reads, one grouped query per table.
 
+    Treasuries, stockpiles and unit counts are updated as moves are approved;
+    politics, populations and coastal province counts stay as loaded.
+    """
+    treasuries = get_country_treasuries(cursor)
 
-def get_current_unit_count(cursor, country_code, unit_category):
+    unit_counts = {country_code: {"land": 0, "naval": 0} for country_code in treasuries}
     cursor.execute("""
-        SELECT COALESCE(SUM(cu.amount), 0)
+        SELECT cu.country_code, ut.unit_category, COALESCE(SUM(cu.amount), 0)
         FROM country_units cu
         JOIN unit_types ut ON cu.unit_type_id = ut.id
-        WHERE cu.country_code = ? AND ut.unit_category = ?
-    """, (country_code, unit_category))
-    return cursor.fetchone()[0] or 0
+        WHERE ut.unit_category IN ('land', 'naval')
+        GROUP BY cu.country_code, ut.unit_category
+    """)
+    for country_code, unit_category, amount in cursor.fetchall():
+        if country_code in unit_counts:
+            unit_counts[country_code][unit_category] = amount or 0
+
+    cursor.execute("""
+        SELECT code, stability, unrest, corruption, at_war, war_exhaustion
+        FROM countries
+    """)
+    politics = {
+        code: {
+            'stability': stability,
+            'unrest': unrest,
+            'corruption': corruption,
+            'at_war': at_war,
+            'war_exhaustion': war_exhaustion
+        }
+        for code, stability, unrest, corruption, at_war, war_exhaustion in cursor.fetchall()
+    }
 
+    populations = {}
+    coastal_provinces = {}
+    cursor.execute("""
+        SELECT owner_country_code, SUM(population), SUM(is_naval = 1)
+        FROM provinces
+        WHERE owner_country_code IS NOT NULL
+        GROUP BY owner_country_code
+    """)
+    for country_code, population, coastal_count in cursor.fetchall():
+        populations[country_code] = population or 0
+        coastal_provinces[country_code] = coastal_count or 0
 
-def get_move_state(cursor):
     return {
-        "treasuries": get_country_treasuries(cursor),
+        "treasuries": treasuries,
         "resource_stockpiles": get_country_resource_stockpiles(cursor),
-        "unit_counts": {
-            country_code: {
-                "land": get_current_unit_count(cursor, country_code, "land"),
-                "naval": get_current_unit_count(cursor, country_code, "naval"),
-            }
-            for country_code in get_country_treasuries(cursor)
-        },
+        "unit_counts": unit_counts,
+        "politics": politics,
+        "populations": populations,
+        "coastal_provinces": coastal_provinces,
+        "unit_caps": {},
+        "unit_cap_hits": 0,
     }
 
 
+def get_unit_cap(cursor, state, country, unit_category, modifier_index):
+    """Land or naval unit cap for a country from the move state snapshot.
+
+    Caps depend on population, coastal provinces, modifiers and buildings.
+    Moves are only executed after the whole batch is validated, so nothing
+    can change them mid-batch and each cap is computed once per country.
+    """
+    key = (country, unit_category)
+    unit_caps = state["unit_caps"]
+    if key in unit_caps:
+        state["unit_cap_hits"] += 1
+        return unit_caps[key]
+
+    if unit_category == "land":
+        unit_cap = get_land_unit_cap(cursor, country, modifier_index, population=state["populations"].get(country, 0))
+    else:
+        unit_cap = get_navy_unit_cap(
+            cursor, country, modifier_index, coastal_count=state["coastal_provinces"].get(country, 0)
+        )
+    unit_caps[key] = unit_cap
+    return unit_cap
+
+
 def reserve_resource_costs(resource_stockpiles, country_code, resource_costs):
     country_stock = resource_stockpiles.setdefault(country_code, {})
     for resource_id, required in resource_costs.items():
@@ -152,27 +291,27 @@ def apply_resource_costs(cursor, country_code, resource_costs):
         """, (required, country_code, resource_id))
 
 
-def validate_trade_move(cursor, move, treasuries, resource_stockpiles):
-    country = move["country_code"]
-    partner = move["target_country_code"]
-    amount = move["amount"]
-    resource_id = move["target_resource_id"]
-    move_type = move["move_type"]
+def validate_trade_move(context, move, treasuries, resource_stockpiles):
+    country = move.country_code
+    partner = move.target_country_code
+    amount = move.amount
+    resource_id = move.target_resource_id
+    move_type = move.move_type
 
     if not partner:
         return False, "Trade move missing target_country_code"
-    if not country_exists(cursor, partner):
+    if partner not in context.countries:
         return False, f"Trade target country does not exist: {partner}"
     if partner == country:
         return False, "Trade target country cannot be the same as source country"
-    if not resource_id or not resource_exists(cursor, resource_id):
+    if not resource_id or not context.resource_exists(resource_id):
         return False, f"Invalid target_resource_id: {resource_id}"
 
     source_stock = resource_stockpiles.setdefault(country, {})
     partner_stock = resource_stockpiles.setdefault(partner, {})
 
     if move_type == "trade_resource_for_money":
-        price_per_unit = int(move.get("price_per_unit") or 0)
+        price_per_unit = int(move.price_per_unit or 0)
         if price_per_unit <= 0:
             return False, "trade_resource_for_money requires price_per_unit > 0"
 
@@ -188,7 +327,7 @@ def validate_trade_move(cursor, move, treasuries, resource_stockpiles):
         treasuries[partner] -= total_price
         treasuries[country] += total_price
 
-        move["__trade"] = {
+        move.trade = {
             "kind": "money",
             "source_country": country,
             "target_country": partner,
@@ -197,12 +336,12 @@ def validate_trade_move(cursor, move, treasuries, resource_stockpiles):
             "price_per_unit": price_per_unit,
             "total_price": total_price
         }
-        move["__cost"] = 0
+        move.cost = 0
         return True, "OK"
 
     if move_type == "trade_resource_for_resource":
-        requested_resource_id = move["trade_resource_id"]
-        if not requested_resource_id or not resource_exists(cursor, requested_resource_id):
+        requested_resource_id = move.trade_resource_id
+        if not requested_resource_id or not context.resource_exists(requested_resource_id):
             return False, f"Invalid trade_resource_id: {requested_resource_id}"
         if requested_resource_id == resource_id:
             return False, "trade_resource_for_resource requires two different resources"
@@ -217,7 +356,7 @@ def validate_trade_move(cursor, move, treasuries, resource_stockpiles):
         partner_stock[requested_resource_id] = partner_stock.get(requested_resource_id, 0) - amount
         source_stock[requested_resource_id] = source_stock.get(requested_resource_id, 0) + amount
 
-        move["__trade"] = {
+        move.trade = {
             "kind": "resource",
             "source_country": country,
             "target_country": partner,
@@ -225,45 +364,44 @@ def validate_trade_move(cursor, move, treasuries, resource_stockpiles):
             "requested_resource_id": requested_resource_id,
             "amount": amount
         }
-        move["__cost"] = 0
+        move.cost = 0
         return True, "OK"
 
     return False, f"Unknown trade move type: {move_type}"
 
 
 
-def validate_political_move(cursor, move, treasuries):
+def validate_political_move(move, treasuries, politics_by_country):
     """Validate political action moves."""
-    country = move["country_code"]
-    amt = move["amount"]
-    move_type = move["move_type"]
+    country = move.country_code
+    amt = move.amount
+    move_type = move.move_type
     
     
-    politics = get_country_politics(cursor, country)
+    politics = politics_by_country.get(country)
     if not politics:
         return False, f"{country} has no political data"
     
-    config = configparser.ConfigParser()
-    config.read("config.ini")
+    actions = settings.political_actions
     
     
     cost = 0
     if move_type == "anti_corruption":
-        cost = amt * float(config["political_actions"]["anti_corruption_cost_per_unit"])
+        cost = amt * actions.anti_corruption_cost_per_unit
         if politics['corruption'] <= 0:
             return False, f"{country} has no corruption to reduce"
     elif move_type == "stabilize":
-        cost = amt * float(config["political_actions"]["stabilize_cost_per_unit"])
+        cost = amt * actions.stabilize_cost_per_unit
         if politics['stability'] >= 100:
             return False, f"{country} stability already at maximum"
     elif move_type == "reduce_unrest":
-        cost = amt * float(config["political_actions"]["reduce_unrest_cost_per_unit"])
+        cost = amt * actions.reduce_unrest_cost_per_unit
         if politics['unrest'] <= 0:
             return False, f"{country} has no unrest to reduce"
     elif move_type == "propaganda_campaign":
-        cost = amt * float(config["political_actions"]["propaganda_cost_per_unit"])
+        cost = amt * actions.propaganda_cost_per_unit
     elif move_type == "war_effort":
-        cost = amt * float(config["political_actions"]["war_effort_cost_per_unit"])
+        cost = amt * actions.war_effort_cost_per_unit
         if not politics['at_war']:
             return False, f"{country} is not at war"
         if politics['war_exhaustion'] <= 0:
@@ -284,102 +422,194 @@ def validate_political_move(cursor, move, treasuries):
     
     
     treasuries[country] -= cost
-    move["__cost"] = cost
+    move.cost = cost
     return True, "OK"
 
 
-def validate_moves(cursor, moves, state=None):
+# Rejections that only depend on reference data, in the order validate_moves
+# checks them. Messages are formatted with the move's own fields.
+STATIC_REJECTION_MESSAGES = {
+    "no_economy": "{move.country_code} has no economy record, skipping.",
+    "invalid_amount": "Invalid amount ({move.amount})",
+    "trade_missing_target": "Trade move missing target_country_code",
+    "trade_unknown_target": "Trade target country does not exist: {move.target_country_code}",
+    "trade_same_country": "Trade target country cannot be the same as source country",
+    "invalid_target_resource": "Invalid target_resource_id: {move.target_resource_id}",
+    "trade_price": "trade_resource_for_money requires price_per_unit > 0",
+    "invalid_trade_resource": "Invalid trade_resource_id: {move.trade_resource_id}",
+    "trade_same_resource": "trade_resource_for_resource requires two different resources",
+    "province_not_owned": "{move.country_code} does not own province {move.target_province_id}",
+    "invalid_building": "Invalid building id {move.target_building_type_id}",
+    "invalid_unit": "Invalid unit id {move.target_unit_type_id}",
+    "unknown_unit_category": "Unknown unit category for unit {move.target_unit_type_id}",
+    "unknown_move_type": "Unknown move type '{move.move_type}'",
+}
+
+STATIC_REJECTION_SQL = """
+    SELECT id, reason FROM (
+        SELECT m.id,
+            CASE
+                WHEN e.country_code IS NULL THEN 'no_economy'
+                WHEN m.amount < 0 THEN 'invalid_amount'
+                WHEN m.move_type IN ({political_types}) THEN NULL
+                WHEN m.move_type IN ({trade_types}) THEN CASE
+                    WHEN COALESCE(m.target_country_code, '') = '' THEN 'trade_missing_target'
+                    WHEN tc.code IS NULL THEN 'trade_unknown_target'
+                    WHEN m.target_country_code = m.country_code THEN 'trade_same_country'
+                    WHEN COALESCE(m.target_resource_id, 0) = 0 OR tr.id IS NULL THEN 'invalid_target_resource'
+                    WHEN m.move_type = 'trade_resource_for_money' THEN CASE
+                        WHEN CAST(COALESCE(m.price_per_unit, 0) AS INTEGER) <= 0 THEN 'trade_price'
+                    END
+                    WHEN COALESCE(m.trade_resource_id, 0) = 0 OR rr.id IS NULL THEN 'invalid_trade_resource'
+                    WHEN m.trade_resource_id = m.target_resource_id THEN 'trade_same_resource'
+                END
+                WHEN m.move_type = 'build' THEN CASE
+                    WHEN p.id IS NULL THEN 'province_not_owned'
+                    WHEN bt.id IS NULL THEN 'invalid_building'
+                END
+                WHEN m.move_type = 'recruit' THEN CASE
+                    WHEN ut.id IS NULL THEN 'invalid_unit'
+                    WHEN ut.unit_category IS NULL OR ut.unit_category NOT IN ('land', 'naval')
+                        THEN 'unknown_unit_category'
+                END
+                ELSE 'unknown_move_type'
+            END AS reason
+        FROM player_moves m
+        LEFT JOIN country_economy e ON e.country_code = m.country_code
+        LEFT JOIN countries tc ON tc.code = m.target_country_code
+        LEFT JOIN resources tr ON tr.id = m.target_resource_id
+        LEFT JOIN resources rr ON rr.id = m.trade_resource_id
+        LEFT JOIN provinces p ON p.id = m.target_province_id AND p.owner_country_code = m.country_code
+        LEFT JOIN building_types bt ON bt.id = m.target_building_type_id
+        LEFT JOIN unit_types ut ON ut.id = m.target_unit_type_id
+        WHERE m.processed = 0{key_range_filter}
+    )
+    WHERE reason IS NOT NULL
+"""
+
+
+def prevalidate_moves(cursor, moves, key_range=None):
     """
-    Validates all moves and returns a list of approved ones with __cost set.
+    Reject moves that fail a static check (ownership, unknown ids, bad amounts,
+    invalid trade partners) with one set-based query over player_moves.
+    key_range limits the query to moves between two (turn, id) keys.
+    Returns the moves left for validate_moves and the rejections, with the
+    same messages validate_moves would give.
+    """
+    key_range_filter = ""
+    params = ()
+    if key_range is not None:
+        key_range_filter = " AND (m.turn, m.id) >= (?, ?) AND (m.turn, m.id) <= (?, ?)"
+        params = (*key_range[0], *key_range[1])
+    cursor.execute(STATIC_REJECTION_SQL.format(
+        political_types=", ".join(f"'{move_type}'" for move_type in POLITICAL_MOVE_TYPES),
+        trade_types=", ".join(f"'{move_type}'" for move_type in TRADE_MOVE_TYPES),
+        key_range_filter=key_range_filter,
+    ), params)
+    reasons = dict(cursor.fetchall())
+
+    remaining = []
+    rejected = []
+    for move in moves:
+        reason = reasons.get(move.id)
+        if reason is None:
+            remaining.append(move)
+            continue
+        msg = STATIC_REJECTION_MESSAGES[reason].format(move=move)
+        log(f"❌ Move {move.id}: {msg}")
+        rejected.append((move.id, msg))
+    return remaining, rejected
+
+
+def validate_moves(cursor, moves, state=None, modifier_index=None, context=None, log_rejections=True):
+    """
+    Validates all moves and returns a list of approved ones with cost set.
     Treasuries are tracked in a snapshot so sequential moves from the same
     country correctly account for each other's costs.
     """
     approved = []
     rejected = []
+    log_rejection = log if log_rejections else (lambda msg: None)
     state = state or get_move_state(cursor)
+    if modifier_index is None:
+        modifier_index = ModifierIndex.load(cursor)
+    if context is None:
+        context = MoveValidationContext.load(cursor)
     treasuries = state["treasuries"]
     resource_stockpiles = state["resource_stockpiles"]
     unit_counts = state["unit_counts"]
 
     for move in moves:
-        country = move["country_code"]
-        amt = move["amount"]
+        country = move.country_code
+        amt = move.amount
 
         if country not in treasuries:
             msg = f"{country} has no economy record, skipping."
-            log(f"❌ Move {move['id']}: {msg}")
-            rejected.append((move["id"], msg))
+            log_rejection(f"❌ Move {move.id}: {msg}")
+            rejected.append((move.id, msg))
             continue
 
         if amt <= 0:
             msg = f"Invalid amount ({amt})"
-            log(f"❌ Move {move['id']}: {msg}")
-            rejected.append((move["id"], msg))
+            log_rejection(f"❌ Move {move.id}: {msg}")
+            rejected.append((move.id, msg))
             continue
 
         
-        political_move_types = ["declare_war", "make_peace", "anti_corruption", 
-                               "stabilize", "reduce_unrest", "propaganda_campaign", "war_effort"]
-        trade_move_types = ["trade_resource_for_money", "trade_resource_for_resource"]
-        
-        if move["move_type"] in political_move_types:
-            valid, msg = validate_political_move(cursor, move, treasuries)
+        if move.move_type in POLITICAL_MOVE_TYPES:
+            valid, msg = validate_political_move(move, treasuries, state["politics"])
             if not valid:
-                log(f"❌ Move {move['id']}: {msg}")
-                rejected.append((move["id"], msg))
+                log_rejection(f"❌ Move {move.id}: {msg}")
+                rejected.append((move.id, msg))
                 continue
             approved.append(move)
             continue
 
-        if move["move_type"] in trade_move_types:
-            valid, msg = validate_trade_move(cursor, move, treasuries, resource_stockpiles)
+        if move.move_type in TRADE_MOVE_TYPES:
+            valid, msg = validate_trade_move(context, move, treasuries, resource_stockpiles)
             if not valid:
-                log(f"❌ Move {move['id']}: {msg}")
-                rejected.append((move["id"], msg))
+                log_rejection(f"❌ Move {move.id}: {msg}")
+                rejected.append((move.id, msg))
                 continue
             approved.append(move)
             continue
 
         
-        if move["move_type"] == "build":
-            if not province_owned_by(cursor, move["target_province_id"], country):
-                msg = f"{country} does not own province {move['target_province_id']}"
-                log(f"❌ Move {move['id']}: {msg}")
-                rejected.append((move["id"], msg))
+        if move.move_type == "build":
+            if not context.province_owned_by(move.target_province_id, country):
+                msg = f"{country} does not own province {move.target_province_id}"
+                log_rejection(f"❌ Move {move.id}: {msg}")
+                rejected.append((move.id, msg))
                 continue
 
-            if not building_exists(cursor, move["target_building_type_id"]):
-                msg = f"Invalid building id {move['target_building_type_id']}"
-                log(f"❌ Move {move['id']}: {msg}")
-                rejected.append((move["id"], msg))
+            if move.target_building_type_id not in context.building_costs:
+                msg = f"Invalid building id {move.target_building_type_id}"
+                log_rejection(f"❌ Move {move.id}: {msg}")
+                rejected.append((move.id, msg))
                 continue
 
-            cursor.execute("SELECT base_cost FROM building_types WHERE id = ?", (move["target_building_type_id"],))
-            cost = cursor.fetchone()[0] * amt
-            resource_costs = get_building_resource_costs(cursor, move["target_building_type_id"], amt)
+            cost = context.building_costs[move.target_building_type_id] * amt
+            resource_costs = context.get_building_resource_costs(move.target_building_type_id, amt)
 
-        elif move["move_type"] == "recruit":
-            if not unit_exists(cursor, move["target_unit_type_id"]):
-                msg = f"Invalid unit id {move['target_unit_type_id']}"
-                log(f"❌ Move {move['id']}: {msg}")
-                rejected.append((move["id"], msg))
+        elif move.move_type == "recruit":
+            if move.target_unit_type_id not in context.unit_types:
+                msg = f"Invalid unit id {move.target_unit_type_id}"
+                log_rejection(f"❌ Move {move.id}: {msg}")
+                rejected.append((move.id, msg))
                 continue
 
-            cursor.execute("SELECT recruitment_cost FROM unit_types WHERE id = ?", (move["target_unit_type_id"],))
-            cost = cursor.fetchone()[0] * amt
-            resource_costs = get_unit_resource_costs(cursor, move["target_unit_type_id"], amt)
-            unit_category = get_unit_category(cursor, move["target_unit_type_id"])
+            recruitment_cost, unit_category = context.unit_types[move.target_unit_type_id]
+            cost = recruitment_cost * amt
+            resource_costs = context.get_unit_resource_costs(move.target_unit_type_id, amt)
             country_units = unit_counts.setdefault(country, {"land": 0, "naval": 0})
             current_units = country_units.get(unit_category, 0)
 
-            if unit_category == "land":
-                unit_cap = get_land_unit_cap(cursor, country)
-            elif unit_category == "naval":
-                unit_cap = get_navy_unit_cap(cursor, country)
+            if unit_category in ("land", "naval"):
+                unit_cap = get_unit_cap(cursor, state, country, unit_category, modifier_index)
             else:
-                msg = f"Unknown unit category for unit {move['target_unit_type_id']}"
-                log(f"❌ Move {move['id']}: {msg}")
-                rejected.append((move["id"], msg))
+                msg = f"Unknown unit category for unit {move.target_unit_type_id}"
+                log_rejection(f"❌ Move {move.id}: {msg}")
+                rejected.append((move.id, msg))
                 continue
 
             if current_units + amt > unit_cap:
@@ -387,14 +617,14 @@ def validate_moves(cursor, moves, state=None):
                     f"{country} would exceed {unit_category} unit cap "
                     f"({current_units + amt}/{unit_cap})"
                 )
-                log(f"❌ Move {move['id']}: {msg}")
-                rejected.append((move["id"], msg))
+                log_rejection(f"❌ Move {move.id}: {msg}")
+                rejected.append((move.id, msg))
                 continue
 
         else:
-            msg = f"Unknown move type '{move['move_type']}'"
-            log(f"❌ Move {move['id']}: {msg}")
-            rejected.append((move["id"], msg))
+            msg = f"Unknown move type '{move.move_type}'"
+            log_rejection(f"❌ Move {move.id}: {msg}")
+            rejected.append((move.id, msg))
             continue
 
         country_stock = resource_stockpiles.setdefault(country, {})
@@ -404,108 +634,264 @@ def validate_moves(cursor, moves, state=None):
                 missing_resources.append((resource_id, required, country_stock.get(resource_id, 0)))
         if missing_resources:
             details = ", ".join(
-                f"{get_resource_name(cursor, rid)} needs {need}, has {have}"
+                f"{context.get_resource_name(rid)} needs {need}, has {have}"
                 for rid, need, have in missing_resources
             )
-            msg = f"{country} lacks resources for {move['move_type']}: {details}"
-            log(f"❌ Move {move['id']}: {msg}")
-            rejected.append((move["id"], msg))
+            msg = f"{country} lacks resources for {move.move_type}: {details}"
+            log_rejection(f"❌ Move {move.id}: {msg}")
+            rejected.append((move.id, msg))
             continue
 
         if treasuries[country] < cost:
-            msg = f"{country} cannot afford {move['move_type']} (needs {cost}, has {treasuries[country]})"
-            log(f"❌ Move {move['id']}: {msg}")
-            rejected.append((move["id"], msg))
+            msg = f"{country} cannot afford {move.move_type} (needs {cost}, has {treasuries[country]})"
+            log_rejection(f"❌ Move {move.id}: {msg}")
+            rejected.append((move.id, msg))
             continue
 
         
         
         treasuries[country] -= cost
         reserve_resource_costs(resource_stockpiles, country, resource_costs)
-        move["__cost"] = cost
-        move["__resource_costs"] = resource_costs
-        if move["move_type"] == "recruit":
+        move.cost = cost
+        move.resource_costs = resource_costs
+        if move.move_type == "recruit":
             unit_counts[country][unit_category] += amt
         approved.append(move)
 
     return approved, rejected
 
 
+# Per-country parts of the move state; everything else in it is read-only.
+SHARDED_STATE_KEYS = ("treasuries", "resource_stockpiles", "unit_counts")
 
+# Set in each validation worker process by init_validation_worker.
+worker_reference = None
 
-def execute_political_move(cursor, move):
-    """Execute a political action move."""
-    country = move["country_code"]
-    amt = move["amount"]
-    move_type = move["move_type"]
-    
-    config = configparser.ConfigParser()
-    config.read("config.ini")
+
+def init_validation_worker(reference):
+    global worker_reference
+    worker_reference = reference
+
+
+def validate_country_shard(shard_state, moves):
+    """Validate the moves of a group of countries that take part in no trade."""
+    reference = worker_reference
+    state = {
+        **shard_state,
+        "politics": reference["politics"],
+        "populations": reference["populations"],
+        "coastal_provinces": reference["coastal_provinces"],
+        "unit_caps": {},
+        "unit_cap_hits": 0,
+    }
+    approved, rejected = validate_moves(
+        None,
+        moves,
+        state=state,
+        modifier_index=reference["modifier_index"],
+        context=reference["context"],
+        log_rejections=False,
+    )
+    return approved, rejected, state
+
+
+def split_country_shards(moves_by_country, workers):
+    """Spread countries over at most `workers` shards with similar move counts."""
+    shards = [[] for _ in range(workers)]
+    sizes = [0] * workers
+    for country in sorted(moves_by_country, key=lambda code: -len(moves_by_country[code])):
+        smallest = sizes.index(min(sizes))
+        shards[smallest].append(country)
+        sizes[smallest] += len(moves_by_country[country])
+    return [shard for shard in shards if shard]
+
+
+def validate_moves_parallel(cursor, moves, state, modifier_index, context, workers):
+    """
+    Same result as validate_moves, with independent countries validated in
+    a process pool.
+
+    A trade changes the treasury and stockpiles of both countries, so every
+    move of a country that sends or receives a trade is validated in a
+    sequential reconciliation pass in the original order. The remaining
+    countries only affect themselves and are sharded across the workers.
+    Below PARALLEL_MIN_MOVES, or with nothing to shard, no pool is started.
+    """
+    if len(moves) < PARALLEL_MIN_MOVES:
+        return validate_moves(cursor, moves, state=state, modifier_index=modifier_index, context=context)
+
+    trade_countries = set()
+    for move in moves:
+        if move.move_type in TRADE_MOVE_TYPES:
+            trade_countries.add(move.country_code)
+            trade_countries.add(move.target_country_code)
+
+    sequential_moves = []
+    moves_by_country = {}
+    for move in moves:
+        if move.country_code in trade_countries:
+            sequential_moves.append(move)
+        else:
+            moves_by_country.setdefault(move.country_code, []).append(move)
+    if not moves_by_country:
+        return validate_moves(cursor, moves, state=state, modifier_index=modifier_index, context=context)
+
+    reference = {
+        "politics": state["politics"],
+        "populations": state["populations"],
+        "coastal_provinces": state["coastal_provinces"],
+        "modifier_index": modifier_index,
+        "context": context,
+    }
+    approved = []
+    rejected = []
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_validation_worker, initargs=(reference,)
+    ) as executor:
+        futures = []
+        for shard in split_country_shards(moves_by_country, workers):
+            shard_state = {
+                key: {country: state[key][country] for country in shard if country in state[key]}
+                for key in SHARDED_STATE_KEYS
+            }
+            shard_moves = [move for country in shard for move in moves_by_country[country]]
+            futures.append(executor.submit(validate_country_shard, shard_state, shard_moves))
+
+        sequential_approved, sequential_rejected = validate_moves(
+            cursor, sequential_moves, state=state, modifier_index=modifier_index,
+            context=context, log_rejections=False,
+        )
+        approved.extend(sequential_approved)
+        rejected.extend(sequential_rejected)
+
+        for future in futures:
+            shard_approved, shard_rejected, shard_state = future.result()
+            approved.extend(shard_approved)
+            rejected.extend(shard_rejected)
+            for key in SHARDED_STATE_KEYS:
+                state[key].update(shard_state[key])
+            state["unit_caps"].update(shard_state["unit_caps"])
+            state["unit_cap_hits"] += shard_state["unit_cap_hits"]
+
+    order = {move.id: position for position, move in enumerate(moves)}
+    approved.sort(key=lambda move: order[move.id])
+    rejected.sort(key=lambda rejection: order[rejection[0]])
+    for move_id, msg in rejected:
+        log(f"❌ Move {move_id}: {msg}")
+    return approved, rejected
+
+
+# How the countries table stores each political column.
+POLITICAL_COLUMN_AFFINITY = {
+    "stability": integer_affinity,
+    "unrest": integer_affinity,
+    "corruption": real_affinity,
+    "at_war": integer_affinity,
+    "war_exhaustion": integer_affinity,
+}
+
+
+def apply_political_move(politics, move):
+    """Return the changed political columns and the log message for a political move."""
+    country = move.country_code
+    amt = move.amount
+    move_type = move.move_type
     
+    actions = settings.political_actions
     
-    cursor.execute("""
-        SELECT stability, unrest, corruption, at_war, war_exhaustion
-        FROM countries WHERE code = ?
-    """, (country,))
-    stability, unrest, corruption, at_war, war_exhaustion = cursor.fetchone()
+    stability = politics["stability"]
+    unrest = politics["unrest"]
+    corruption = politics["corruption"]
+    war_exhaustion = politics["war_exhaustion"]
     
     if move_type == "declare_war":
-        cursor.execute("UPDATE countries SET at_war = 1 WHERE code = ?", (country,))
+        changes = {"at_war": 1}
         msg = f"⚔ {country} declared war!"
     
     elif move_type == "make_peace":
-        reduction = float(config["political_actions"]["peace_war_exhaustion_reduction"])
+        reduction = actions.peace_war_exhaustion_reduction
         new_war_exhaustion = max(0, war_exhaustion - reduction)
-        cursor.execute("""
-            UPDATE countries SET at_war = 0, war_exhaustion = ? WHERE code = ?
-        """, (new_war_exhaustion, country))
+        changes = {"at_war": 0, "war_exhaustion": new_war_exhaustion}
         msg = f"☮ {country} made peace (war exhaustion reduced by {reduction})"
     
     elif move_type == "anti_corruption":
-        reduction_per_unit = float(config["political_actions"]["anti_corruption_reduction_per_unit"])
+        reduction_per_unit = actions.anti_corruption_reduction_per_unit
         total_reduction = min(amt * reduction_per_unit, corruption)  
         new_corruption = max(0, corruption - total_reduction)
-        cursor.execute("UPDATE countries SET corruption = ? WHERE code = ?", (new_corruption, country))
-        msg = f"🔍 {country} reduced corruption by {total_reduction:.3f} (cost: {move['__cost']})"
+        changes = {"corruption": new_corruption}
+        msg = f"🔍 {country} reduced corruption by {total_reduction:.3f} (cost: {move.cost})"
     
     elif move_type == "stabilize":
-        increase_per_unit = float(config["political_actions"]["stabilize_increase_per_unit"])
+        increase_per_unit = actions.stabilize_increase_per_unit
         total_increase = min(amt * increase_per_unit, 100 - stability)  
         new_stability = min(100, stability + total_increase)
-        cursor.execute("UPDATE countries SET stability = ? WHERE code = ?", (new_stability, country))
-        msg = f"📊 {country} increased stability by {total_increase} (cost: {move['__cost']})"
+        changes = {"stability": new_stability}
+        msg = f"📊 {country} increased stability by {total_increase} (cost: {move.cost})"
     
     elif move_type == "reduce_unrest":
-        reduction_per_unit = float(config["political_actions"]["reduce_unrest_reduction_per_unit"])
+        reduction_per_unit = actions.reduce_unrest_reduction_per_unit
         total_reduction = min(amt * reduction_per_unit, unrest)  
         new_unrest = max(0, unrest - total_reduction)
-        cursor.execute("UPDATE countries SET unrest = ? WHERE code = ?", (new_unrest, country))
-        msg = f"📉 {country} reduced unrest by {total_reduction} (cost: {move['__cost']})"
+        changes = {"unrest": new_unrest}
+        msg = f"📉 {country} reduced unrest by {total_reduction} (cost: {move.cost})"
     
     elif move_type == "propaganda_campaign":
-        stab_increase = amt * float(config["political_actions"]["propaganda_stability_increase"])
-        unrest_reduction = amt * float(config["political_actions"]["propaganda_unrest_reduction"])
+        stab_increase = amt * actions.propaganda_stability_increase
+        unrest_reduction = amt * actions.propaganda_unrest_reduction
         new_stability = min(100, stability + stab_increase)
         new_unrest = max(0, unrest - unrest_reduction)
-        cursor.execute("UPDATE countries SET stability = ?, unrest = ? WHERE code = ?", 
-                      (new_stability, new_unrest, country))
-        msg = f"📢 {country} propaganda: stability +{stab_increase}, unrest -{unrest_reduction} (cost: {move['__cost']})"
+        changes = {"stability": new_stability, "unrest": new_unrest}
+        msg = f"📢 {country} propaganda: stability +{stab_increase}, unrest -{unrest_reduction} (cost: {move.cost})"
     
     elif move_type == "war_effort":
-        reduction = amt * float(config["political_actions"]["war_effort_exhaustion_reduction"])
+        reduction = amt * actions.war_effort_exhaustion_reduction
         new_war_exhaustion = max(0, war_exhaustion - reduction)
-        cursor.execute("UPDATE countries SET war_exhaustion = ? WHERE code = ?", (new_war_exhaustion, country))
-        msg = f"💪 {country} war effort reduced exhaustion by {reduction} (cost: {move['__cost']})"
+        changes = {"war_exhaustion": new_war_exhaustion}
+        msg = f"💪 {country} war effort reduced exhaustion by {reduction} (cost: {move.cost})"
     
+    return changes, msg
+
+
+def execute_political_move(cursor, move):
+    """Execute a political action move."""
+    country = move.country_code
+    changes, msg = apply_political_move(get_country_politics(cursor, country), move)
+    assignments = ", ".join(f"{column} = ?" for column in changes)
+    cursor.execute(f"UPDATE countries SET {assignments} WHERE code = ?", (*changes.values(), country))
     return msg
 
 
+def describe_move(move, resource_name):
+    """Log message for an executed trade, build or recruit move."""
+    country = move.country_code
+
+    if move.move_type == "trade_resource_for_money":
+        trade = move.trade
+        return (
+            f"🤝 {trade['source_country']} sold {trade['amount']} {resource_name(trade['resource_id'])} to "
+            f"{trade['target_country']} for {trade['total_price']}"
+        )
+
+    if move.move_type == "trade_resource_for_resource":
+        trade = move.trade
+        return (
+            f"🔄 {trade['source_country']} traded {trade['amount']} {resource_name(trade['offered_resource_id'])} with "
+            f"{trade['target_country']} for {trade['amount']} {resource_name(trade['requested_resource_id'])}"
+        )
+
+    if move.move_type == "build":
+        return f"✅ {country} built {move.amount}x building {move.target_building_type_id} (cost {move.cost})"
+
+    if move.move_type == "recruit":
+        return f"✅ {country} recruited {move.amount}x unit {move.target_unit_type_id} (cost {move.cost})"
+
+
 def execute_move(cursor, move):
-    country = move["country_code"]
-    cost = move["__cost"]
+    country = move.country_code
+    cost = move.cost
 
-    if move["move_type"] == "trade_resource_for_money":
-        trade = move["__trade"]
+    if move.move_type == "trade_resource_for_money":
+        trade = move.trade
         cursor.execute("""
             UPDATE country_resources
             SET stockpile = stockpile - ?
@@ -524,14 +910,10 @@ def execute_move(cursor, move):
             UPDATE country_economy SET treasury = treasury - ?
             WHERE country_code = ?
         """, (trade["total_price"], trade["target_country"]))
-        resource_name = get_resource_name(cursor, trade["resource_id"])
-        return (
-            f"🤝 {trade['source_country']} sold {trade['amount']} {resource_name} to "
-            f"{trade['target_country']} for {trade['total_price']}"
-        )
+        return describe_move(move, partial(get_resource_name, cursor))
 
-    if move["move_type"] == "trade_resource_for_resource":
-        trade = move["__trade"]
+    if move.move_type == "trade_resource_for_resource":
+        trade = move.trade
         cursor.execute("""
             UPDATE country_resources
             SET stockpile = stockpile - ?
@@ -552,12 +934,7 @@ def execute_move(cursor, move):
             SET stockpile = stockpile + ?
             WHERE country_code = ? AND resource_id = ?
         """, (trade["amount"], trade["source_country"], trade["requested_resource_id"]))
-        offered_name = get_resource_name(cursor, trade["offered_resource_id"])
-        requested_name = get_resource_name(cursor, trade["requested_resource_id"])
-        return (
-            f"🔄 {trade['source_country']} traded {trade['amount']} {offered_name} with "
-            f"{trade['target_country']} for {trade['amount']} {requested_name}"
-        )
+        return describe_move(move, partial(get_resource_name, cursor))
 
     
     if cost > 0:
@@ -568,122 +945,399 @@ def execute_move(cursor, move):
         """, (cost, country))
 
     
-    political_moves = ["declare_war", "make_peace", "anti_corruption", 
-                      "stabilize", "reduce_unrest", "propaganda_campaign", "war_effort"]
-    
-    if move["move_type"] in political_moves:
+    if move.move_type in POLITICAL_MOVE_TYPES:
         return execute_political_move(cursor, move)
 
     
-    if move["move_type"] == "build":
-        apply_resource_costs(cursor, country, move.get("__resource_costs", {}))
+    if move.move_type == "build":
+        apply_resource_costs(cursor, country, move.resource_costs or {})
         cursor.execute("""
             INSERT INTO province_buildings (province_id, building_type_id, amount)
             VALUES (?, ?, ?)
             ON CONFLICT(province_id, building_type_id)
             DO UPDATE SET amount = amount + excluded.amount
-        """, (move["target_province_id"], move["target_building_type_id"], move["amount"]))
+        """, (move.target_province_id, move.target_building_type_id, move.amount))
 
-        return f"✅ {country} built {move['amount']}x building {move['target_building_type_id']} (cost {cost})"
+        return describe_move(move, partial(get_resource_name, cursor))
 
     
-    if move["move_type"] == "recruit":
-        apply_resource_costs(cursor, country, move.get("__resource_costs", {}))
+    if move.move_type == "recruit":
+        apply_resource_costs(cursor, country, move.resource_costs or {})
         cursor.execute("""
             INSERT INTO country_units (country_code, unit_type_id, amount)
             VALUES (?, ?, ?)
             ON CONFLICT(country_code, unit_type_id)
             DO UPDATE SET amount = amount + excluded.amount
-        """, (country, move["target_unit_type_id"], move["amount"]))
+        """, (country, move.target_unit_type_id, move.amount))
 
-        return f"✅ {country} recruited {move['amount']}x unit {move['target_unit_type_id']} (cost {cost})"
+        return describe_move(move, partial(get_resource_name, cursor))
 
 
+class BatchedMoveExecution:
+    """Apply approved moves to in-memory state and write the net result once.
 
+    Moves are applied in order exactly as execute_move would apply them, with
+    each value passed through its column affinity after every step so later
+    moves and log messages see what SQLite would have stored. write() then
+    saves the touched treasuries, stockpiles and political values, the
+    summed building and unit additions and the processed flags with a few
+    executemany calls.
+    """
 
-def process_moves():
-    conn = get_connection()
-    conn.execute("PRAGMA foreign_keys = ON;")
-    cursor = conn.cursor()
-    ensure_country_resource_rows(cursor)
-    conn.commit()
+    def __init__(self, cursor, context):
+        self.cursor = cursor
+        self.context = context
+        self.treasuries = get_country_treasuries(cursor)
+        cursor.execute("SELECT country_code, resource_id, stockpile FROM country_resources")
+        self.stockpiles = {(country, resource_id): stockpile for country, resource_id, stockpile in cursor.fetchall()}
+        cursor.execute("SELECT code, stability, unrest, corruption, at_war, war_exhaustion FROM countries")
+        self.politics = {
+            row[0]: dict(zip(POLITICAL_COLUMN_AFFINITY, row[1:]))
+            for row in cursor.fetchall()
+        }
+        self.changed_treasuries = {}
+        self.changed_stockpiles = {}
+        self.changed_politics = {}
+        self.buildings = {}
+        self.units = {}
+        self.processed = []
+
+    def adjust_treasury(self, country, delta):
+        if country in self.treasuries:
+            self.treasuries[country] = integer_affinity(self.treasuries[country] + delta)
+            self.changed_treasuries[country] = True
+
+    def adjust_stockpile(self, country, resource_id, delta):
+        key = (country, resource_id)
+        if key in self.stockpiles:
+            stockpile = self.stockpiles[key]
+            self.stockpiles[key] = None if stockpile is None else integer_affinity(stockpile + delta)
+            self.changed_stockpiles[key] = True
+
+    def execute(self, move):
+        country = move.country_code
+        cost = move.cost
+        self.processed.append(move.id)
+
+        if move.move_type == "trade_resource_for_money":
+            trade = move.trade
+            self.adjust_stockpile(trade["source_country"], trade["resource_id"], -trade["amount"])
+            self.adjust_stockpile(trade["target_country"], trade["resource_id"], trade["amount"])
+            self.adjust_treasury(trade["source_country"], trade["total_price"])
+            self.adjust_treasury(trade["target_country"], -trade["total_price"])
+            return describe_move(move, self.context.get_resource_name)
+
+        if move.move_type == "trade_resource_for_resource":
+            trade = move.trade
+            self.adjust_stockpile(trade["source_country"], trade["offered_resource_id"], -trade["amount"])
+            self.adjust_stockpile(trade["target_country"], trade["offered_resource_id"], trade["amount"])
+            self.adjust_stockpile(trade["target_country"], trade["requested_resource_id"], -trade["amount"])
+            self.adjust_stockpile(trade["source_country"], trade["requested_resource_id"], trade["amount"])
+            return describe_move(move, self.context.get_resource_name)
+
+        if cost > 0:
+            self.adjust_treasury(country, -cost)
+
+        if move.move_type in POLITICAL_MOVE_TYPES:
+            politics = self.politics[country]
+            changes, msg = apply_political_move(politics, move)
+            for column, value in changes.items():
+                politics[column] = POLITICAL_COLUMN_AFFINITY[column](value)
+            self.changed_politics[country] = True
+            return msg
+
+        for resource_id, required in (move.resource_costs or {}).items():
+            self.adjust_stockpile(country, resource_id, -required)
+
+        if move.move_type == "build":
+            key = (move.target_province_id, move.target_building_type_id)
+            self.buildings[key] = self.buildings.get(key, 0) + move.amount
+        elif move.move_type == "recruit":
+            key = (country, move.target_unit_type_id)
+            self.units[key] = self.units.get(key, 0) + move.amount
+        return describe_move(move, self.context.get_resource_name)
+
+    def write(self):
+        cursor = self.cursor
+        cursor.executemany(
+            "UPDATE country_economy SET treasury = ? WHERE country_code = ?",
+            [(self.treasuries[country], country) for country in self.changed_treasuries],
+        )
+        cursor.executemany(
+            "UPDATE country_resources SET stockpile = ? WHERE country_code = ? AND resource_id = ?",
+            [(self.stockpiles[key], *key) for key in self.changed_stockpiles],
+        )
+        cursor.executemany(
+            """
+            UPDATE countries
+            SET stability = ?, unrest = ?, corruption = ?, at_war = ?, war_exhaustion = ?
+            WHERE code = ?
+            """,
+            [(*self.politics[country].values(), country) for country in self.changed_politics],
+        )
+        # New rows are inserted in order of first appearance, like the per-move upserts.
+        cursor.executemany("""
+            INSERT INTO province_buildings (province_id, building_type_id, amount)
+            VALUES (?, ?, ?)
+            ON CONFLICT(province_id, building_type_id)
+            DO UPDATE SET amount = amount + excluded.amount
+        """, [(*key, amount) for key, amount in self.buildings.items()])
+        cursor.executemany("""
+            INSERT INTO country_units (country_code, unit_type_id, amount)
+            VALUES (?, ?, ?)
+            ON CONFLICT(country_code, unit_type_id)
+            DO UPDATE SET amount = amount + excluded.amount
+        """, [(*key, amount) for key, amount in self.units.items()])
+        cursor.executemany(
+            "UPDATE player_moves SET processed = 1 WHERE id = ?",
+            [(move_id,) for move_id in self.processed],
+        )
+        # The database now matches the in-memory state, so the same instance
+        # can carry on with the next chunk of moves.
+        self.changed_treasuries = {}
+        self.changed_stockpiles = {}
+        self.changed_politics = {}
+        self.buildings = {}
+        self.units = {}
+        self.processed = []
 
-    cursor.execute("""
-        SELECT id, turn, country_code, move_type,
-               target_province_id, target_building_type_id,
-               target_unit_type_id, target_country_code,
-               target_resource_id, trade_resource_id, price_per_unit, amount
-        FROM player_moves
-        WHERE processed = 0
-        ORDER BY turn, id
-    """)
 
-    raw_moves = cursor.fetchall()
-    if not raw_moves:
-        print("No moves to process.")
-        conn.close()
-        return
 
-    moves = [{
-        "id": m[0],
-        "turn": m[1],
-        "country_code": m[2],
-        "move_type": m[3],
-        "target_province_id": m[4],
-        "target_building_type_id": m[5],
-        "target_unit_type_id": m[6],
-        "target_country_code": m[7],
-        "target_resource_id": m[8],
-        "trade_resource_id": m[9],
-        "price_per_unit": m[10] or 0,
-        "amount": m[11] or 1
-    } for m in raw_moves]
 
-    print(f"\n=== PROCESSING {len(moves)} MOVES ===\n")
+MOVE_SELECT_SQL = """
+    SELECT id, turn, country_code, move_type,
+           target_province_id, target_building_type_id,
+           target_unit_type_id, target_country_code,
+           target_resource_id, trade_resource_id, price_per_unit, amount
+    FROM player_moves
+"""
 
-    
-    if BATCH_VALIDATE:
-        approved_moves, rejected_moves = validate_moves(cursor, moves)
+
+def fetch_move_chunk(cursor, after, size):
+    """Next `size` unprocessed moves after the (turn, id) key `after`."""
+    if after is None:
+        cursor.execute(f"{MOVE_SELECT_SQL} WHERE processed = 0 ORDER BY turn, id LIMIT ?", (size,))
+    else:
+        cursor.execute(f"""
+            {MOVE_SELECT_SQL}
+            WHERE processed = 0 AND (turn, id) > (?, ?)
+            ORDER BY turn, id
+            LIMIT ?
+        """, (*after, size))
+    return [Move(*row) for row in cursor.fetchall()]
+
+
+def validate_move_batch(cursor, moves, state, modifier_index, context, key_range=None):
+    """Run pre-validation and the configured validation mode over a list of moves."""
+    static_rejections = []
+    if PREVALIDATE:
+        moves, static_rejections = prevalidate_moves(cursor, moves, key_range)
+        log(f"\nPre-validation rejected {len(static_rejections)} moves\n")
+    if BATCH_VALIDATE and VALIDATION_WORKERS > 1:
+        approved_moves, rejected_moves = validate_moves_parallel(
+            cursor, moves, state, modifier_index, context, VALIDATION_WORKERS
+        )
+        rejected_moves = static_rejections + rejected_moves
+        log(f"\nApproved {len(approved_moves)} moves, rejected {len(rejected_moves)} ({VALIDATION_WORKERS} workers)")
+    elif BATCH_VALIDATE:
+        approved_moves, rejected_moves = validate_moves(
+            cursor, moves, state=state, modifier_index=modifier_index, context=context
+        )
+        rejected_moves = static_rejections + rejected_moves
         log(f"\nApproved {len(approved_moves)} moves, rejected {len(rejected_moves)}")
     else:
-        state = get_move_state(cursor)
         approved_moves = []
-        rejected_moves = []
+        rejected_moves = static_rejections
         for move in moves:
-            approved, rejected = validate_moves(cursor, [move], state=state)
+            approved, rejected = validate_moves(
+                cursor, [move], state=state, modifier_index=modifier_index, context=context
+            )
             approved_moves.extend(approved)
             rejected_moves.extend(rejected)
         log(f"\nApproved {len(approved_moves)} moves (individual validation mode)")
+    return approved_moves, rejected_moves
 
-    try:
-        conn.execute("BEGIN TRANSACTION;")
 
-        
+def execute_move_batch(cursor, approved_moves, rejected_moves, execution=None):
+    """Apply approved moves and flag every move as processed; the caller commits."""
+    if execution is not None:
+        for move in approved_moves:
+            log(execution.execute(move))
+        execution.write()
+    else:
         for move in approved_moves:
             msg = execute_move(cursor, move)
             log(msg)
-            cursor.execute("UPDATE player_moves SET processed = 1 WHERE id = ?", (move["id"],))
+            cursor.execute("UPDATE player_moves SET processed = 1 WHERE id = ?", (move.id,))
+
+    cursor.executemany("""
+        UPDATE player_moves
+        SET processed = 1, error_message = ?
+        WHERE id = ?
+    """, [(error_msg, move_id) for move_id, error_msg in rejected_moves])
 
-        for move_id, error_msg in rejected_moves:
-            cursor.execute("""
-                UPDATE player_moves
-                SET processed = 1, error_message = ?
-                WHERE id = ?
-            """, (error_msg, move_id))
+
+def process_moves_streaming(conn, cursor, state, modifier_index, context, chunk_size):
+    """
+    Validate and execute moves in (turn, id) order, chunk_size moves at a time.
+
+    The validation state carries over between chunks, so the outcome is the
+    same as one big batch. Each chunk is committed on its own: after a crash,
+    running process_moves again resumes after the last committed chunk. The
+    resumed run validates against the committed state, so political checks
+    and unit caps see the effects of the chunks that already ran.
+    """
+    execution = BatchedMoveExecution(cursor, context) if BATCH_EXECUTE else None
+    executed = 0
+    rejected_count = 0
+    chunk_number = 0
+    after = None
+    while True:
+        moves = fetch_move_chunk(cursor, after, chunk_size)
+        if not moves:
+            break
+        chunk_number += 1
+        key_range = ((moves[0].turn, moves[0].id), (moves[-1].turn, moves[-1].id))
+        after = key_range[1]
+
+        approved_moves, rejected_moves = validate_move_batch(
+            cursor, moves, state, modifier_index, context, key_range
+        )
+        try:
+            conn.execute("BEGIN TRANSACTION;")
+            execute_move_batch(cursor, approved_moves, rejected_moves, execution)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"❌ CHUNK {chunk_number} FAILED. ROLLBACK EXECUTED.")
+            print("ERROR:", e)
+            print(f"Committed so far: {executed} executed, {rejected_count} rejected. Run again to resume.")
+            return
+
+        executed += len(approved_moves)
+        rejected_count += len(rejected_moves)
+        log(f"💾 Chunk {chunk_number} committed ({len(moves)} moves)")
+
+    log(f"Unit caps computed: {len(state['unit_caps'])}, cache hits: {state['unit_cap_hits']}")
+    print(f"\n✅ EXECUTED {executed} MOVES | REJECTED {rejected_count} MOVES ({chunk_number} chunks)\n")
+
+
+def prepare_move_processing(conn):
+    cursor = conn.cursor()
+    ensure_country_resource_rows(cursor)
+    ensure_dirty_country_tracking(cursor)
+    ensure_player_moves_indexes(cursor)
+    conn.commit()
+    return cursor
+
+
+def process_move_batch(conn, cursor):
+    """
+    Validate and execute every pending move in one transaction.
+    Returns (approved, rejected), or None when there is nothing to process or
+    the transaction was rolled back.
+    """
+    cursor.execute(f"{MOVE_SELECT_SQL} WHERE processed = 0 ORDER BY turn, id")
+    moves = [Move(*row) for row in cursor]
+    if not moves:
+        print("No moves to process.")
+        return None
+
+    print(f"\n=== PROCESSING {len(moves)} MOVES ===\n")
+
+    
+    modifier_index = ModifierIndex.load(cursor)
+    context = MoveValidationContext.load(cursor)
+    state = get_move_state(cursor)
+    approved_moves, rejected_moves = validate_move_batch(cursor, moves, state, modifier_index, context)
+    log(f"Unit caps computed: {len(state['unit_caps'])}, cache hits: {state['unit_cap_hits']}")
+
+    try:
+        conn.execute("BEGIN TRANSACTION;")
+
+        execution = BatchedMoveExecution(cursor, context) if BATCH_EXECUTE else None
+        execute_move_batch(cursor, approved_moves, rejected_moves, execution)
 
         conn.commit()
         print(f"\n✅ EXECUTED {len(approved_moves)} MOVES | REJECTED {len(rejected_moves)} MOVES\n")
+        return approved_moves, rejected_moves
 
     except Exception as e:
         conn.rollback()
         print("❌ MOVE PROCESSING FAILED. ROLLBACK EXECUTED.")
         print("ERROR:", e)
+        return None
 
+
+def process_moves():
+    conn = get_connection()
+    conn.execute("PRAGMA foreign_keys = ON;")
+    try:
+        cursor = prepare_move_processing(conn)
+        if MOVE_CHUNK_SIZE <= 0:
+            process_move_batch(conn, cursor)
+            return
+
+        cursor.execute("SELECT COUNT(*) FROM player_moves WHERE processed = 0")
+        pending = cursor.fetchone()[0]
+        if not pending:
+            print("No moves to process.")
+            return
+
+        print(f"\n=== PROCESSING {pending} MOVES IN CHUNKS OF {MOVE_CHUNK_SIZE} ===\n")
+        process_moves_streaming(
+            conn,
+            cursor,
+            get_move_state(cursor),
+            ModifierIndex.load(cursor),
+            MoveValidationContext.load(cursor),
+            MOVE_CHUNK_SIZE,
+        )
+    finally:
+        conn.close()
+
+
+def simulate_moves(db_file=None):
+    """
+    Process the pending moves against an in-memory copy of the world.
+
+    Returns the approved moves, the (move id, message) rejections and the
+    post-move state in the get_move_state layout. Nothing is written to disk.
+    """
+    conn = copy_database_to_memory(db_file)
+    try:
+        cursor = prepare_move_processing(conn)
+        approved_moves, rejected_moves = process_move_batch(conn, cursor) or ([], [])
+        return {
+            "approved": approved_moves,
+            "rejected": rejected_moves,
+            "state": get_move_state(cursor),
+        }
     finally:
         conn.close()
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Validate and execute pending player moves.")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Process the moves on an in-memory copy of the database and report the outcome without saving it",
+    )
+    return parser.parse_args()
 
 
-if __name__ == "__main__":
+def main():
+    args = parse_args()
+    if args.dry_run:
+        print("🧪 DRY RUN: moves are processed on an in-memory copy of the database")
+        simulate_moves()
+        print("🧪 DRY RUN complete, the database was not modified.")
+        return
     process_moves()
+
+
+
+
+if __name__ == "__main__":
+    main()
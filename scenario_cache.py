@@ -0,0 +1,61 @@
+import glob
+import hashlib
+import os
+import sqlite3
+
+from settings import CONFIG_FILE
+
+CACHE_DIR = "scenario_cache"
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def scenario_digest(data_dir):
+    """
+    Hash of everything a freshly imported world depends on: the scenario CSVs,
+    config.ini and the scripts that build the database.
+    """
+    digest = hashlib.sha256()
+    paths = sorted(glob.glob(os.path.join(data_dir, "*.csv")))
+    paths.append(CONFIG_FILE)
+    paths.extend(sorted(glob.glob(os.path.join(SOURCE_DIR, "*.py"))))
+    for path in paths:
+        digest.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def template_path(data_dir):
+    return os.path.join(CACHE_DIR, f"{scenario_digest(data_dir)}.db")
+
+
+def copy_database(source_file, target_file):
+    """Copy one SQLite database over another with the backup API."""
+    source = sqlite3.connect(f"file:{source_file}?mode=ro", uri=True)
+    target = sqlite3.connect(target_file)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
+
+def restore_template(data_dir, db_file):
+    """Copy the cached template for data_dir over db_file. Returns False on a cache miss."""
+    path = template_path(data_dir)
+    if not os.path.exists(path):
+        return False
+    copy_database(path, db_file)
+    return True
+
+
+def save_template(data_dir, db_file):
+    """Store db_file as the template for data_dir; it must have just been imported from it."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = template_path(data_dir)
+    partial = f"{path}.tmp"
+    if os.path.exists(partial):
+        os.remove(partial)
+    copy_database(db_file, partial)
+    os.replace(partial, path)
+    return path
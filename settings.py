@@ -0,0 +1,183 @@
+"""
+Typed game settings.
+
+config.ini is parsed once per process into frozen dataclasses. Every script
+reads its tuning values from get_settings() instead of building its own
+ConfigParser, so hot paths like the economy tick and move validation never
+touch the file again.
+"""
+
+import configparser
+from dataclasses import dataclass
+from functools import lru_cache
+
+CONFIG_FILE = "config.ini"
+
+
+def parse_bounds(value):
+    low, high = map(float, value.split(','))
+    return low, high
+
+
+@dataclass(frozen=True)
+class EconomySettings:
+    base_tax_per_pop: float
+    admin_cost_per_province: float
+
+
+@dataclass(frozen=True)
+class ResourceSettings:
+    population_per_resource_unit: int
+    resource_cap_per_province: int
+
+
+@dataclass(frozen=True)
+class MilitarySettings:
+    pop_per_unit: int
+    base_unit_ratio: float
+    naval_cap_per_coastal_province: int
+    navy_upkeep_multiplier: float
+
+
+@dataclass(frozen=True)
+class MoveSettings:
+    logging: bool
+    batch_validation: bool
+    batch_execution: bool
+    prevalidation: bool
+    validation_workers: int
+    parallel_min_moves: int
+    chunk_size: int
+
+
+@dataclass(frozen=True)
+class PoliticsSettings:
+    unrest_high_threshold: float
+    base_economic_growth: float
+    growth_building_factor: float
+    growth_war_factor: float
+    economic_growth_stability_factor: float
+    economic_growth_unrest_factor: float
+    economic_growth_corruption_factor: float
+    war_exhaustion_per_turn: float
+    war_admin_cost_multiplier: float
+    war_military_upkeep_multiplier: float
+    corruption_war_increase: float
+    unrest_admin_multiplier: float
+    unrest_tax_penalty: float
+    unrest_population_loss_factor: float
+    unrest_stability_drain: float
+
+
+@dataclass(frozen=True)
+class PoliticalActionSettings:
+    anti_corruption_cost_per_unit: float
+    anti_corruption_reduction_per_unit: float
+    stabilize_cost_per_unit: float
+    stabilize_increase_per_unit: float
+    reduce_unrest_cost_per_unit: float
+    reduce_unrest_reduction_per_unit: float
+    propaganda_cost_per_unit: float
+    propaganda_stability_increase: float
+    propaganda_unrest_reduction: float
+    war_effort_cost_per_unit: float
+    war_effort_exhaustion_reduction: float
+    peace_war_exhaustion_reduction: float
+
+
+@dataclass(frozen=True)
+class PopulationSettings:
+    base_growth_rate: float
+    stability_growth_factor: float
+    unrest_growth_factor: float
+    corruption_growth_factor: float
+
+
+@dataclass(frozen=True)
+class FoodSettings:
+    food_per_1000_pop: float
+    food_resource_names: tuple
+    food_shortage_tax_penalty_max: float
+    food_shortage_unrest_increase_max: float
+
+
+@dataclass(frozen=True)
+class BoundsSettings:
+    tax_efficiency_min: float
+    stability_bounds: tuple
+    unrest_bounds: tuple
+    corruption_bounds: tuple
+    war_exhaustion_bounds: tuple
+
+
+@dataclass(frozen=True)
+class Settings:
+    economy: EconomySettings
+    resources: ResourceSettings
+    military: MilitarySettings
+    moves: MoveSettings
+    politics: PoliticsSettings
+    political_actions: PoliticalActionSettings
+    population: PopulationSettings
+    food: FoodSettings
+    bounds: BoundsSettings
+
+
+def read_float_section(config, section, settings_class):
+    """Build a settings section whose fields are all floats."""
+    return settings_class(**{
+        name: float(config[section][name])
+        for name in settings_class.__dataclass_fields__
+    })
+
+
+def parse_settings(config):
+    """Convert a loaded ConfigParser into a Settings object."""
+    return Settings(
+        economy=read_float_section(config, "economy", EconomySettings),
+        resources=ResourceSettings(
+            population_per_resource_unit=int(config["resources"].get("population_per_resource_unit", 10000)),
+            resource_cap_per_province=int(config["resources"]["resource_cap_per_province"]),
+        ),
+        military=MilitarySettings(
+            pop_per_unit=int(config["military"]["pop_per_unit"]),
+            base_unit_ratio=float(config["military"]["base_unit_ratio"]),
+            naval_cap_per_coastal_province=int(config.get("military", "naval_cap_per_coastal_province", fallback=10)),
+            navy_upkeep_multiplier=float(config.get("military", "navy_upkeep_multiplier", fallback=1.0)),
+        ),
+        moves=MoveSettings(
+            logging=config.getboolean("moves", "logging", fallback=True),
+            batch_validation=config.getboolean("moves", "batch_validation", fallback=True),
+            batch_execution=config.getboolean("moves", "batch_execution", fallback=True),
+            prevalidation=config.getboolean("moves", "prevalidation", fallback=True),
+            validation_workers=max(1, config.getint("moves", "validation_workers", fallback=1)),
+            parallel_min_moves=max(0, config.getint("moves", "parallel_min_moves", fallback=2000)),
+            chunk_size=max(0, config.getint("moves", "chunk_size", fallback=0)),
+        ),
+        politics=read_float_section(config, "politics", PoliticsSettings),
+        political_actions=read_float_section(config, "political_actions", PoliticalActionSettings),
+        population=read_float_section(config, "population", PopulationSettings),
+        food=FoodSettings(
+            food_per_1000_pop=float(config["food"]["food_per_1000_pop"]),
+            food_resource_names=tuple(
+                name.strip() for name in config["food"]["food_resource_names"].split(",") if name.strip()
+            ),
+            food_shortage_tax_penalty_max=float(config["food"]["food_shortage_tax_penalty_max"]),
+            food_shortage_unrest_increase_max=float(config["food"]["food_shortage_unrest_increase_max"]),
+        ),
+        bounds=BoundsSettings(
+            tax_efficiency_min=float(config["bounds"]["tax_efficiency_min"]),
+            stability_bounds=parse_bounds(config["bounds"].get("stability_bounds", "0,100")),
+            unrest_bounds=parse_bounds(config["bounds"].get("unrest_bounds", "0,100")),
+            corruption_bounds=parse_bounds(config["bounds"]["corruption_bounds"]),
+            war_exhaustion_bounds=parse_bounds(config["bounds"]["war_exhaustion_bounds"]),
+        ),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_settings(path=CONFIG_FILE):
+    """Parse config.ini once per process and return the shared Settings."""
+    config = configparser.ConfigParser()
+    config.read(path)
+    return parse_settings(config)
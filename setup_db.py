@@ -1,4 +1,10 @@
-from db_utils import ensure_event_log_table, get_connection
+from db_utils import (
+    ensure_dirty_country_tracking,
+    ensure_event_log_table,
+    ensure_import_sources_table,
+    ensure_player_moves_indexes,
+    get_connection,
+)
 
 conn = get_connection()
 cursor = conn.cursor()
@@ -258,6 +264,7 @@ CREATE TABLE IF NOT EXISTS player_moves (
     FOREIGN KEY (trade_resource_id) REFERENCES resources(id)
 );
 """)
+ensure_player_moves_indexes(cursor)
 print("Player moves table created successfully.")
 
 
@@ -266,6 +273,16 @@ ensure_event_log_table(cursor)
 print("Event log table created successfully.")
 
 
+print("Creating import sources table...")
+ensure_import_sources_table(cursor)
+print("Import sources table created successfully.")
+
+
+print("Creating dirty country tracking...")
+ensure_dirty_country_tracking(cursor)
+print("Dirty country tracking created successfully.")
+
+
 cursor.execute("PRAGMA table_info(player_moves)")
 player_move_columns = {row[1] for row in cursor.fetchall()}
 
@@ -0,0 +1,957 @@
+"""
+Set-based economy tick engine.
+
+Loads every table the tick needs with a handful of grouped SELECTs, computes
+all countries in memory and writes the results back with executemany in a
+single transaction. Results match economy_tick.economy_tick() exactly.
+"""
+
+import csv
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+from db_utils import get_connection, integer_affinity, real_affinity
+from economy_kernel import build_columns, calculate_economy_kernel, load_kernel_parameters, require_numpy
+from economy_tick import (
+    BASE_TAX_PER_POP,
+    BASE_UNIT_RATIO,
+    FOOD_PER_1000_POP,
+    FOOD_RESOURCE_NAMES,
+    FOOD_SHORTAGE_TAX_PENALTY_MAX,
+    FOOD_SHORTAGE_UNREST_INCREASE_MAX,
+    POP_PER_UNIT,
+    RESOURCE_CAP_PER_PROVINCE,
+    OutputModifierLookup,
+    calculate_political_modifiers_from_values,
+    calculate_population_growth,
+    distribute_population_change,
+    ensure_country_resource_rows,
+    get_province_resource_output,
+    get_resource_ids_by_name,
+    validate_political_data,
+    validate_schema,
+    write_province_populations,
+)
+from modifier_index import ModifierIndex
+from settings import get_settings
+
+settings = get_settings()
+
+ADDITIVE_RESOURCE_EFFECTS = {
+    "livestock": "prod_livestock",
+    "grain": "prod_grain",
+    "slaves": "prod_slaves",
+    "base_metals": "prod_base_metals",
+    "iron": "prod_iron",
+    "stone": "prod_stone",
+    "wood": "prod_wood",
+    "cloth": "prod_cloth",
+    "wine": "prod_wine",
+    "honey": "prod_honey",
+    "olives": "prod_olives",
+}
+
+# Province rows are kept as lists indexed by these positions.
+PROVINCE_ID = 0
+PROVINCE_POPULATION = 1
+PROVINCE_RESOURCE_ID = 2
+PROVINCE_CULTURE = 3
+PROVINCE_RELIGION = 4
+PROVINCE_IS_NAVAL = 5
+
+
+def load_reference_data(cursor):
+    """Load the world-wide lookups shared by every country."""
+    resource_names = {rid: name for rid, name in cursor.execute("SELECT id, name FROM resources").fetchall()}
+    resource_ids = {name: rid for rid, name in resource_names.items()}
+
+    return {
+        "resource_names": resource_names,
+        "additive_resource_ids": {
+            name: resource_ids[name]
+            for name in ADDITIVE_RESOURCE_EFFECTS
+            if name in resource_ids
+        },
+        "food_resource_ids": get_resource_ids_by_name(cursor, FOOD_RESOURCE_NAMES),
+        "modifier_index": ModifierIndex.load(cursor),
+        "output_modifiers": OutputModifierLookup.load(cursor),
+        "naval_cap_per_coastal_province": settings.military.naval_cap_per_coastal_province,
+        "stability_bounds": settings.bounds.stability_bounds,
+        "unrest_bounds": settings.bounds.unrest_bounds,
+        "corruption_bounds": settings.bounds.corruption_bounds,
+        "war_exhaustion_bounds": settings.bounds.war_exhaustion_bounds,
+    }
+
+
+def load_world_state(cursor):
+    """Load every country and the rows the tick reads for it into memory."""
+    countries = {}
+    for code, culture, religion, stability, unrest, corruption, at_war, war_exhaustion in cursor.execute("""
+        SELECT code, culture, religion, stability, unrest, corruption, at_war, war_exhaustion
+        FROM countries
+    """).fetchall():
+        countries[code] = {
+            "code": code,
+            "culture": culture,
+            "religion": religion,
+            "stability": stability,
+            "unrest": unrest,
+            "corruption": corruption,
+            "at_war": at_war,
+            "war_exhaustion": war_exhaustion,
+            "treasury": None,
+            "tax_rate": None,
+            "total_population": None,
+            "provinces": [],
+            "building_income": 0,
+            "building_upkeep": 0,
+            "units": {"land": (0, 0), "naval": (0, 0)},
+            "stockpiles": {},
+        }
+
+    for code, treasury, tax_rate, total_population in cursor.execute(
+        "SELECT country_code, treasury, tax_rate, total_population FROM country_economy"
+    ).fetchall():
+        if code in countries:
+            countries[code]["treasury"] = treasury
+            countries[code]["tax_rate"] = tax_rate
+            countries[code]["total_population"] = total_population
+
+    # Provinces are kept in id order so float sums accumulate in the same
+    # order as the per-country queries.
+    for row in cursor.execute("""
+        SELECT owner_country_code, id, population, resource_id, culture, religion, is_naval
+        FROM provinces
+        WHERE owner_country_code IS NOT NULL
+        ORDER BY id
+    """).fetchall():
+        if row[0] in countries:
+            countries[row[0]]["provinces"].append(list(row[1:]))
+
+    for code, income, upkeep in cursor.execute("""
+        SELECT p.owner_country_code,
+               COALESCE(SUM(bt.base_tax_income * pb.amount), 0),
+               COALESCE(SUM(bt.base_upkeep * pb.amount), 0)
+        FROM province_buildings pb
+        JOIN building_types bt ON pb.building_type_id = bt.id
+        JOIN provinces p ON pb.province_id = p.id
+        GROUP BY p.owner_country_code
+    """).fetchall():
+        if code in countries:
+            countries[code]["building_income"] = income or 0
+            countries[code]["building_upkeep"] = upkeep or 0
+
+    for code, category, amount, upkeep in cursor.execute("""
+        SELECT cu.country_code, ut.unit_category,
+               COALESCE(SUM(cu.amount), 0),
+               COALESCE(SUM(cu.amount * ut.upkeep_cost), 0)
+        FROM country_units cu
+        JOIN unit_types ut ON cu.unit_type_id = ut.id
+        WHERE ut.unit_category IN ('land', 'naval')
+        GROUP BY cu.country_code, ut.unit_category
+    """).fetchall():
+        if code in countries:
+            countries[code]["units"][category] = (amount or 0, upkeep or 0)
+
+    for code, resource_id, stockpile in cursor.execute(
+        "SELECT country_code, resource_id, stockpile FROM country_resources"
+    ).fetchall():
+        if code in countries:
+            countries[code]["stockpiles"][resource_id] = stockpile
+
+    country_order = [row[0] for row in cursor.execute("SELECT code FROM countries").fetchall()]
+    return {
+        "order": country_order,
+        "countries": countries,
+        "reference": load_reference_data(cursor),
+    }
+
+
+def get_country_modifier_value(country, reference, key):
+    return reference["modifier_index"].country_modifier(country["code"], key)
+
+
+def get_building_effect_value(country, reference, key):
+    return reference["modifier_index"].building_total(country["code"], key)
+
+
+def get_building_country_modifier_value(country, reference, key):
+    return reference["modifier_index"].building_country_modifier(country["code"], key)
+
+
+def get_additive_modifier_value(country, reference, key):
+    return reference["modifier_index"].additive_modifier(country["code"], key)
+
+
+def get_land_unit_cap_value(country, reference, population):
+    unit_limit_mod = get_country_modifier_value(country, reference, "military_unit_limit_mult")
+    unit_limit_mod *= get_building_country_modifier_value(country, reference, "military_unit_limit_mult")
+    base_cap = int((population * BASE_UNIT_RATIO * unit_limit_mod) / POP_PER_UNIT + 5)
+    bonus_cap = int(get_additive_modifier_value(country, reference, "land_unit_cap_bonus"))
+    return base_cap + bonus_cap
+
+
+def get_navy_unit_cap_value(country, reference):
+    coastal_count = sum(1 for province in country["provinces"] if province[PROVINCE_IS_NAVAL] == 1)
+    bonus_cap = int(get_additive_modifier_value(country, reference, "navy_unit_cap_bonus"))
+    return (coastal_count * reference["naval_cap_per_coastal_province"]) + bonus_cap
+
+
+def calculate_country_inputs(country, reference):
+    """Run the per-province part of the tick: tax base, production, stockpiles and food."""
+    provinces = country["provinces"]
+    stockpiles = dict(country["stockpiles"])
+
+    population = sum(province[PROVINCE_POPULATION] for province in provinces)
+    province_count = len(provinces)
+
+    production = {}
+    base_tax = 0.0
+    owner_culture = country["culture"]
+    owner_religion = country["religion"]
+    output_modifier = reference["output_modifiers"].modifier
+    for province in provinces:
+        modifier = output_modifier(
+            province[PROVINCE_CULTURE],
+            province[PROVINCE_RELIGION],
+            owner_culture,
+            owner_religion,
+        )
+        province_population = province[PROVINCE_POPULATION]
+        base_tax += province_population * BASE_TAX_PER_POP * modifier
+
+        resource_id = province[PROVINCE_RESOURCE_ID]
+        if resource_id is None:
+            continue
+        production[resource_id] = (
+            production.get(resource_id, 0) + get_province_resource_output(province_population, modifier)
+        )
+
+    for resource_name, modifier_key in ADDITIVE_RESOURCE_EFFECTS.items():
+        bonus_amount = get_building_effect_value(country, reference, modifier_key)
+        resource_id = reference["additive_resource_ids"].get(resource_name)
+        if resource_id and bonus_amount > 0:
+            production[resource_id] = production.get(resource_id, 0) + int(bonus_amount)
+
+    resource_cap = province_count * RESOURCE_CAP_PER_PROVINCE
+    resource_cap += int(get_additive_modifier_value(country, reference, "resource_cap_bonus"))
+
+    current_total = sum(stockpile for stockpile in stockpiles.values() if stockpile is not None)
+    remaining_capacity = max(0, resource_cap - current_total)
+    actually_added = {}
+    for resource_id, amount in sorted(production.items()):
+        if remaining_capacity <= 0:
+            actually_added[resource_id] = 0
+            continue
+        add_amount = min(amount, remaining_capacity)
+        if stockpiles.get(resource_id) is not None:
+            stockpiles[resource_id] += add_amount
+        actually_added[resource_id] = add_amount
+        remaining_capacity -= add_amount
+
+    food_result = consume_food_from_stockpiles(stockpiles, population, reference["food_resource_ids"])
+
+    return {
+        "population": population,
+        "province_count": province_count,
+        "base_tax": base_tax,
+        "production": production,
+        "actually_added": actually_added,
+        "resource_cap": resource_cap,
+        "stockpiles": stockpiles,
+        "food_result": food_result,
+    }
+
+
+def calculate_country_tick(country, reference):
+    """Compute one country's tick from in-memory state without touching the database."""
+    inputs = calculate_country_inputs(country, reference)
+    treasury = country["treasury"]
+    tax_rate = country["tax_rate"]
+    population = inputs["population"]
+    province_count = inputs["province_count"]
+
+    political_mods = calculate_political_modifiers_from_values(
+        country["stability"],
+        country["unrest"],
+        country["corruption"],
+        country["at_war"],
+        country["war_exhaustion"],
+    )
+    pop_growth, _pop_growth_rate = calculate_population_growth(
+        population,
+        political_mods['stability'],
+        political_mods['unrest'],
+        political_mods['corruption']
+    )
+    political_mods['population_change'] += pop_growth
+
+    food_shortage_ratio = inputs["food_result"]["shortage_ratio"]
+    food_tax_multiplier = max(0.0, 1.0 - (food_shortage_ratio * FOOD_SHORTAGE_TAX_PENALTY_MAX))
+    food_unrest_increase = food_shortage_ratio * FOOD_SHORTAGE_UNREST_INCREASE_MAX
+    political_mods['unrest_change'] += food_unrest_increase
+
+    tax_eff = get_country_modifier_value(country, reference, "tax_efficiency")
+    tax_eff *= get_building_country_modifier_value(country, reference, "tax_efficiency")
+    tax_eff *= political_mods['tax_efficiency_mod']
+
+    admin_mod = get_country_modifier_value(country, reference, "admin_cost_modifier")
+    admin_mod *= get_building_country_modifier_value(country, reference, "admin_cost_modifier")
+
+    admin_eff = get_country_modifier_value(country, reference, "admin_efficiency")
+    admin_eff *= get_building_country_modifier_value(country, reference, "admin_efficiency")
+    admin_mod /= max(0.0001, admin_eff)
+    admin_mod *= political_mods['admin_cost_mod']
+
+    upkeep_mod = get_country_modifier_value(country, reference, "military_upkeep_modifier")
+    upkeep_mod *= political_mods['military_upkeep_mod']
+
+    tax_income = inputs["base_tax"] * tax_rate * tax_eff
+    tax_income_after_corruption = tax_income * (1 - political_mods['corruption'] * 0.5)
+    tax_income_after_corruption *= food_tax_multiplier
+
+    administration_cost = province_count * settings.economy.admin_cost_per_province * admin_mod
+
+    land_upkeep = country["units"]["land"][1]
+    navy_upkeep_raw = country["units"]["naval"][1]
+    land_military_upkeep = land_upkeep * upkeep_mod
+    navy_upkeep_mod = get_country_modifier_value(country, reference, "navy_upkeep_modifier")
+    navy_upkeep_mod *= political_mods['military_upkeep_mod']
+    navy_military_upkeep = navy_upkeep_raw * navy_upkeep_mod
+    military_upkeep = land_military_upkeep + navy_military_upkeep
+
+    building_income_raw = country["building_income"]
+    building_upkeep = country["building_upkeep"]
+    building_income_mult = get_country_modifier_value(country, reference, "production_efficiency")
+    building_income_mult *= get_building_country_modifier_value(country, reference, "production_efficiency")
+    building_income = building_income_raw * building_income_mult
+
+    base_growth = settings.politics.base_economic_growth
+    growth_stability = (political_mods['stability'] - 50) * settings.politics.economic_growth_stability_factor
+    growth_unrest = -political_mods['unrest'] * settings.politics.economic_growth_unrest_factor
+    growth_corruption = -political_mods['corruption'] * settings.politics.economic_growth_corruption_factor
+    growth_war = settings.politics.growth_war_factor if political_mods['at_war'] else 0
+    growth_buildings = building_income_raw * settings.politics.growth_building_factor
+    growth_modifier_bonus = get_additive_modifier_value(country, reference, "economic_growth")
+    political_mods['stability_change'] += get_additive_modifier_value(country, reference, "stability_growth")
+    political_mods['unrest_change'] -= get_additive_modifier_value(country, reference, "unrest_reduction")
+
+    total_growth_rate = (
+        base_growth + growth_stability + growth_unrest + growth_corruption +
+        growth_war + growth_buildings + growth_modifier_bonus
+    )
+    total_growth_rate = max(0.0, total_growth_rate)
+
+    productive_income_base = max(0, tax_income_after_corruption + building_income)
+    growth_amount = int(productive_income_base * total_growth_rate)
+
+    total_income = int(tax_income_after_corruption + building_income + growth_amount)
+    total_expenses = int(administration_cost + military_upkeep + building_upkeep)
+    new_treasury = treasury + total_income - total_expenses
+
+    stability_min, stability_max = reference["stability_bounds"]
+    unrest_min, unrest_max = reference["unrest_bounds"]
+    corr_min, corr_max = reference["corruption_bounds"]
+    war_min, war_max = reference["war_exhaustion_bounds"]
+
+    return build_country_result(country, inputs, {
+        "new_treasury": new_treasury,
+        "tax_income": tax_income,
+        "tax_income_after_corruption": tax_income_after_corruption,
+        "building_income": building_income,
+        "total_income": total_income,
+        "administration_cost": administration_cost,
+        "military_upkeep": military_upkeep,
+        "land_military_upkeep": land_military_upkeep,
+        "navy_military_upkeep": navy_military_upkeep,
+        "total_expenses": total_expenses,
+        "total_growth_rate": total_growth_rate,
+        "growth_amount": growth_amount,
+        "political_mods": political_mods,
+        "new_stability": max(stability_min, min(stability_max, political_mods['stability'] + political_mods['stability_change'])),
+        "new_unrest": max(unrest_min, min(unrest_max, political_mods['unrest'] + political_mods['unrest_change'])),
+        "new_corruption": max(corr_min, min(corr_max, political_mods['corruption'] + political_mods['corruption_change'])),
+        "new_war_exhaustion": max(war_min, min(war_max, political_mods['war_exhaustion'] + political_mods['war_exhaustion_change'])),
+        "tax_eff": tax_eff,
+        "food_tax_multiplier": food_tax_multiplier,
+        "food_unrest_increase": food_unrest_increase,
+    })
+
+
+def build_country_result(country, inputs, values):
+    """Combine the per-province inputs and the computed economy values into one result."""
+    provinces = country["provinces"]
+    population_change = values["political_mods"]['population_change']
+    new_populations = distribute_population_change(
+        [province[PROVINCE_POPULATION] for province in provinces],
+        population_change,
+    )
+
+    result = {
+        "code": country["code"],
+        "treasury": country["treasury"],
+        "population": inputs["population"],
+        "new_total_population": sum(new_populations),
+        "province_populations": [
+            (province[PROVINCE_ID], new_pop)
+            for province, new_pop in zip(provinces, new_populations)
+        ] if population_change != 0 else [],
+        "building_upkeep": country["building_upkeep"],
+        "production": inputs["production"],
+        "actually_added": inputs["actually_added"],
+        "resource_cap": inputs["resource_cap"],
+        "stockpiles": inputs["stockpiles"],
+        "food_result": inputs["food_result"],
+        "total_land_units": country["units"]["land"][0],
+        "total_navy_units": country["units"]["naval"][0],
+    }
+    result.update(values)
+    return result
+
+
+def consume_food_from_stockpiles(stockpiles, population, food_resource_ids):
+    """In-memory counterpart of economy_tick.consume_food_resources."""
+    raw_required_food = (population / 1000) * FOOD_PER_1000_POP
+    required_food = max(0, int(math.floor(raw_required_food + 0.5)))
+    if required_food == 0 or not food_resource_ids:
+        return {
+            "required": required_food,
+            "consumed": 0,
+            "shortage": required_food,
+            "shortage_ratio": 1.0 if required_food > 0 else 0.0,
+            "consumed_by_resource": {}
+        }
+
+    remaining_need = required_food
+    consumed_by_resource = {}
+    for resource_id in food_resource_ids:
+        stockpile = int(stockpiles.get(resource_id) or 0)
+        if remaining_need <= 0:
+            break
+        consumed = min(stockpile, remaining_need)
+        if consumed > 0:
+            stockpiles[resource_id] -= consumed
+            consumed_by_resource[resource_id] = consumed
+            remaining_need -= consumed
+
+    consumed_total = required_food - remaining_need
+    shortage = max(0, remaining_need)
+    shortage_ratio = (shortage / required_food) if required_food > 0 else 0.0
+
+    return {
+        "required": required_food,
+        "consumed": consumed_total,
+        "shortage": shortage,
+        "shortage_ratio": shortage_ratio,
+        "consumed_by_resource": consumed_by_resource
+    }
+
+
+def apply_country_tick(country, result):
+    """Fold a computed tick result back into the in-memory country state."""
+    country["treasury"] = result["new_treasury"]
+    country["stability"] = result["new_stability"]
+    country["unrest"] = result["new_unrest"]
+    country["corruption"] = result["new_corruption"]
+    country["war_exhaustion"] = result["new_war_exhaustion"]
+    country["stockpiles"] = result["stockpiles"]
+    for province, (_province_id, new_pop) in zip(country["provinces"], result["province_populations"]):
+        province[PROVINCE_POPULATION] = new_pop
+
+
+def write_world_tick(cursor, world, results):
+    """Persist computed tick results with one executemany per table."""
+    write_province_populations(cursor, [
+        (new_pop, province_id)
+        for result in results
+        for (province_id, new_pop), province in zip(
+            result["province_populations"],
+            world["countries"][result["code"]]["provinces"],
+        )
+        if new_pop != province[PROVINCE_POPULATION]
+    ])
+    write_country_results(cursor, results)
+    cursor.executemany("""
+        UPDATE country_resources
+        SET stockpile = ?
+        WHERE country_code = ? AND resource_id = ?
+    """, [
+        (stockpile, result["code"], resource_id)
+        for result in results
+        for resource_id, stockpile in result["stockpiles"].items()
+        if stockpile != world["countries"][result["code"]]["stockpiles"].get(resource_id)
+    ])
+
+
+def write_country_results(cursor, results):
+    """Write the country_economy and countries rows of a tick."""
+    cursor.executemany("""
+        UPDATE country_economy SET
+            treasury = ?,
+            tax_income = ?,
+            building_income = ?,
+            total_income = ?,
+            administration_cost = ?,
+            military_upkeep = ?,
+            building_upkeep = ?,
+            total_expenses = ?,
+            total_population = ?,
+            economic_growth = ?
+        WHERE country_code = ?
+    """, [
+        (
+            result["new_treasury"],
+            int(result["tax_income_after_corruption"]),
+            int(result["building_income"]),
+            result["total_income"],
+            int(result["administration_cost"]),
+            int(result["military_upkeep"]),
+            int(result["building_upkeep"]),
+            result["total_expenses"],
+            result["new_total_population"],
+            result["total_growth_rate"],
+            result["code"],
+        )
+        for result in results
+    ])
+    cursor.executemany("""
+        UPDATE countries SET
+            stability = ?,
+            unrest = ?,
+            corruption = ?,
+            war_exhaustion = ?
+        WHERE code = ?
+    """, [
+        (
+            result["new_stability"],
+            result["new_unrest"],
+            result["new_corruption"],
+            result["new_war_exhaustion"],
+            result["code"],
+        )
+        for result in results
+    ])
+
+
+def print_country_tick(country, reference, result):
+    """Print the same per-country debug block as economy_tick.economy_tick()."""
+    political_mods = result["political_mods"]
+    land_unit_limit = get_land_unit_cap_value(country, reference, result["new_total_population"])
+    navy_cap = get_navy_unit_cap_value(country, reference)
+    coastal_provinces = sum(1 for province in country["provinces"] if province[PROVINCE_IS_NAVAL] == 1)
+    total_stockpile = sum(
+        stockpile
+        for resource_id, stockpile in result["stockpiles"].items()
+        if resource_id in reference["resource_names"]
+    )
+    food_result = result["food_result"]
+
+    print(
+        f"\n=== {result['code']} DEBUG INFO ==="
+        f"\nPopulation: {result['population']:,} → {result['new_total_population']:,} (change: {political_mods['population_change']:+d})"
+        f"\nLand Units: {result['total_land_units']:,}/{land_unit_limit:,} (limit: {land_unit_limit:,})"
+        f"\nNavy Units: {result['total_navy_units']:,}/{navy_cap:,} (coastal: {coastal_provinces})"
+        f"\nTax Income: {int(result['tax_income']):,} (after corruption: {int(result['tax_income_after_corruption']):,})"
+        f"\nBuilding Income: {int(result['building_income']):,}"
+        f"\nTotal Income: {result['total_income']:,}"
+        f"\nAdministration Cost: {int(result['administration_cost']):,}"
+        f"\nLand Military Upkeep: {int(result['land_military_upkeep']):,}"
+        f"\nNavy Military Upkeep: {int(result['navy_military_upkeep']):,}"
+        f"\nBuilding Upkeep: {int(result['building_upkeep']):,}"
+        f"\nTotal Expenses: {result['total_expenses']:,}"
+        f"\nTreasury: {result['treasury']:,} → {result['new_treasury']:,}"
+        f"\nResource Cap: {result['resource_cap']:,} | Total Stockpile: {total_stockpile:,}"
+        f"\nResource Production:"
+    )
+    if result["production"]:
+        for resource_id, amount in sorted(result["production"].items()):
+            resource_name = reference["resource_names"].get(resource_id, f"ID_{resource_id}")
+            print(f"   +{result['actually_added'].get(resource_id, 0):,}/{amount:,} {resource_name}")
+    print(f"\nPolitical State:")
+    print(f"  Stability: {political_mods['stability']:.1f} → {result['new_stability']:.1f} (change: {political_mods['stability_change']:.2f})")
+    print(f"  Unrest: {political_mods['unrest']:.1f} → {result['new_unrest']:.1f} (change: {political_mods['unrest_change']:.2f})")
+    print(f"  Corruption: {political_mods['corruption']:.3f} → {result['new_corruption']:.3f} (change: {political_mods['corruption_change']:.3f})")
+    print(f"  War Exhaustion: {political_mods['war_exhaustion']:.1f} → {result['new_war_exhaustion']:.1f} (change: {political_mods['war_exhaustion_change']:.2f})")
+    print(f"  At War: {political_mods['at_war']}")
+    print(f"  Tax Efficiency: {result['tax_eff']:.3f} (political mod: {political_mods['tax_efficiency_mod']:.3f})")
+    print(f"  Food: consumed {food_result['consumed']:,}/{food_result['required']:,} | shortage {food_result['shortage']:,} | tax x{result['food_tax_multiplier']:.3f}")
+    print(f"  Food Unrest Increase: {result['food_unrest_increase']:.2f}")
+    print(f"  Population Change: {political_mods['population_change']:+d}")
+    print(f"  Economic Growth Rate: {result['total_growth_rate']:.3f}")
+    print(f"  Growth Amount: {result['growth_amount']:,}")
+    print("--------------------------------------------------")
+
+
+def build_kernel_row(country, reference, inputs):
+    """Flatten one country's state and modifier multipliers into a kernel row."""
+    admin_mod = get_country_modifier_value(country, reference, "admin_cost_modifier")
+    admin_mod *= get_building_country_modifier_value(country, reference, "admin_cost_modifier")
+    admin_eff = get_country_modifier_value(country, reference, "admin_efficiency")
+    admin_eff *= get_building_country_modifier_value(country, reference, "admin_efficiency")
+    admin_mod /= max(0.0001, admin_eff)
+
+    return {
+        "stability": country["stability"],
+        "unrest": country["unrest"],
+        "corruption": country["corruption"],
+        "war_exhaustion": country["war_exhaustion"],
+        "at_war": country["at_war"],
+        "treasury": country["treasury"],
+        "tax_rate": country["tax_rate"],
+        "population": inputs["population"],
+        "province_count": inputs["province_count"],
+        "base_tax": inputs["base_tax"],
+        "food_shortage_ratio": inputs["food_result"]["shortage_ratio"],
+        "tax_eff_mult": (
+            get_country_modifier_value(country, reference, "tax_efficiency")
+            * get_building_country_modifier_value(country, reference, "tax_efficiency")
+        ),
+        "admin_mod_mult": admin_mod,
+        "upkeep_mult": get_country_modifier_value(country, reference, "military_upkeep_modifier"),
+        "navy_upkeep_mult": get_country_modifier_value(country, reference, "navy_upkeep_modifier"),
+        "building_income_mult": (
+            get_country_modifier_value(country, reference, "production_efficiency")
+            * get_building_country_modifier_value(country, reference, "production_efficiency")
+        ),
+        "land_upkeep": country["units"]["land"][1],
+        "navy_upkeep": country["units"]["naval"][1],
+        "building_income_raw": country["building_income"],
+        "building_upkeep": country["building_upkeep"],
+        "growth_modifier_bonus": get_additive_modifier_value(country, reference, "economic_growth"),
+        "stability_growth": get_additive_modifier_value(country, reference, "stability_growth"),
+        "unrest_reduction": get_additive_modifier_value(country, reference, "unrest_reduction"),
+    }
+
+
+def calculate_world_tick_vectorized(world, codes):
+    """Compute the tick for the given countries with the NumPy kernel."""
+    require_numpy()
+    reference = world["reference"]
+    countries = [world["countries"][code] for code in codes]
+    inputs = [calculate_country_inputs(country, reference) for country in countries]
+    columns = build_columns([
+        build_kernel_row(country, reference, country_inputs)
+        for country, country_inputs in zip(countries, inputs)
+    ])
+    output = {
+        name: values.tolist()
+        for name, values in calculate_economy_kernel(columns, load_kernel_parameters(), reference).items()
+    }
+
+    results = []
+    for i, (country, country_inputs) in enumerate(zip(countries, inputs)):
+        political_mods = {
+            'tax_efficiency_mod': output["tax_efficiency_mod"][i],
+            'admin_cost_mod': output["admin_cost_mod"][i],
+            'military_upkeep_mod': output["military_upkeep_mod"][i],
+            'unrest_change': output["unrest_change"][i],
+            'stability_change': output["stability_change"][i],
+            'corruption_change': output["corruption_change"][i],
+            'war_exhaustion_change': output["war_exhaustion_change"][i],
+            'population_change': output["population_change"][i],
+            'stability': country["stability"],
+            'unrest': country["unrest"],
+            'corruption': country["corruption"],
+            'at_war': country["at_war"],
+            'war_exhaustion': country["war_exhaustion"],
+        }
+        results.append(build_country_result(country, country_inputs, {
+            "new_treasury": output["new_treasury"][i],
+            "tax_income": output["tax_income"][i],
+            "tax_income_after_corruption": output["tax_income_after_corruption"][i],
+            "building_income": output["building_income"][i],
+            "total_income": output["total_income"][i],
+            "administration_cost": output["administration_cost"][i],
+            "military_upkeep": output["military_upkeep"][i],
+            "land_military_upkeep": output["land_military_upkeep"][i],
+            "navy_military_upkeep": output["navy_military_upkeep"][i],
+            "total_expenses": output["total_expenses"][i],
+            "total_growth_rate": output["total_growth_rate"][i],
+            "growth_amount": output["growth_amount"][i],
+            "political_mods": political_mods,
+            "new_stability": output["new_stability"][i],
+            "new_unrest": output["new_unrest"][i],
+            "new_corruption": output["new_corruption"][i],
+            "new_war_exhaustion": output["new_war_exhaustion"][i],
+            "tax_eff": output["tax_eff"][i],
+            "food_tax_multiplier": output["food_tax_multiplier"][i],
+            "food_unrest_increase": output["food_unrest_increase"][i],
+        }))
+    return results
+
+
+def calculate_world_results(world, codes, kernel="python"):
+    """Compute the tick for the given countries in this process."""
+    if kernel == "numpy":
+        return calculate_world_tick_vectorized(world, codes)
+    return [calculate_country_tick(world["countries"][code], world["reference"]) for code in codes]
+
+
+worker_reference = None
+
+
+def init_tick_worker(reference):
+    """Pool initializer: keep the shared reference data in the worker process."""
+    global worker_reference
+    worker_reference = reference
+
+
+def calculate_country_chunk(countries, kernel):
+    """Pool task: compute the tick for a chunk of country snapshots."""
+    world = {
+        "countries": {country["code"]: country for country in countries},
+        "reference": worker_reference,
+    }
+    return calculate_world_results(world, [country["code"] for country in countries], kernel)
+
+
+def split_chunks(items, chunk_count):
+    size = max(1, math.ceil(len(items) / chunk_count))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def create_tick_pool(world, workers):
+    """Start a worker pool that already holds the world's reference data."""
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_tick_worker,
+        initargs=(world["reference"],),
+    )
+
+
+def calculate_world_results_parallel(world, codes, kernel, workers, executor=None):
+    """Fan the per-country computation out to a process pool.
+
+    Workers only see the in-memory snapshot; results come back in input order
+    so the single writer applies them exactly as the serial path would.
+    """
+    if executor is None:
+        with create_tick_pool(world, workers) as executor:
+            return calculate_world_results_parallel(world, codes, kernel, workers, executor)
+
+    # A few chunks per worker keeps the pool busy when countries differ in size.
+    chunks = split_chunks([world["countries"][code] for code in codes], workers * 4)
+    results = []
+    for chunk_results in executor.map(calculate_country_chunk, chunks, [kernel] * len(chunks)):
+        results.extend(chunk_results)
+    return results
+
+
+def calculate_world_tick(world, verbose=True, kernel="python", workers=1, executor=None):
+    """Compute every country's tick in one pass and return the results in tick order."""
+    reference = world["reference"]
+    codes = [code for code in world["order"] if world["countries"][code]["treasury"] is not None]
+    if workers > 1 and len(codes) > 1:
+        results = calculate_world_results_parallel(world, codes, kernel, workers, executor)
+    else:
+        results = calculate_world_results(world, codes, kernel)
+
+    if verbose:
+        results_by_code = {result["code"]: result for result in results}
+        for code in world["order"]:
+            if code not in results_by_code:
+                print(f"⚠ No economy row for {code}")
+                continue
+            print_country_tick(world["countries"][code], reference, results_by_code[code])
+    return results
+
+
+def world_economy_tick(verbose=True, kernel="python", workers=1):
+    conn = get_connection()
+    conn.execute("PRAGMA foreign_keys = ON;")
+    cursor = conn.cursor()
+
+    validate_schema(cursor)
+    if not validate_political_data(cursor):
+        conn.close()
+        return
+
+    cursor.execute("UPDATE country_resources SET stockpile = CAST(stockpile AS INTEGER)")
+    ensure_country_resource_rows(cursor)
+
+    world = load_world_state(cursor)
+
+    if verbose:
+        print("\n=== ECONOMY TICK START ===")
+    results = calculate_world_tick(world, verbose=verbose, kernel=kernel, workers=workers)
+    write_world_tick(cursor, world, results)
+
+    conn.commit()
+    conn.close()
+    print("\n✅ ECONOMY TICK COMPLETE\n")
+
+
+def cast_stockpile(value):
+    """CAST(stockpile AS INTEGER), as run at the start of every tick."""
+    if isinstance(value, float):
+        return int(value)
+    return value
+
+
+def store_country_tick(country, result):
+    """Apply a tick result the way a write and re-read through SQLite would.
+
+    Values pass through the column affinities of the tables they are written
+    to, and stockpiles get the CAST the next tick starts with, so the next
+    in-memory tick sees exactly what economy_tick() would load.
+    """
+    apply_country_tick(country, result)
+    country["treasury"] = integer_affinity(country["treasury"])
+    country["stability"] = integer_affinity(country["stability"])
+    country["unrest"] = integer_affinity(country["unrest"])
+    country["corruption"] = real_affinity(country["corruption"])
+    country["war_exhaustion"] = integer_affinity(country["war_exhaustion"])
+    for province in country["provinces"]:
+        province[PROVINCE_POPULATION] = integer_affinity(province[PROVINCE_POPULATION])
+    country["total_population"] = integer_affinity(result["new_total_population"])
+
+
+def out_of_bounds(value, low, high):
+    # NULL NOT BETWEEN low AND high is NULL, so the SQL check skips NULLs too.
+    return value is not None and not low <= value <= high
+
+
+def find_invalid_political_values(world):
+    """In-memory version of validate_political_data's bounds query."""
+    invalid = []
+    for code in world["order"]:
+        country = world["countries"][code]
+        if (
+            out_of_bounds(country["stability"], 0, 100)
+            or out_of_bounds(country["unrest"], 0, 100)
+            or out_of_bounds(country["corruption"], 0.0, 1.0)
+            or out_of_bounds(country["war_exhaustion"], 0, 100)
+        ):
+            invalid.append(country)
+    return invalid
+
+
+def snapshot_world(world):
+    """Per-country treasury, population, unrest and stability in balance_report's snapshot format."""
+    snapshot = {}
+    for code in sorted(world["countries"]):
+        country = world["countries"][code]
+        if country["treasury"] is None:
+            continue
+        snapshot[code] = {
+            "treasury": country["treasury"] or 0,
+            "population": country["total_population"] or 0,
+            "unrest": float(country["unrest"] or 0.0),
+            "stability": float(country["stability"] or 0.0),
+        }
+    return snapshot
+
+
+def write_world_state(cursor, initial_stockpiles, initial_populations, world, results):
+    """Persist the state reached after several in-memory ticks.
+
+    The economy rows hold the last tick's figures; provinces and stockpiles are
+    written wherever they differ from what was loaded.
+    """
+    write_province_populations(
+        cursor,
+        [
+            (province[PROVINCE_POPULATION], province[PROVINCE_ID])
+            for code in world["order"]
+            for province in world["countries"][code]["provinces"]
+            if province[PROVINCE_POPULATION] != initial_populations[province[PROVINCE_ID]]
+        ],
+    )
+    write_country_results(cursor, results)
+    cursor.executemany("""
+        UPDATE country_resources
+        SET stockpile = ?
+        WHERE country_code = ? AND resource_id = ?
+    """, [
+        (stockpile, code, resource_id)
+        for code in world["order"]
+        for resource_id, stockpile in world["countries"][code]["stockpiles"].items()
+        if stockpile != initial_stockpiles[code].get(resource_id)
+    ])
+
+
+def world_fast_forward(ticks, verbose=False, kernel="python", workers=1, history=False):
+    """Advance the world by several ticks in memory and persist only the final state.
+
+    Returns the list of per-tick snapshots (see snapshot_world) when history is
+    True, otherwise an empty list.
+    """
+    conn = get_connection()
+    conn.execute("PRAGMA foreign_keys = ON;")
+    cursor = conn.cursor()
+
+    validate_schema(cursor)
+    if not validate_political_data(cursor):
+        conn.close()
+        return []
+
+    cursor.execute("UPDATE country_resources SET stockpile = CAST(stockpile AS INTEGER)")
+    ensure_country_resource_rows(cursor)
+
+    world = load_world_state(cursor)
+    initial_stockpiles = {code: dict(country["stockpiles"]) for code, country in world["countries"].items()}
+    initial_populations = {
+        province[PROVINCE_ID]: province[PROVINCE_POPULATION]
+        for country in world["countries"].values()
+        for province in country["provinces"]
+    }
+
+    snapshots = []
+    results = []
+    completed = 0
+    executor = create_tick_pool(world, workers) if workers > 1 else None
+    try:
+        for tick_index in range(1, ticks + 1):
+            if tick_index > 1:
+                invalid = find_invalid_political_values(world)
+                if invalid:
+                    print("❌ Invalid political values found:")
+                    for country in invalid:
+                        print(
+                            f"  {country['code']}: stability={country['stability']}, unrest={country['unrest']}, "
+                            f"corruption={country['corruption']}, war_exhaustion={country['war_exhaustion']}"
+                        )
+                    print(f"⚠ Stopping after {completed} of {ticks} ticks")
+                    break
+                for country in world["countries"].values():
+                    country["stockpiles"] = {
+                        resource_id: cast_stockpile(stockpile)
+                        for resource_id, stockpile in country["stockpiles"].items()
+                    }
+
+            if verbose:
+                print(f"\n=== ECONOMY TICK {tick_index}/{ticks} START ===")
+            results = calculate_world_tick(world, verbose=verbose, kernel=kernel, workers=workers, executor=executor)
+            for result in results:
+                store_country_tick(world["countries"][result["code"]], result)
+            completed += 1
+            if history:
+                snapshots.append(snapshot_world(world))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if results:
+        write_world_state(cursor, initial_stockpiles, initial_populations, world, results)
+
+    conn.commit()
+    conn.close()
+    print(f"\n✅ FAST-FORWARD COMPLETE ({completed} ticks)\n")
+    return snapshots
+
+
+def write_history_csv(path, snapshots):
+    """Write world_fast_forward's per-tick snapshots as one CSV row per country and tick."""
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["tick", "country_code", "treasury", "population", "unrest", "stability"])
+        for tick_index, snapshot in enumerate(snapshots, start=1):
+            for code, values in snapshot.items():
+                writer.writerow([
+                    tick_index,
+                    code,
+                    values["treasury"],
+                    values["population"],
+                    values["unrest"],
+                    values["stability"],
+                ])